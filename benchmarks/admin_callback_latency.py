@@ -0,0 +1,73 @@
+"""Measure the admin-role check done by every admin-panel callback.
+
+Each admin-panel handler calls ``is_admin_user`` before doing any work. This
+compares the previous per-call ``SELECT`` against ``admins`` with the
+in-memory admin set, using a throwaway database so the real one is untouched.
+
+    python benchmarks/admin_callback_latency.py --admins 50 --callbacks 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import database  # noqa: E402
+from bot.utils import is_admin_user  # noqa: E402
+
+
+def legacy_is_admin(telegram_id: int) -> bool:
+    with sqlite3.connect(database.DB_PATH) as conn:
+        cursor = conn.execute(
+            "SELECT 1 FROM admins WHERE telegram_id = ? LIMIT 1", (telegram_id,)
+        )
+        return cursor.fetchone() is not None
+
+
+def measure(check, ids, repeat: int) -> list:
+    samples = []
+    for i in range(repeat):
+        telegram_id = ids[i % len(ids)]
+        start = time.perf_counter()
+        check(telegram_id)
+        samples.append((time.perf_counter() - start) * 1e6)
+    return samples
+
+
+def report(name: str, samples: list) -> None:
+    samples = sorted(samples)
+    p99 = samples[int(len(samples) * 0.99) - 1]
+    print(
+        f"{name:<12} mean {statistics.fmean(samples):8.2f}us  "
+        f"p50 {statistics.median(samples):8.2f}us  p99 {p99:8.2f}us"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--admins", type=int, default=50)
+    parser.add_argument("--callbacks", type=int, default=20000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database.DB_PATH = Path(tmp) / "bench.sqlite3"
+        database.init_db()
+        for telegram_id in range(1, args.admins + 1):
+            database.add_admin(telegram_id)
+        database.load_admins()
+
+        # Mix of admins and non-admins, as the main menu checks everyone.
+        ids = list(range(1, args.admins * 2 + 1))
+        report("sqlite", measure(legacy_is_admin, ids, args.callbacks))
+        report("in-memory", measure(is_admin_user, ids, args.callbacks))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Measure update throughput of the multi-process worker pool.
+
+Feeds synthetic updates from many users through ``bot.cluster.WorkerPool``
+into workers running a CPU-bound stand-in handler, for several worker
+counts, and checks that every user's updates were handled in the order
+they were dispatched.
+
+    python benchmarks/cluster_throughput.py --updates 4000 --users 200 --work 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bot.cluster import WorkerPool  # noqa: E402
+
+
+def fake_worker(index, inbox, results, work) -> None:
+    """Handle updates like a worker would: strictly one after another."""
+    while True:
+        data = inbox.get()
+        if data is None:
+            return
+        acc = 0
+        for n in range(work):
+            acc += n * n
+        message = data["message"]
+        results.put((index, message["from"]["id"], message["message_id"]))
+
+
+def make_update(update_id: int, user_id: int) -> dict:
+    return {
+        "update_id": update_id,
+        "message": {
+            "message_id": update_id,
+            "from": {"id": user_id, "is_bot": False, "first_name": "u"},
+            "chat": {"id": user_id, "type": "private"},
+            "date": 0,
+            "text": "hi",
+        },
+    }
+
+
+def run(workers: int, updates: int, users: int, work: int) -> tuple:
+    results = multiprocessing.get_context("spawn").Queue()
+    pool = WorkerPool(fake_worker, workers, args=(results, work))
+    pool.start()
+    start = time.perf_counter()
+    for n in range(updates):
+        pool.dispatch(make_update(n, 1000 + n % users))
+    handled = [results.get() for _ in range(updates)]
+    elapsed = time.perf_counter() - start
+    pool.stop()
+
+    last_seen: dict = {}
+    owner: dict = {}
+    for index, user_id, message_id in handled:
+        assert owner.setdefault(user_id, index) == index, "user split across workers"
+        assert message_id > last_seen.get(user_id, -1), "per-user order violated"
+        last_seen[user_id] = message_id
+    return updates / elapsed, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--updates", type=int, default=4000)
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--work", type=int, default=20000, help="loop iterations per update")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    args = parser.parse_args()
+
+    baseline = None
+    for workers in args.workers:
+        rate, elapsed = run(workers, args.updates, args.users, args.work)
+        baseline = baseline or rate
+        print(
+            f"workers {workers}: {rate:8.0f} updates/s  ({elapsed:.2f}s, "
+            f"x{rate / baseline:.2f})  per-user order ok"
+        )
+
+
+if __name__ == "__main__":
+    main()
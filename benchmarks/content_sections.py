@@ -0,0 +1,115 @@
+"""Check that the three catalogue sections behave and perform the same.
+
+Every section is served by the generic engine in ``database`` and
+``bot.plans``. This seeds identical catalogues for each section in a
+throwaway database, verifies the per-section wrappers return exactly what
+the generic calls return, and times the operations a user open and an admin
+save go through.
+
+    python benchmarks/content_sections.py --items 200 --files 8 --opens 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import database  # noqa: E402
+from bot.plans import build_delivery_plan, get_delivery_plan  # noqa: E402
+
+FILE_TYPES = ("video", "voice", "audio", "document", "photo", "video_note")
+
+# section -> (get item, get content) under their historical names
+WRAPPERS = {
+    "webinar": (database.get_webinar, database.get_webinar_content),
+    "drop_learning": (database.get_drop_learning, database.get_drop_learning_content),
+    "case_study": (database.get_case_study, database.get_case_study_content),
+}
+
+
+def timed_us(func, *args) -> float:
+    start = time.perf_counter()
+    func(*args)
+    return (time.perf_counter() - start) * 1e6
+
+
+def seed(section: str, items: int, files: int, rng: random.Random) -> list:
+    ids = []
+    for n in range(items):
+        item_id = database.create_section_item(
+            section, f"{section} {n}", "description " * 20, f"cover-{section}-{n}"
+        )
+        for order in range(files):
+            database.add_section_content(
+                section,
+                item_id,
+                f"file-{section}-{n}-{order}",
+                rng.choice(FILE_TYPES),
+                order,
+                caption=f"caption {order}" if order % 2 else None,
+                file_unique_id=f"unique-{section}-{n}-{order}",
+            )
+        ids.append(item_id)
+    return ids
+
+
+def check_parity(section: str, ids: list) -> None:
+    get_item, get_content = WRAPPERS[section]
+    for item_id in ids:
+        assert get_item(item_id) == database.get_section_item(section, item_id)
+        assert list(get_content(item_id)) == list(
+            database.get_section_content(section, item_id)
+        )
+
+
+def report(section: str, name: str, samples: list) -> None:
+    samples = sorted(samples)
+    p99 = samples[int(len(samples) * 0.99) - 1]
+    print(
+        f"  {section:<14} {name:<12} mean {statistics.fmean(samples):9.1f}us  "
+        f"p50 {statistics.median(samples):9.1f}us  p99 {p99:9.1f}us"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=200)
+    parser.add_argument("--files", type=int, default=8)
+    parser.add_argument("--opens", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database.DB_PATH = Path(tmp) / "bench.sqlite3"
+        database.init_db()
+        catalogue = {}
+        for section in database.CONTENT_SECTIONS:
+            # Same seed per section so every catalogue has the same shape
+            catalogue[section] = seed(section, args.items, args.files, random.Random(args.seed))
+            check_parity(section, catalogue[section])
+        print("parity: per-section wrappers match the generic engine")
+
+        for section, ids in catalogue.items():
+            rng = random.Random(args.seed)
+            picks = [rng.choice(ids) for _ in range(args.opens)]
+            report(section, "raw reads", [
+                timed_us(lambda i: list(database.get_section_content(section, i)), i)
+                for i in picks[: args.opens // 10]
+            ])
+            report(section, "plan build", [
+                timed_us(build_delivery_plan, section, i) for i in ids
+            ])
+            report(section, "plan cached", [
+                timed_us(get_delivery_plan, section, i) for i in picks
+            ])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Compare HyperLogLog unique-viewer estimates with exact COUNT(DISTINCT).
+
+Seeds a throwaway database with synthetic views, then reports the estimate
+error and the time taken by both approaches.
+
+    python benchmarks/hll_accuracy.py --users 200000 --views 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import database  # noqa: E402
+from hyperloglog import HyperLogLog  # noqa: E402
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, (time.perf_counter() - start) * 1000
+
+
+def exact_section_viewers(table: str) -> int:
+    with sqlite3.connect(database.DB_PATH) as conn:
+        return conn.execute(f"SELECT COUNT(DISTINCT user_id) FROM {table}").fetchone()[0]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=50000)
+    parser.add_argument("--views", type=int, default=200000)
+    parser.add_argument("--items", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    rng = random.Random(args.seed)
+
+    print("in-memory sketch:")
+    for n in (100, 10_000, args.users):
+        sketch = HyperLogLog()
+        _, add_ms = timed(sketch.update, range(n))
+        estimate, count_ms = timed(sketch.count)
+        print(
+            f"  n={n:<9} estimate={estimate:<9} error={abs(estimate - n) / n:6.2%} "
+            f"add={add_ms:8.1f}ms count={count_ms:6.2f}ms"
+        )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database.DB_PATH = Path(tmp) / "bench.sqlite3"
+        database.init_db()
+        now = int(time.time())
+        sections = list(database.VIEW_TABLES)
+        batch = []
+        for _ in range(args.views):
+            section = rng.choice(sections)
+            user_id = rng.randrange(args.users)
+            item_id = rng.randrange(args.items)
+            batch.append((user_id, section, item_id, "view", now - rng.randrange(30) * 86400))
+            if len(batch) >= 20000:
+                database.record_views_batch(
+                    {(sec, uid, iid) for uid, sec, iid, _, _ in batch}, batch
+                )
+                batch = []
+        if batch:
+            database.record_views_batch(
+                {(sec, uid, iid) for uid, sec, iid, _, _ in batch}, batch
+            )
+
+        print(f"database ({args.views} views, {args.users} users):")
+        for section, (table, _) in database.VIEW_TABLES.items():
+            exact, exact_ms = timed(exact_section_viewers, table)
+            estimate, hll_ms = timed(database.estimate_unique_viewers, section)
+            print(
+                f"  {section:<14} exact={exact:<8} ({exact_ms:7.1f}ms) "
+                f"hll={estimate:<8} ({hll_ms:6.1f}ms) error={abs(estimate - exact) / max(exact, 1):6.2%}"
+            )
+        week, week_ms = timed(
+            database.estimate_unique_viewers, None, None, now // 86400 - 6, now // 86400
+        )
+        print(f"  any section, last 7 days: hll={week} ({week_ms:.1f}ms)")
+
+
+if __name__ == "__main__":
+    main()
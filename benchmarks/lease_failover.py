@@ -0,0 +1,114 @@
+"""Kill leaders and watch the lease move to another process.
+
+Starts several processes competing for one lease through
+``bot.leader.LeaderElection`` on a throwaway database. Each process reports
+a tick while it believes it leads. The script repeatedly SIGKILLs the
+current holder, measures how long the lease stays orphaned, and checks that
+no two processes ever ticked as leader at the same time.
+
+    python benchmarks/lease_failover.py --processes 4 --kills 3 --ttl 2
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import signal
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import database  # noqa: E402
+from bot.leader import LeaderElection  # noqa: E402
+
+LEASE = "failover-test"
+
+
+def contender(db_path: str, ttl: float, ticks) -> None:
+    database.DB_PATH = Path(db_path)
+    election = LeaderElection(LEASE, ttl=ttl, margin=ttl / 4)
+
+    async def run() -> None:
+        while True:
+            await election.renew()
+            for _ in range(3):
+                if election.is_leader:
+                    ticks.put((election.owner, time.time()))
+                await asyncio.sleep(ttl / 18)
+
+    asyncio.run(run())
+
+
+def wait_for_owner(exclude: str, timeout: float) -> tuple:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        lease = database.get_lease(LEASE)
+        if lease and lease["owner"] != exclude and lease["expires_at"] > time.time():
+            return lease["owner"], time.monotonic()
+        time.sleep(0.01)
+    raise RuntimeError("no process took over the lease")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--processes", type=int, default=4)
+    parser.add_argument("--kills", type=int, default=3)
+    parser.add_argument("--ttl", type=float, default=2.0)
+    args = parser.parse_args()
+    if args.kills >= args.processes:
+        parser.error("--kills must leave at least one process alive")
+
+    context = multiprocessing.get_context("spawn")
+    ticks = context.Queue()
+    with tempfile.TemporaryDirectory() as tmp:
+        database.DB_PATH = Path(tmp) / "bench.sqlite3"
+        database.init_db()
+        processes = [
+            context.Process(target=contender, args=(str(database.DB_PATH), args.ttl, ticks))
+            for _ in range(args.processes)
+        ]
+        for process in processes:
+            process.start()
+
+        try:
+            owner, _ = wait_for_owner("", args.ttl * 5)
+            for round_no in range(1, args.kills + 1):
+                time.sleep(args.ttl)
+                pid = int(owner.split(":")[1])
+                os.kill(pid, signal.SIGKILL)
+                killed_at = time.monotonic()
+                new_owner, taken_at = wait_for_owner(owner, args.ttl * 5)
+                print(
+                    f"kill {round_no}: pid {pid} -> pid {new_owner.split(':')[1]} "
+                    f"after {taken_at - killed_at:.2f}s (ttl {args.ttl}s)"
+                )
+                owner = new_owner
+            time.sleep(args.ttl)
+        finally:
+            for process in processes:
+                if process.is_alive():
+                    process.kill()
+                process.join()
+
+    events = []
+    while not ticks.empty():
+        events.append(ticks.get())
+    events.sort(key=lambda event: event[1])
+    terms = []
+    for tick_owner, _ in events:
+        if not terms or terms[-1] != tick_owner:
+            terms.append(tick_owner)
+    # Killed leaders never come back, so any repeated owner means two
+    # processes believed they led at overlapping times
+    assert len(terms) == len(set(terms)), f"leadership flapped: {terms}"
+    assert len(terms) == args.kills + 1, f"expected {args.kills + 1} terms, got {terms}"
+    print(f"{len(events)} leader ticks across {len(terms)} terms, no overlap")
+
+
+if __name__ == "__main__":
+    main()
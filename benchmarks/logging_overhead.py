@@ -0,0 +1,96 @@
+"""Measure what logging costs the event loop per handled update.
+
+Simulates the log calls of one menu update (binding the correlation ids,
+the hot-path "menu selection" line and one regular INFO line) and times
+them on the calling thread for:
+
+* ``basicConfig``: the previous setup, a synchronous stream handler and an
+  f-string INFO line on every update;
+* ``queue``: ``bot.logs.configure_logging`` with the default sample rate;
+* ``queue, unsampled``: the same pipeline with every hot-path line kept.
+
+Output goes to a temporary file so terminal speed does not skew results.
+
+    python benchmarks/logging_overhead.py --updates 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bot import logs  # noqa: E402
+
+
+def old_update(n: int) -> None:
+    text = "وبینار ها"
+    logging.info(f"Handling menu selection: text='{text}', user_id={n}")
+    logging.info("Recorded view of %s %s by %s", "webinar", n % 50, n)
+
+
+def new_update(n: int) -> None:
+    logs.update_id_var.set(n)
+    logs.user_id_var.set(n)
+    logs.log_sampled(logging.INFO, "Handling menu selection: text=%r, user_id=%s", "وبینار ها", n)
+    logging.info("Recorded view of %s %s by %s", "webinar", n % 50, n)
+
+
+def measure(name: str, update, updates: int, drain) -> None:
+    samples = []
+    for n in range(updates):
+        started = time.perf_counter_ns()
+        update(n)
+        samples.append(time.perf_counter_ns() - started)
+    drain_started = time.perf_counter()
+    drain()
+    drained_ms = (time.perf_counter() - drain_started) * 1000
+    samples.sort()
+    print(
+        f"  {name:<20} mean {statistics.fmean(samples) / 1000:7.2f}us  "
+        f"p50 {samples[len(samples) // 2] / 1000:7.2f}us  "
+        f"p99 {samples[int(len(samples) * 0.99)] / 1000:7.2f}us  "
+        f"(writer drained {drained_ms:.0f} ms later)"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--updates", type=int, default=20000)
+    args = parser.parse_args()
+
+    print(f"caller-side logging cost per update ({args.updates} updates):")
+    with tempfile.TemporaryDirectory() as tmp:
+        stderr = sys.stderr
+        sys.stderr = open(Path(tmp) / "bench.log", "w", encoding="utf-8")
+        try:
+            logging.basicConfig(
+                format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+                level=logging.INFO,
+                force=True,
+            )
+            measure("basicConfig", old_update, args.updates, lambda: None)
+
+            for label, rate in (("queue", None), ("queue, unsampled", "1")):
+                if rate is None:
+                    os.environ.pop("LOG_SAMPLE_RATE", None)
+                else:
+                    os.environ["LOG_SAMPLE_RATE"] = rate
+                logs.configure_logging()
+                measure(label, new_update, args.updates, logs.shutdown_logging)
+        finally:
+            sys.stderr.close()
+            sys.stderr = stderr
+        size = (Path(tmp) / "bench.log").stat().st_size
+    print(f"  {size / 1024:.0f} KiB of log written in total")
+
+
+if __name__ == "__main__":
+    main()
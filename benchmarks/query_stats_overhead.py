@@ -0,0 +1,60 @@
+"""Measure what per-statement query statistics cost.
+
+Runs the same point lookup (connect, execute, fetchone, close, like
+``database.get_user``) against a temporary database through a plain
+``sqlite3`` connection and through ``database._connect``, alternating for
+a few rounds, and prints the best per-call time of both.
+
+    python benchmarks/query_stats_overhead.py --calls 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import database  # noqa: E402
+
+LOOKUP = "SELECT telegram_id, phone_number FROM users WHERE telegram_id = ?"
+
+
+def run(connect, calls: int) -> float:
+    started = time.perf_counter()
+    for n in range(calls):
+        with connect() as conn:
+            conn.execute(LOOKUP, (n % 1000,)).fetchone()
+        conn.close()
+    return (time.perf_counter() - started) / calls * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=20000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database.DB_PATH = Path(tmp) / "bench.sqlite3"
+        database.init_db()
+        with sqlite3.connect(database.DB_PATH) as conn:
+            conn.executemany(
+                "INSERT INTO users (telegram_id, phone_number) VALUES (?, ?)",
+                ((n, f"0912{n:07d}") for n in range(1000)),
+            )
+        plain = instrumented = float("inf")
+        for _ in range(args.rounds):
+            plain = min(plain, run(lambda: sqlite3.connect(database.DB_PATH), args.calls))
+            instrumented = min(instrumented, run(database._connect, args.calls))
+    print(f"point lookup, best of {args.rounds} rounds of {args.calls} calls:")
+    print(f"  plain sqlite3       {plain:8.1f} us/call")
+    print(f"  with query stats    {instrumented:8.1f} us/call  ({instrumented - plain:+.1f} us)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""Measure import time and time-to-first-update of the bot.
+
+Each measurement runs in a fresh interpreter. ``python -X importtime``
+gives the cumulative import cost of the bot modules; the second probe
+imports the bot, builds the application and routes one synthetic user
+menu update through the handler checks, like ``Application.process_update``
+does before calling a handler (a plain text update, because command
+matching needs the bot username from a live ``getMe``). ``--eager`` loads the admin console up
+front to show what the lazy import saves.
+
+    python benchmarks/startup_time.py --runs 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+WATCHED = ("telegram.ext", "database", "bot.handlers", "bot.admin.conversation", "bot.application")
+
+FIRST_UPDATE_PROBE = """
+import json, sys, time
+started = time.perf_counter()
+from telegram import Update
+from bot import create_application
+imported = time.perf_counter()
+application = create_application("123456:TEST-TOKEN")
+if {eager}:
+    for handlers in application.handlers.values():
+        for handler in handlers:
+            if hasattr(handler, "load"):
+                handler.load()
+built = time.perf_counter()
+update = Update.de_json({{
+    "update_id": 1,
+    "message": {{
+        "message_id": 1, "date": 0, "text": "وبینار ها",
+        "from": {{"id": 42, "is_bot": False, "first_name": "u"}},
+        "chat": {{"id": 42, "type": "private"}},
+    }},
+}}, application.bot)
+matched = None
+# Negative groups hold pre-dispatch stages that match every update
+for group, handlers in sorted(application.handlers.items()):
+    if group < 0:
+        continue
+    for handler in handlers:
+        check = handler.check_update(update)
+        if check is not None and check is not False:
+            matched = repr(handler)
+            break
+    if matched:
+        break
+routed = time.perf_counter()
+print(json.dumps({{
+    "import_ms": (imported - started) * 1000,
+    "build_ms": (built - imported) * 1000,
+    "route_ms": (routed - built) * 1000,
+    "total_ms": (routed - started) * 1000,
+    "admin_loaded": "bot.admin.conversation" in sys.modules,
+    "matched": matched,
+}}))
+"""
+
+
+def _env() -> dict:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(ROOT), env.get("PYTHONPATH")]))
+    return env
+
+
+def importtime() -> dict:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import bot.application"],
+        capture_output=True, text=True, env=_env(), cwd=ROOT, check=True,
+    )
+    cumulative = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative_us, name = line[len("import time:"):].split("|")
+        name = name.strip()
+        if name in WATCHED and cumulative_us.strip().isdigit():
+            cumulative[name] = int(cumulative_us) / 1000
+    return cumulative
+
+
+def first_update(eager: bool) -> dict:
+    proc = subprocess.run(
+        [sys.executable, "-c", FIRST_UPDATE_PROBE.format(eager=eager)],
+        capture_output=True, text=True, env=_env(), cwd=ROOT, check=True,
+    )
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--eager", action="store_true", help="also measure eager admin loading")
+    args = parser.parse_args()
+
+    samples = [importtime() for _ in range(args.runs)]
+    print("import time, median of cumulative ms (-X importtime):")
+    for name in WATCHED:
+        values = [sample[name] for sample in samples if name in sample]
+        shown = f"{statistics.median(values):8.1f}" if values else "     not imported"
+        print(f"  {name:<26}{shown}")
+
+    modes = [False, True] if args.eager else [False]
+    for eager in modes:
+        runs = [first_update(eager) for _ in range(args.runs)]
+        label = "eager admin" if eager else "lazy admin"
+        print(f"time to first update ({label}), median ms:")
+        for key in ("import_ms", "build_ms", "route_ms", "total_ms"):
+            print(f"  {key:<26}{statistics.median(run[key] for run in runs):8.1f}")
+        print(f"  admin console loaded: {runs[0]['admin_loaded']}; routed to {runs[0]['matched']}")
+
+
+if __name__ == "__main__":
+    main()
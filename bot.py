@@ -1,20 +1,27 @@
-import logging
-
 import database
 from bot import configure_channel, create_application, get_bot_token, load_env
+from bot.cluster import run_cluster
+from bot.config import get_bot_workers, get_health_address, get_slow_query_seconds
+from bot.logs import configure_logging
 
 
 def main() -> None:
     load_env()
+    database.set_slow_query_threshold(get_slow_query_seconds())
     database.init_db()
+    database.load_settings()
+    database.load_admins()
     token = get_bot_token()
     configure_channel()
+    workers = get_bot_workers()
 
-    logging.basicConfig(
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s", level=logging.INFO
-    )
+    configure_logging()
+
+    if workers > 1:
+        run_cluster(token, workers)
+        return
 
-    application = create_application(token)
+    application = create_application(token, health_address=get_health_address())
     application.run_polling(
         allowed_updates=["message", "callback_query"],
         drop_pending_updates=True,
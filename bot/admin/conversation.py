@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from datetime import datetime
+from typing import Any, Dict
 
-from telegram import InlineKeyboardButton, InlineKeyboardMarkup, Update
-from telegram.error import TelegramError
+from telegram import InlineKeyboardButton, InlineKeyboardMarkup, Message, Update
 from telegram.ext import (
     CallbackQueryHandler,
     CommandHandler,
@@ -17,9 +19,11 @@ from telegram.ext import (
 
 import database
 from ..constants import (
+    ADMIN_LIST_PAGE_SIZE,
     ADMIN_PANEL_ADD_PHONE,
     ADMIN_PANEL_BROADCAST_MENU,
     ADMIN_PANEL_BROADCAST_MESSAGE,
+    ADMIN_PANEL_BROADCAST_SCHEDULE,
     ADMIN_PANEL_MAIN,
     ADMIN_PANEL_MANAGE,
     ADMIN_PANEL_REMOVE_PHONE,
@@ -54,8 +58,12 @@ from ..constants import (
     ADMIN_PANEL_CONSULTATION_SETTINGS_EDIT_APPROVAL_MESSAGE,
     ADMIN_PANEL_CONSULTATION_SETTINGS_EDIT_REJECTION_TEMPLATE,
     BROADCAST_OPTIONS,
+    BROADCAST_WEBINAR_PREFIX,
     TEMP_ADMIN_IDS,
 )
+from ..broadcast import format_broadcast_summary, make_copy_sender, run_broadcast
+from ..config import get_bot_timezone, get_broadcast_spread_seconds
+from ..delivery import record_delivery_failure
 from ..guards import (
     ensure_channel_membership,
     ensure_private_chat,
@@ -63,8 +71,11 @@ from ..guards import (
 )
 from ..keyboards import (
     admin_add_cancel_keyboard,
+    admin_broadcast_album_keyboard,
     admin_broadcast_cancel_keyboard,
+    admin_broadcast_dispatch_keyboard,
     admin_broadcast_keyboard,
+    admin_item_stats_keyboard,
     admin_main_keyboard,
     admin_main_reply_keyboard,
     admin_manage_keyboard,
@@ -72,7 +83,21 @@ from ..keyboards import (
     admin_stats_keyboard,
     consultation_settings_keyboard,
 )
+from ..maintenance import database_health
+from ..media import extract_media
 from ..menu import send_main_menu
+from ..pagination import build_paginated_keyboard, parse_page_callback
+from ..plans import build_delivery_plan
+from ..scheduling import (
+    SCHEDULE_TIME_FORMAT,
+    describe_scheduled_broadcast,
+    format_run_at,
+    parse_schedule,
+    schedule_broadcast_job,
+    unschedule_broadcast_job,
+)
+from ..sections import SECTIONS
+from ..throttle import throttle
 from ..utils import (
     extract_phone_last10,
     is_admin_user,
@@ -82,6 +107,89 @@ from ..utils import (
 )
 
 
+SECTION_STATS_LABELS = (
+    ("webinar", "وبینارها", "webinar_viewers"),
+    ("drop_learning", "دراپ لرنینگ", "drop_learning_viewers"),
+    ("case_study", "کیس استادی", "case_studies_viewers"),
+)
+
+
+def build_stats_text() -> str:
+    stats = database.get_user_stats()
+    views = database.get_content_event_stats()
+    lines = [
+        "آمار ربات:",
+        "",
+        "👥 کاربران:",
+        f"- کل کاربران: {stats['total']}",
+        f"- کاربران با شماره موبایل: {stats['with_phone']}",
+        f"- کاربران بدون شماره موبایل: {stats['without_phone']}",
+        f"- کاربران غیرقابل دسترس (مسدود/غیرفعال): {stats.get('unreachable', 0)}",
+        "",
+        "📊 آمار بخش‌ها:",
+    ]
+    for _, label, viewers_key in SECTION_STATS_LABELS:
+        lines.append(f"- بازدیدکنندگان {label}: {stats.get(viewers_key, 0)}")
+    lines.append(f"- بازدیدکنندگان هر بخش: {stats.get('any_section_viewers', 0)}")
+    lines.extend(["", "📈 بازدیدها (۲۴ ساعت / ۷ روز / کل):"])
+    for section, label, _ in SECTION_STATS_LABELS:
+        counts = views.get(section, {})
+        lines.append(
+            f"- {label}: {counts.get('day', 0)} / {counts.get('week', 0)} / {counts.get('total', 0)}"
+        )
+    health = database_health()
+    mib = 1024 * 1024
+    lines.extend([
+        "",
+        "💾 پایگاه داده:",
+        f"- حجم فایل: {health['db_bytes'] / mib:.1f} MB، WAL: {health['wal_bytes'] / mib:.1f} MB",
+        f"- صفحات آزاد: {health['freelist_pages']} از {health['page_count']}",
+    ])
+    nightly = health["runs"].get("incremental_vacuum")
+    if nightly:
+        lines.append(f"- آخرین نگهداری شبانه: {format_run_at(nightly['ran_at'])}")
+    media = database.count_media_assets()
+    lines.append(
+        f"- فایل‌های رسانه: {media[database.MEDIA_OK]} سالم، "
+        f"{media[database.MEDIA_BROKEN]} خراب"
+    )
+    flood = throttle.metrics()
+    lines.extend([
+        "",
+        "🚦 محدودیت ارسال (این پردازش):",
+        f"- پذیرفته: {flood['allowed']}، ردشده: {flood['blocked']}، هشدار: {flood['notices']}",
+    ])
+    if flood["top_blocked"]:
+        top = "، ".join(f"{row['user_id']} ({row['blocked']})" for row in flood["top_blocked"])
+        lines.append(f"- بیشترین ردشده‌ها: {top}")
+    return "\n".join(lines)
+
+
+def _percent(part: int, whole: int) -> str:
+    return f"{part * 100 // whole}٪" if whole else "0٪"
+
+
+def build_item_stats_text(section: str) -> str:
+    label = next(label for key, label, _ in SECTION_STATS_LABELS if key == section)
+    items = database.list_content_item_stats(section, limit=ADMIN_LIST_PAGE_SIZE * 2)
+    if not items:
+        return f"هنوز بازدیدی برای {label} ثبت نشده است."
+    lines = [
+        f"📊 آمار {label} (پربازدیدترین‌ها):",
+        "بازدید / بازدیدکننده / دارای شماره / درخواست مشاوره",
+        "",
+    ]
+    for item in items:
+        unique = item["unique_viewers"]
+        lines.append(
+            f"• {item['title']}\n"
+            f"  {item['views']} / {unique} / "
+            f"{item['phone_viewers']} ({_percent(item['phone_viewers'], unique)}) / "
+            f"{item['consultation_viewers']} ({_percent(item['consultation_viewers'], unique)})"
+        )
+    return "\n".join(lines)
+
+
 async def admin_panel_entry(
     update: Update, context: ContextTypes.DEFAULT_TYPE
 ) -> int:
@@ -139,22 +247,8 @@ async def admin_panel_main_message(
         return ADMIN_PANEL_SETTINGS
 
     if text == "آمار گیری 📊":
-        stats = database.get_user_stats()
-        lines = [
-            "آمار ربات:",
-            "",
-            "👥 کاربران:",
-            f"- کل کاربران: {stats['total']}",
-            f"- کاربران با شماره موبایل: {stats['with_phone']}",
-            f"- کاربران بدون شماره موبایل: {stats['without_phone']}",
-            "",
-            "📊 آمار بخش‌ها:",
-            f"- بازدیدکنندگان وبینارها: {stats.get('webinar_viewers', 0)}",
-            f"- بازدیدکنندگان دراپ لرنینگ: {stats.get('drop_learning_viewers', 0)}",
-            f"- بازدیدکنندگان کیس استادی: {stats.get('case_studies_viewers', 0)}",
-        ]
         await update.message.reply_text(
-            "\n".join(lines),
+            build_stats_text(),
             reply_markup=admin_stats_keyboard(),
         )
         return ADMIN_PANEL_MAIN
@@ -213,22 +307,7 @@ async def admin_panel_main_callback(
         return ADMIN_PANEL_SETTINGS
 
     if data == "panel:stats":
-        stats = database.get_user_stats()
-        text = "\n".join(
-            [
-                "آمار ربات:",
-                "",
-                "👥 کاربران:",
-                f"- کل کاربران: {stats['total']}",
-                f"- کاربران با شماره موبایل: {stats['with_phone']}",
-                f"- کاربران بدون شماره موبایل: {stats['without_phone']}",
-                "",
-                "📊 آمار بخش‌ها:",
-                f"- بازدیدکنندگان وبینارها: {stats.get('webinar_viewers', 0)}",
-                f"- بازدیدکنندگان دراپ لرنینگ: {stats.get('drop_learning_viewers', 0)}",
-                f"- بازدیدکنندگان کیس استادی: {stats.get('case_studies_viewers', 0)}",
-            ]
-        )
+        text = build_stats_text()
         await query.edit_message_text(text, reply_markup=admin_stats_keyboard())
         return ADMIN_PANEL_MAIN
 
@@ -271,25 +350,20 @@ async def admin_panel_stats_callback(
     data = query.data
 
     if data == "stats:back":
-        stats = database.get_user_stats()
-        text = "\n".join(
-            [
-                "آمار ربات:",
-                "",
-                "👥 کاربران:",
-                f"- کل کاربران: {stats['total']}",
-                f"- کاربران با شماره موبایل: {stats['with_phone']}",
-                f"- کاربران بدون شماره موبایل: {stats['without_phone']}",
-                "",
-                "📊 آمار بخش‌ها:",
-                f"- بازدیدکنندگان وبینارها: {stats.get('webinar_viewers', 0)}",
-                f"- بازدیدکنندگان دراپ لرنینگ: {stats.get('drop_learning_viewers', 0)}",
-                f"- بازدیدکنندگان کیس استادی: {stats.get('case_studies_viewers', 0)}",
-            ]
-        )
+        text = build_stats_text()
         await query.edit_message_text(text, reply_markup=admin_stats_keyboard())
         return ADMIN_PANEL_MAIN
 
+    if data.startswith("stats:items:"):
+        section = data.split(":", 2)[2]
+        if section not in database.CONTENT_ITEM_TABLES:
+            await query.answer("گزینه نامعتبر است.", show_alert=True)
+            return ADMIN_PANEL_MAIN
+        await query.edit_message_text(
+            build_item_stats_text(section), reply_markup=admin_item_stats_keyboard()
+        )
+        return ADMIN_PANEL_MAIN
+
     if data == "stats:download_users":
         import csv
         import io
@@ -343,22 +417,7 @@ async def admin_panel_stats_callback(
             )
             await query.answer("فایل با موفقیت ارسال شد ✅", show_alert=True)
             # Show stats again with keyboard
-            stats = database.get_user_stats()
-            text = "\n".join(
-                [
-                    "آمار ربات:",
-                    "",
-                    "👥 کاربران:",
-                    f"- کل کاربران: {stats['total']}",
-                    f"- کاربران با شماره موبایل: {stats['with_phone']}",
-                    f"- کاربران بدون شماره موبایل: {stats['without_phone']}",
-                    "",
-                    "📊 آمار بخش‌ها:",
-                    f"- بازدیدکنندگان وبینارها: {stats.get('webinar_viewers', 0)}",
-                    f"- بازدیدکنندگان دراپ لرنینگ: {stats.get('drop_learning_viewers', 0)}",
-                    f"- بازدیدکنندگان کیس استادی: {stats.get('case_studies_viewers', 0)}",
-                ]
-            )
+            text = build_stats_text()
             await query.message.edit_text(text, reply_markup=admin_stats_keyboard())
         except Exception as e:
             logging.error(f"Failed to send users CSV: {e}")
@@ -500,6 +559,17 @@ async def admin_panel_broadcast_callback(
 
     data = query.data
 
+    if data == "broadcast:scheduled":
+        await show_scheduled_broadcasts(query)
+        return ADMIN_PANEL_BROADCAST_MENU
+
+    if data == "broadcast:menu":
+        await query.edit_message_text(
+            "پیام را برای کدام گروه ارسال می‌کنید؟",
+            reply_markup=admin_broadcast_keyboard(),
+        )
+        return ADMIN_PANEL_BROADCAST_MENU
+
     if data == "broadcast:back":
         await query.edit_message_text(
             "بخش تنظیمات ربات:",
@@ -507,20 +577,79 @@ async def admin_panel_broadcast_callback(
         )
         return ADMIN_PANEL_SETTINGS
 
+    if data.startswith(f"{BROADCAST_WEBINAR_PREFIX}:"):
+        return await _handle_broadcast_webinar_picker(query, context, data)
+
     option = BROADCAST_OPTIONS.get(data)
     if option is None:
         await query.answer("گزینه نامعتبر است.", show_alert=True)
         return ADMIN_PANEL_BROADCAST_MENU
 
-    context.user_data["broadcast_target"] = data
+    return await _prompt_broadcast_message(query, context, option)
+
+
+async def _prompt_broadcast_message(query, context, option: Dict[str, Any]) -> int:
+    """Remember the chosen segment and show its dry-run audience size."""
+    segment = tuple(option["segment"])
+    audience = await asyncio.to_thread(database.count_segment, segment)
+    context.user_data["broadcast_target"] = {
+        "label": option["label"],
+        "segment": segment,
+    }
 
     await query.edit_message_text(
-        f"متن پیام مورد نظر برای «{option['label']}» را ارسال کنید.",
+        f"مخاطبان «{option['label']}»: {audience} نفر\n\n"
+        "پیام مورد نظر (متن، عکس، ویدیو، فایل یا آلبوم) را ارسال یا فوروارد کنید.",
         reply_markup=admin_broadcast_cancel_keyboard(),
     )
     return ADMIN_PANEL_BROADCAST_MESSAGE
 
 
+async def _handle_broadcast_webinar_picker(query, context, data: str) -> int:
+    page_request = parse_page_callback(data, BROADCAST_WEBINAR_PREFIX)
+    if data == f"{BROADCAST_WEBINAR_PREFIX}:list" or page_request:
+        cursor, backward = page_request or (None, False)
+        page = database.list_webinars_page(
+            cursor, limit=ADMIN_LIST_PAGE_SIZE, backward=backward
+        )
+        if not page["items"] and cursor is None:
+            await query.answer("هنوز وبیناری ثبت نشده است.", show_alert=True)
+            return ADMIN_PANEL_BROADCAST_MENU
+        await query.edit_message_text(
+            "بازدیدکنندگان کدام وبینار (بدون درخواست مشاوره) پیام را دریافت کنند؟",
+            reply_markup=build_paginated_keyboard(
+                page,
+                prefix=BROADCAST_WEBINAR_PREFIX,
+                item_button=lambda webinar: InlineKeyboardButton(
+                    webinar["title"] or _webinar_preview_label(webinar["description"]),
+                    callback_data=f"{BROADCAST_WEBINAR_PREFIX}:{webinar['id']}",
+                ),
+                footer_rows=[[InlineKeyboardButton("بازگشت 🔙", callback_data="broadcast:menu")]],
+            ),
+        )
+        return ADMIN_PANEL_BROADCAST_MENU
+
+    try:
+        webinar_id = int(data.rsplit(":", 1)[1])
+    except ValueError:
+        await query.answer("گزینه نامعتبر است.", show_alert=True)
+        return ADMIN_PANEL_BROADCAST_MENU
+    webinar = database.get_webinar(webinar_id)
+    if not webinar:
+        await query.answer("این وبینار دیگر در دسترس نیست.", show_alert=True)
+        return ADMIN_PANEL_BROADCAST_MENU
+
+    title = webinar.get("title") or _webinar_preview_label(webinar["description"])
+    return await _prompt_broadcast_message(
+        query,
+        context,
+        {
+            "label": f"بازدیدکنندگان «{title}» بدون درخواست مشاوره",
+            "segment": (("viewed", "webinar", webinar_id), ("has_consultation", False)),
+        },
+    )
+
+
 async def admin_broadcast_cancel_callback(
     update: Update, context: ContextTypes.DEFAULT_TYPE
 ) -> int:
@@ -538,6 +667,8 @@ async def admin_broadcast_cancel_callback(
         return ConversationHandler.END
 
     context.user_data.pop("broadcast_target", None)
+    context.user_data.pop("broadcast_album", None)
+    context.user_data.pop("broadcast_payload", None)
 
     await query.edit_message_text(
         "ارسال پیام همگانی لغو شد.",
@@ -558,60 +689,286 @@ async def admin_broadcast_message(
         await update.message.reply_text("دسترسی شما قطع شده است.")
         return ConversationHandler.END
 
-    target_key = context.user_data.get("broadcast_target")
-    option = BROADCAST_OPTIONS.get(target_key)
-    if option is None:
+    option = context.user_data.get("broadcast_target")
+    if not option:
         await update.message.reply_text(
             "حالت ارسال نامعتبر است.",
             reply_markup=admin_settings_keyboard(phone_requirement_enabled(context)),
         )
         return ADMIN_PANEL_SETTINGS
 
-    message_text = update.message.text
-    if not message_text:
-        await update.message.reply_text("لطفاً یک پیام متنی ارسال کنید.")
+    message = update.message
+    if message.media_group_id:
+        # Album parts arrive as separate updates; collect them until confirmed.
+        album = context.user_data.get("broadcast_album")
+        if not album or album["media_group_id"] != message.media_group_id:
+            album = {"media_group_id": message.media_group_id, "message_ids": []}
+            context.user_data["broadcast_album"] = album
+            await message.reply_text(
+                "آلبوم دریافت شد. پس از ارسال همه موارد آلبوم، ارسال را تایید کنید.",
+                reply_markup=admin_broadcast_album_keyboard(),
+            )
+        album["message_ids"].append(message.message_id)
         return ADMIN_PANEL_BROADCAST_MESSAGE
 
-    recipients = list(database.iter_users(has_phone=option["filter"]))
+    context.user_data["broadcast_payload"] = {
+        "from_chat_id": message.chat_id,
+        "message_ids": [message.message_id],
+    }
+    await message.reply_text(
+        "پیام آماده است. اکنون ارسال شود یا زمان‌بندی شود؟",
+        reply_markup=admin_broadcast_dispatch_keyboard(),
+    )
+    return ADMIN_PANEL_BROADCAST_MESSAGE
 
-    if not recipients:
-        await update.message.reply_text(
-            f"هیچ کاربری در گروه «{option['label']}» یافت نشد.",
+
+async def admin_broadcast_album_callback(
+    update: Update, context: ContextTypes.DEFAULT_TYPE
+) -> int:
+    query = update.callback_query
+    await query.answer()
+
+    if not await ensure_private_chat(update, context):
+        return ConversationHandler.END
+    if not await ensure_channel_membership(update, context):
+        return ConversationHandler.END
+
+    user = update.effective_user
+    if not user or not is_admin_user(user.id):
+        await query.edit_message_text("دسترسی شما قطع شده است.")
+        return ConversationHandler.END
+
+    option = context.user_data.get("broadcast_target")
+    album = context.user_data.pop("broadcast_album", None)
+    if not option or not album:
+        await query.edit_message_text(
+            "حالت ارسال نامعتبر است.",
             reply_markup=admin_settings_keyboard(phone_requirement_enabled(context)),
         )
-        context.user_data.pop("broadcast_target", None)
         return ADMIN_PANEL_SETTINGS
 
-    sent = 0
-    failed = 0
-    for record in recipients:
-        try:
-            await context.bot.send_message(
-                chat_id=record["telegram_id"],
-                text=message_text,
-            )
-            sent += 1
-        except TelegramError as exc:
-            logging.warning(
-                "Failed to broadcast to %s: %s", record["telegram_id"], exc
-            )
-            failed += 1
+    context.user_data["broadcast_payload"] = {
+        "from_chat_id": query.message.chat_id,
+        "message_ids": sorted(album["message_ids"]),
+    }
+    await query.edit_message_text(
+        "آلبوم آماده است. اکنون ارسال شود یا زمان‌بندی شود؟",
+        reply_markup=admin_broadcast_dispatch_keyboard(),
+    )
+    return ADMIN_PANEL_BROADCAST_MESSAGE
 
+
+async def admin_broadcast_dispatch_callback(
+    update: Update, context: ContextTypes.DEFAULT_TYPE
+) -> int:
+    """Send the prepared broadcast now or ask when to schedule it."""
+    query = update.callback_query
+    await query.answer()
+
+    if not await ensure_private_chat(update, context):
+        return ConversationHandler.END
+    if not await ensure_channel_membership(update, context):
+        return ConversationHandler.END
+
+    user = update.effective_user
+    if not user or not is_admin_user(user.id):
+        await query.edit_message_text("دسترسی شما قطع شده است.")
+        return ConversationHandler.END
+
+    option = context.user_data.get("broadcast_target")
+    payload = context.user_data.get("broadcast_payload")
+    if not option or not payload:
+        await query.edit_message_text(
+            "حالت ارسال نامعتبر است.",
+            reply_markup=admin_settings_keyboard(phone_requirement_enabled(context)),
+        )
+        return ADMIN_PANEL_SETTINGS
+
+    if query.data == "broadcast:schedule":
+        if context.job_queue is None:
+            await query.answer("زمان‌بندی در این نسخه فعال نیست.", show_alert=True)
+            return ADMIN_PANEL_BROADCAST_MESSAGE
+        await query.edit_message_text(
+            "زمان ارسال را به وقت "
+            f"{get_bot_timezone().key} به شکل «{datetime.now(get_bot_timezone()).strftime(SCHEDULE_TIME_FORMAT)}» بفرستید.\n"
+            "برای ارسال تکراری «روزانه» یا «هفتگی» را به انتهای آن اضافه کنید.\n\n"
+            "پیام اصلی را تا زمان ارسال حذف نکنید.",
+            reply_markup=admin_broadcast_cancel_keyboard(),
+        )
+        return ADMIN_PANEL_BROADCAST_SCHEDULE
+
+    await query.edit_message_text("در حال ارسال...")
+    return await _copy_broadcast(query.message, context, option, payload)
+
+
+async def admin_broadcast_schedule_time(
+    update: Update, context: ContextTypes.DEFAULT_TYPE
+) -> int:
+    if not await ensure_private_chat(update, context):
+        return ConversationHandler.END
+    if not await ensure_channel_membership(update, context):
+        return ConversationHandler.END
+
+    if not is_admin_user(update.effective_user.id):
+        await update.message.reply_text("دسترسی شما قطع شده است.")
+        return ConversationHandler.END
+
+    option = context.user_data.get("broadcast_target")
+    payload = context.user_data.get("broadcast_payload")
+    if not option or not payload:
+        await update.message.reply_text(
+            "حالت ارسال نامعتبر است.",
+            reply_markup=admin_settings_keyboard(phone_requirement_enabled(context)),
+        )
+        return ADMIN_PANEL_SETTINGS
+
+    try:
+        run_at, interval = parse_schedule(update.message.text.strip())
+    except ValueError:
+        await update.message.reply_text(
+            "زمان نامعتبر است یا گذشته است. دوباره ارسال کنید.",
+            reply_markup=admin_broadcast_cancel_keyboard(),
+        )
+        return ADMIN_PANEL_BROADCAST_SCHEDULE
+
+    broadcast_id = database.create_scheduled_broadcast(
+        label=option["label"],
+        segment=option["segment"],
+        from_chat_id=payload["from_chat_id"],
+        message_ids=payload["message_ids"],
+        run_at=run_at,
+        interval_seconds=interval,
+        spread_seconds=get_broadcast_spread_seconds(),
+        created_by=update.effective_user.id,
+    )
+    broadcast = database.get_scheduled_broadcast(broadcast_id)
+    schedule_broadcast_job(context.job_queue, broadcast)
     context.user_data.pop("broadcast_target", None)
+    context.user_data.pop("broadcast_payload", None)
 
-    summary_lines = [
-        f"پیام برای «{option['label']}» ارسال شد.",
-        f"کل مخاطبان: {len(recipients)}",
-        f"موفق: {sent}",
-        f"ناموفق: {failed}",
-    ]
     await update.message.reply_text(
-        "\n".join(summary_lines),
+        f"ارسال زمان‌بندی شد ✅\n{describe_scheduled_broadcast(broadcast)}",
         reply_markup=admin_settings_keyboard(phone_requirement_enabled(context)),
     )
     return ADMIN_PANEL_SETTINGS
 
 
+async def _copy_broadcast(
+    reply_to: Message,
+    context: ContextTypes.DEFAULT_TYPE,
+    option: Dict[str, Any],
+    payload: Dict[str, Any],
+) -> int:
+    """Fan the admin's prepared message(s) out with copy_message(s)."""
+    context.user_data.pop("broadcast_target", None)
+    context.user_data.pop("broadcast_album", None)
+    context.user_data.pop("broadcast_payload", None)
+
+    result = await run_broadcast(
+        option["segment"],
+        make_copy_sender(context.bot, payload["from_chat_id"], payload["message_ids"]),
+    )
+
+    if not result["total"]:
+        await reply_to.reply_text(
+            f"هیچ کاربری در گروه «{option['label']}» یافت نشد.",
+            reply_markup=admin_settings_keyboard(phone_requirement_enabled(context)),
+        )
+        return ADMIN_PANEL_SETTINGS
+
+    await reply_to.reply_text(
+        format_broadcast_summary(option["label"], result),
+        reply_markup=admin_settings_keyboard(phone_requirement_enabled(context)),
+    )
+    return ADMIN_PANEL_SETTINGS
+
+
+async def show_scheduled_broadcasts(
+    query, *, cursor: int | None = None, backward: bool = False, status: str | None = None
+) -> None:
+    page = database.list_scheduled_broadcasts_page(
+        cursor, limit=ADMIN_LIST_PAGE_SIZE, backward=backward
+    )
+    text = "📅 پیام‌های زمان‌بندی‌شده:"
+    if status:
+        text = f"{status}\n\n{text}"
+    if not page["items"]:
+        text += "\n\nپیام زمان‌بندی‌شده‌ای وجود ندارد."
+    await query.edit_message_text(
+        text,
+        reply_markup=build_paginated_keyboard(
+            page,
+            prefix="schedule",
+            item_button=lambda broadcast: InlineKeyboardButton(
+                describe_scheduled_broadcast(broadcast)[:60],
+                callback_data=f"schedule:view:{broadcast['id']}",
+            ),
+            footer_rows=[[InlineKeyboardButton("بازگشت 🔙", callback_data="broadcast:menu")]],
+        ),
+    )
+
+
+async def admin_scheduled_broadcasts_callback(
+    update: Update, context: ContextTypes.DEFAULT_TYPE
+) -> int:
+    query = update.callback_query
+    await query.answer()
+
+    if not await ensure_private_chat(update, context):
+        return ConversationHandler.END
+    if not await ensure_channel_membership(update, context):
+        return ConversationHandler.END
+
+    user = update.effective_user
+    if not user or not is_admin_user(user.id):
+        await query.edit_message_text("دسترسی شما قطع شده است.")
+        return ConversationHandler.END
+
+    data = query.data
+    page_request = parse_page_callback(data, "schedule")
+    if data == "schedule:list" or page_request:
+        cursor, backward = page_request or (None, False)
+        await show_scheduled_broadcasts(query, cursor=cursor, backward=backward)
+        return ADMIN_PANEL_BROADCAST_MENU
+
+    action, _, raw_id = data[len("schedule:"):].partition(":")
+    try:
+        broadcast_id = int(raw_id)
+    except ValueError:
+        await query.answer("گزینه نامعتبر است.", show_alert=True)
+        return ADMIN_PANEL_BROADCAST_MENU
+
+    if action == "cancel":
+        cancelled = database.cancel_scheduled_broadcast(broadcast_id)
+        if cancelled and context.job_queue is not None:
+            unschedule_broadcast_job(context.job_queue, broadcast_id)
+        await show_scheduled_broadcasts(
+            query, status="ارسال لغو شد ✅" if cancelled else "این ارسال دیگر فعال نیست."
+        )
+        return ADMIN_PANEL_BROADCAST_MENU
+
+    broadcast = database.get_scheduled_broadcast(broadcast_id)
+    if not broadcast or broadcast["status"] != database.SCHEDULE_ACTIVE:
+        await show_scheduled_broadcasts(query, status="این ارسال دیگر فعال نیست.")
+        return ADMIN_PANEL_BROADCAST_MENU
+
+    audience = await asyncio.to_thread(database.count_segment, broadcast["segment"])
+    await query.edit_message_text(
+        f"{describe_scheduled_broadcast(broadcast)}\nمخاطبان فعلی: {audience} نفر",
+        reply_markup=InlineKeyboardMarkup(
+            [
+                [
+                    InlineKeyboardButton(
+                        "لغو این ارسال ❌", callback_data=f"schedule:cancel:{broadcast_id}"
+                    )
+                ],
+                [InlineKeyboardButton("بازگشت 🔙", callback_data="schedule:list")],
+            ]
+        ),
+    )
+    return ADMIN_PANEL_BROADCAST_MENU
+
+
 WEBINAR_CANCEL_MARKUP = InlineKeyboardMarkup(
     [[InlineKeyboardButton("انصراف 🔙", callback_data="webinar:menu")]]
 )
@@ -639,31 +996,38 @@ def _looks_like_url(value: str) -> bool:
 
 
 async def show_webinar_menu(
-    target, context: ContextTypes.DEFAULT_TYPE, status: str | None = None
+    target,
+    context: ContextTypes.DEFAULT_TYPE,
+    status: str | None = None,
+    *,
+    cursor: int | None = None,
+    backward: bool = False,
 ) -> None:
-    webinars = list(database.list_webinars())
-    keyboard = [
-        [InlineKeyboardButton("➕ افزودن وبینار", callback_data="webinar:add")]
-    ]
-    for webinar in webinars:
-        keyboard.append(
-            [
-                InlineKeyboardButton(
-                    (webinar["title"] or "").strip()
-                    or _webinar_preview_label(webinar["description"]),
-                    callback_data=f"webinar:select:{webinar['id']}",
-                )
-            ]
-        )
-    keyboard.append([InlineKeyboardButton("بازگشت 🔙", callback_data="webinar:back")])
+    page = database.list_webinars_page(
+        cursor, limit=ADMIN_LIST_PAGE_SIZE, backward=backward
+    )
+    markup = build_paginated_keyboard(
+        page,
+        prefix="webinar",
+        item_button=lambda item: InlineKeyboardButton(
+            (item["title"] or "").strip()
+            or _webinar_preview_label(item["description"]),
+            callback_data=f"webinar:select:{item['id']}",
+        ),
+        header_rows=[
+            [InlineKeyboardButton("➕ افزودن وبینار", callback_data="webinar:add")]
+        ],
+        footer_rows=[
+            [InlineKeyboardButton("بازگشت 🔙", callback_data="webinar:back")]
+        ],
+    )
 
     text = "مدیریت وبینارها:"
     if status:
         text += f"\n\n{status}"
-    if not webinars:
+    if not page["items"]:
         text += "\n\nوبیناری ثبت نشده است."
 
-    markup = InlineKeyboardMarkup(keyboard)
     if hasattr(target, "edit_message_text"):
         try:
             await target.edit_message_text(text, reply_markup=markup)
@@ -732,6 +1096,12 @@ async def admin_panel_webinar_callback(
         await show_webinar_menu(query, context)
         return ADMIN_PANEL_WEBINAR_MENU
 
+    page_request = parse_page_callback(data, "webinar")
+    if page_request is not None:
+        cursor, backward = page_request
+        await show_webinar_menu(query, context, cursor=cursor, backward=backward)
+        return ADMIN_PANEL_WEBINAR_MENU
+
     if data == "webinar:add":
         context.user_data["webinar_flow"] = {"content_items": []}
         await query.edit_message_text(
@@ -802,48 +1172,7 @@ async def admin_panel_webinar_callback(
         return ADMIN_PANEL_WEBINAR_MENU
 
     if data == "webinar:finish":
-        flow = context.user_data.get("webinar_flow") or {}
-        title = flow.get("title")
-        description = flow.get("description")
-        cover_photo_file_id = flow.get("cover_photo_file_id")
-        content_items = flow.get("content_items", [])
-        
-        if not title or not description:
-            await query.answer("اطلاعات وبینار ناقص است.", show_alert=True)
-            return ADMIN_PANEL_WEBINAR_ADD_CONTENT
-        
-        # Create webinar
-        webinar_id = database.create_webinar(
-            title, description, cover_photo_file_id
-        )
-        
-        # Add content items
-        for item in content_items:
-            database.add_webinar_content(
-                webinar_id, item["file_id"], item["file_type"], item["order"]
-            )
-        
-        context.user_data.pop("webinar_flow", None)
-        await query.answer("وبینار با موفقیت ثبت شد ✅", show_alert=False)
-        # Edit the current message to show menu
-        webinars = list(database.list_webinars())
-        keyboard = [
-            [InlineKeyboardButton("➕ افزودن وبینار", callback_data="webinar:add")]
-        ]
-        for webinar in webinars:
-            keyboard.append(
-                [
-                    InlineKeyboardButton(
-                        (webinar["title"] or "").strip()
-                        or _webinar_preview_label(webinar["description"]),
-                        callback_data=f"webinar:select:{webinar['id']}",
-                    )
-                ]
-            )
-        keyboard.append([InlineKeyboardButton("بازگشت 🔙", callback_data="webinar:back")])
-        text = "مدیریت وبینارها:\n\nوبینار جدید ثبت شد ✅"
-        await query.edit_message_text(text, reply_markup=InlineKeyboardMarkup(keyboard))
-        return ADMIN_PANEL_WEBINAR_MENU
+        return await _finish_section_item(query, context, "webinar")
 
     await query.answer("گزینه نامعتبر است.", show_alert=True)
     await show_webinar_menu(query, context)
@@ -885,6 +1214,12 @@ async def admin_panel_drop_learning_callback(
         await show_drop_learning_menu(query, context)
         return ADMIN_PANEL_DROP_LEARNING_MENU
 
+    page_request = parse_page_callback(data, "drop_learning")
+    if page_request is not None:
+        cursor, backward = page_request
+        await show_drop_learning_menu(query, context, cursor=cursor, backward=backward)
+        return ADMIN_PANEL_DROP_LEARNING_MENU
+
     if data == "drop_learning:add":
         context.user_data["drop_learning_flow"] = {"content_items": []}
         await query.edit_message_text(
@@ -1091,48 +1426,7 @@ async def admin_panel_drop_learning_callback(
         return ADMIN_PANEL_DROP_LEARNING_ADD_CONTENT_ITEM
 
     if data == "drop_learning:finish":
-        flow = context.user_data.get("drop_learning_flow") or {}
-        title = flow.get("title")
-        description = flow.get("description")
-        content_items = flow.get("content_items", [])
-        
-        if not title or not description:
-            await query.answer("اطلاعات دراپ لرنینگ ناقص است.", show_alert=True)
-            return ADMIN_PANEL_DROP_LEARNING_ADD_CONTENT
-        
-        # Create drop learning
-        item_id = database.create_drop_learning(
-            title, description
-        )
-        
-        # Add content items
-        for item in content_items:
-            database.add_drop_learning_content(
-                item_id, item["file_id"], item["file_type"], item["order"], 
-                caption=item.get("caption")
-            )
-        
-        context.user_data.pop("drop_learning_flow", None)
-        await query.answer("دراپ لرنینگ با موفقیت ثبت شد ✅", show_alert=False)
-        # Edit the current message to show menu
-        items = list(database.list_drop_learning())
-        keyboard = [
-            [InlineKeyboardButton("➕ افزودن دراپ لرنینگ", callback_data="drop_learning:add")]
-        ]
-        for item in items:
-            keyboard.append(
-                [
-                    InlineKeyboardButton(
-                        (item["title"] or "").strip()
-                        or _drop_learning_preview_label(item["description"]),
-                        callback_data=f"drop_learning:select:{item['id']}",
-                    )
-                ]
-            )
-        keyboard.append([InlineKeyboardButton("بازگشت 🔙", callback_data="drop_learning:back")])
-        text = "مدیریت دراپ لرنینگ:\n\nدراپ لرنینگ جدید ثبت شد ✅"
-        await query.edit_message_text(text, reply_markup=InlineKeyboardMarkup(keyboard))
-        return ADMIN_PANEL_DROP_LEARNING_MENU
+        return await _finish_section_item(query, context, "drop_learning")
 
     await query.answer("گزینه نامعتبر است.", show_alert=True)
     await show_drop_learning_menu(query, context)
@@ -1172,6 +1466,12 @@ async def admin_panel_case_studies_callback(
         await show_case_studies_menu(query, context)
         return ADMIN_PANEL_CASE_STUDIES_MENU
 
+    page_request = parse_page_callback(data, "case_studies")
+    if page_request is not None:
+        cursor, backward = page_request
+        await show_case_studies_menu(query, context, cursor=cursor, backward=backward)
+        return ADMIN_PANEL_CASE_STUDIES_MENU
+
     if data == "case_studies:add":
         context.user_data["case_studies_flow"] = {"content_items": []}
         await query.edit_message_text(
@@ -1241,48 +1541,7 @@ async def admin_panel_case_studies_callback(
         return ADMIN_PANEL_CASE_STUDIES_MENU
 
     if data == "case_studies:finish":
-        flow = context.user_data.get("case_studies_flow") or {}
-        title = flow.get("title")
-        description = flow.get("description")
-        cover_photo_file_id = flow.get("cover_photo_file_id")
-        content_items = flow.get("content_items", [])
-        
-        if not title or not description:
-            await query.answer("اطلاعات کیس استادی ناقص است.", show_alert=True)
-            return ADMIN_PANEL_CASE_STUDIES_ADD_CONTENT
-        
-        # Create case study
-        item_id = database.create_case_study(
-            title, description, cover_photo_file_id
-        )
-        
-        # Add content items
-        for item in content_items:
-            database.add_case_study_content(
-                item_id, item["file_id"], item["file_type"], item["order"]
-            )
-        
-        context.user_data.pop("case_studies_flow", None)
-        await query.answer("کیس استادی با موفقیت ثبت شد ✅", show_alert=False)
-        # Edit the current message to show menu
-        items = list(database.list_case_studies())
-        keyboard = [
-            [InlineKeyboardButton("➕ افزودن کیس استادی", callback_data="case_studies:add")]
-        ]
-        for item in items:
-            keyboard.append(
-                [
-                    InlineKeyboardButton(
-                        (item["title"] or "").strip()
-                        or _case_studies_preview_label(item["description"]),
-                        callback_data=f"case_studies:select:{item['id']}",
-                    )
-                ]
-            )
-        keyboard.append([InlineKeyboardButton("بازگشت 🔙", callback_data="case_studies:back")])
-        text = "مدیریت کیس استادی:\n\nکیس استادی جدید ثبت شد ✅"
-        await query.edit_message_text(text, reply_markup=InlineKeyboardMarkup(keyboard))
-        return ADMIN_PANEL_CASE_STUDIES_MENU
+        return await _finish_section_item(query, context, "case_study")
 
     await query.answer("گزینه نامعتبر است.", show_alert=True)
     await show_case_studies_menu(query, context)
@@ -1333,35 +1592,7 @@ async def admin_webinar_add_description(
 async def admin_webinar_edit_description(
     update: Update, context: ContextTypes.DEFAULT_TYPE
 ) -> int:
-    if not await ensure_channel_membership(update, context):
-        return ConversationHandler.END
-
-    if not await ensure_registered_user(update, context):
-        return ConversationHandler.END
-
-    if not is_admin_user(update.effective_user.id):
-        await update.message.reply_text("دسترسی شما قطع شده است.")
-        return ConversationHandler.END
-
-    webinar_id = context.user_data.get("webinar_selected")
-    if not webinar_id:
-        await update.message.reply_text("ابتدا وبینار را از فهرست انتخاب کن.")
-        await show_webinar_menu(update.effective_chat.id, context)
-        return ADMIN_PANEL_WEBINAR_MENU
-
-    description = (update.message.text or "").strip()
-    if not description:
-        await update.message.reply_text(
-            "توضیحات جدید نمی‌تواند خالی باشد. دوباره تلاش کن.",
-            reply_markup=WEBINAR_CANCEL_MARKUP,
-        )
-        return ADMIN_PANEL_WEBINAR_EDIT_DESCRIPTION
-
-    database.update_webinar(webinar_id, description=description)
-    context.user_data.pop("webinar_flow", None)
-    await update.message.reply_text("توضیحات وبینار به‌روزرسانی شد ✅")
-    await show_webinar_menu(update.effective_chat.id, context)
-    return ADMIN_PANEL_WEBINAR_MENU
+    return await _edit_section_field(update, context, "webinar", "description")
 
 
 async def admin_webinar_add_title(
@@ -1434,98 +1665,16 @@ async def admin_webinar_add_cover(
     return ADMIN_PANEL_WEBINAR_ADD_CONTENT
 
 
-async def admin_webinar_add_content(
-    update: Update, context: ContextTypes.DEFAULT_TYPE
-) -> int:
-    if not await ensure_channel_membership(update, context):
-        return ConversationHandler.END
-
-    if not await ensure_registered_user(update, context):
-        return ConversationHandler.END
-
-    if not is_admin_user(update.effective_user.id):
-        await update.message.reply_text("دسترسی شما قطع شده است.")
-        return ConversationHandler.END
-
-    flow = context.user_data.get("webinar_flow") or {}
-    content_items = flow.get("content_items", [])
-    
-    file_id = None
-    file_type = None
-    
-    if update.message.video:
-        file_id = update.message.video.file_id
-        file_type = "video"
-    elif update.message.voice:
-        file_id = update.message.voice.file_id
-        file_type = "voice"
-    elif update.message.audio:
-        file_id = update.message.audio.file_id
-        file_type = "audio"
-    elif update.message.document:
-        file_id = update.message.document.file_id
-        file_type = "document"
-    elif update.message.photo:
-        file_id = update.message.photo[-1].file_id
-        file_type = "photo"
-    elif update.message.video_note:
-        file_id = update.message.video_note.file_id
-        file_type = "video_note"
-    
-    if file_id and file_type:
-        content_items.append({
-            "file_id": file_id,
-            "file_type": file_type,
-            "order": len(content_items)
-        })
-        flow["content_items"] = content_items
-        context.user_data["webinar_flow"] = flow
-        await update.message.reply_text(
-            f"محتوای {len(content_items)} ثبت شد.\n"
-            "می‌توانید محتوای دیگری ارسال کنید یا دکمه «پایان ✅» را بزنید.",
-            reply_markup=WEBINAR_CONTENT_MARKUP,
-        )
-    else:
-        await update.message.reply_text(
-            "لطفاً یک فایل (ویدیو، وویس، فایل و...) ارسال کنید.",
-            reply_markup=WEBINAR_CONTENT_MARKUP,
-        )
-    
-    return ADMIN_PANEL_WEBINAR_ADD_CONTENT
-
-
-async def admin_webinar_edit_title(
+async def admin_webinar_add_content(
     update: Update, context: ContextTypes.DEFAULT_TYPE
 ) -> int:
-    if not await ensure_channel_membership(update, context):
-        return ConversationHandler.END
-
-    if not await ensure_registered_user(update, context):
-        return ConversationHandler.END
-
-    if not is_admin_user(update.effective_user.id):
-        await update.message.reply_text("دسترسی شما قطع شده است.")
-        return ConversationHandler.END
-
-    webinar_id = context.user_data.get("webinar_selected")
-    if not webinar_id:
-        await update.message.reply_text("ابتدا وبینار را از فهرست انتخاب کن.")
-        await show_webinar_menu(update.effective_chat.id, context)
-        return ADMIN_PANEL_WEBINAR_MENU
+    return await _collect_section_content(update, context, "webinar")
 
-    title = (update.message.text or "").strip()
-    if not title:
-        await update.message.reply_text(
-            "عنوان نمی‌تواند خالی باشد. دوباره ارسال کن.",
-            reply_markup=WEBINAR_CANCEL_MARKUP,
-        )
-        return ADMIN_PANEL_WEBINAR_EDIT_TITLE
 
-    database.update_webinar(webinar_id, title=title)
-    context.user_data.pop("webinar_flow", None)
-    await update.message.reply_text("عنوان وبینار به‌روزرسانی شد ✅")
-    await show_webinar_menu(update.effective_chat.id, context)
-    return ADMIN_PANEL_WEBINAR_MENU
+async def admin_webinar_edit_title(
+    update: Update, context: ContextTypes.DEFAULT_TYPE
+) -> int:
+    return await _edit_section_field(update, context, "webinar", "title")
 
 
 # Drop Learning message handlers
@@ -1600,122 +1749,19 @@ async def admin_drop_learning_add_description(
 async def admin_drop_learning_add_content(
     update: Update, context: ContextTypes.DEFAULT_TYPE
 ) -> int:
-    if not await ensure_channel_membership(update, context):
-        return ConversationHandler.END
-    if not await ensure_registered_user(update, context):
-        return ConversationHandler.END
-    if not is_admin_user(update.effective_user.id):
-        await update.message.reply_text("دسترسی شما قطع شده است.")
-        return ConversationHandler.END
-
-    flow = context.user_data.get("drop_learning_flow") or {}
-    content_items = flow.get("content_items", [])
-    
-    file_id = None
-    file_type = None
-    
-    if update.message.video:
-        file_id = update.message.video.file_id
-        file_type = "video"
-    elif update.message.voice:
-        file_id = update.message.voice.file_id
-        file_type = "voice"
-    elif update.message.audio:
-        file_id = update.message.audio.file_id
-        file_type = "audio"
-    elif update.message.document:
-        file_id = update.message.document.file_id
-        file_type = "document"
-    elif update.message.photo:
-        file_id = update.message.photo[-1].file_id
-        file_type = "photo"
-    elif update.message.video_note:
-        file_id = update.message.video_note.file_id
-        file_type = "video_note"
-    
-    if file_id and file_type:
-        # Get caption from message if available
-        caption = update.message.caption or None
-        
-        content_items.append({
-            "file_id": file_id,
-            "file_type": file_type,
-            "order": len(content_items),
-            "caption": caption
-        })
-        flow["content_items"] = content_items
-        context.user_data["drop_learning_flow"] = flow
-        caption_msg = " (با کپشن)" if caption else ""
-        await update.message.reply_text(
-            f"محتوای {len(content_items)} ثبت شد{caption_msg}.\n"
-            "می‌توانید محتوای دیگری ارسال کنید یا دکمه «پایان ✅» را بزنید.",
-            reply_markup=DROP_LEARNING_CONTENT_MARKUP,
-        )
-    else:
-        await update.message.reply_text(
-            "لطفاً یک فایل (ویدیو، وویس، فایل و...) ارسال کنید.",
-            reply_markup=DROP_LEARNING_CONTENT_MARKUP,
-        )
-    
-    return ADMIN_PANEL_DROP_LEARNING_ADD_CONTENT
+    return await _collect_section_content(update, context, "drop_learning")
 
 
 async def admin_drop_learning_edit_description(
     update: Update, context: ContextTypes.DEFAULT_TYPE
 ) -> int:
-    if not await ensure_channel_membership(update, context):
-        return ConversationHandler.END
-    if not await ensure_registered_user(update, context):
-        return ConversationHandler.END
-    if not is_admin_user(update.effective_user.id):
-        await update.message.reply_text("دسترسی شما قطع شده است.")
-        return ConversationHandler.END
-
-    item_id = context.user_data.get("drop_learning_selected")
-    if not item_id:
-        await update.message.reply_text("ابتدا دراپ لرنینگ را از فهرست انتخاب کنید.")
-        await show_drop_learning_menu(update.effective_chat.id, context)
-        return ADMIN_PANEL_DROP_LEARNING_MENU
-
-    description = (update.message.text or "").strip()
-    if not description:
-        await update.message.reply_text(
-            "توضیحات جدید نمی‌تواند خالی باشد.",
-            reply_markup=DROP_LEARNING_CANCEL_MARKUP,
-        )
-        return ADMIN_PANEL_DROP_LEARNING_EDIT_DESCRIPTION
-
-    database.update_drop_learning(item_id, description=description)
-    context.user_data.pop("drop_learning_flow", None)
-    await update.message.reply_text("توضیحات دراپ لرنینگ به‌روزرسانی شد ✅")
-    await show_drop_learning_menu(update.effective_chat.id, context)
-    return ADMIN_PANEL_DROP_LEARNING_MENU
+    return await _edit_section_field(update, context, "drop_learning", "description")
 
 
 async def admin_drop_learning_edit_title(
     update: Update, context: ContextTypes.DEFAULT_TYPE
 ) -> int:
-    if not await ensure_channel_membership(update, context):
-        return ConversationHandler.END
-    if not await ensure_registered_user(update, context):
-        return ConversationHandler.END
-    if not is_admin_user(update.effective_user.id):
-        await update.message.reply_text("دسترسی شما قطع شده است.")
-        return ConversationHandler.END
-
-    item_id = context.user_data.get("drop_learning_selected")
-    if not item_id:
-        await update.message.reply_text("ابتدا دراپ لرنینگ را از فهرست انتخاب کنید.")
-        await show_drop_learning_menu(update.effective_chat.id, context)
-        return ADMIN_PANEL_DROP_LEARNING_MENU
-
-    title = (update.message.text or "").strip()
-    if not title:
-        await update.message.reply_text(
-            "عنوان نمی‌تواند خالی باشد.",
-            reply_markup=DROP_LEARNING_CANCEL_MARKUP,
-        )
-        return ADMIN_PANEL_DROP_LEARNING_EDIT_TITLE
+    return await _edit_section_field(update, context, "drop_learning", "title")
 
 
 async def admin_drop_learning_add_content_item(
@@ -1738,29 +1784,9 @@ async def admin_drop_learning_add_content_item(
         await show_drop_learning_menu(update.effective_chat.id, context)
         return ADMIN_PANEL_DROP_LEARNING_MENU
     
-    file_id = None
-    file_type = None
-    
-    if update.message.video:
-        file_id = update.message.video.file_id
-        file_type = "video"
-    elif update.message.voice:
-        file_id = update.message.voice.file_id
-        file_type = "voice"
-    elif update.message.audio:
-        file_id = update.message.audio.file_id
-        file_type = "audio"
-    elif update.message.document:
-        file_id = update.message.document.file_id
-        file_type = "document"
-    elif update.message.photo:
-        file_id = update.message.photo[-1].file_id
-        file_type = "photo"
-    elif update.message.video_note:
-        file_id = update.message.video_note.file_id
-        file_type = "video_note"
+    media = extract_media(update.message)
     
-    if file_id and file_type:
+    if media:
         # Get caption from message if available
         caption = update.message.caption or None
         
@@ -1773,7 +1799,14 @@ async def admin_drop_learning_add_content_item(
             # Get current content count to set order (add at end) - optimized: count directly
             order = sum(1 for _ in database.get_drop_learning_content(item_id))
 
-        database.add_drop_learning_content(item_id, file_id, file_type, order, caption=caption)
+        database.add_drop_learning_content(
+            item_id,
+            media["file_id"],
+            media["file_type"],
+            order,
+            caption=caption,
+            file_unique_id=media["file_unique_id"],
+        )
         caption_msg = " (با کپشن)" if caption else ""
         position_msg = f" در موقعیت {order + 1}" if mode == "insert_content" else ""
         await update.message.reply_text(f"محتوا با موفقیت اضافه شد ✅{position_msg}{caption_msg}")
@@ -1815,33 +1848,19 @@ async def admin_drop_learning_edit_content_item(
         await show_drop_learning_menu(update.effective_chat.id, context)
         return ADMIN_PANEL_DROP_LEARNING_MENU
     
-    file_id = None
-    file_type = None
-    
-    if update.message.video:
-        file_id = update.message.video.file_id
-        file_type = "video"
-    elif update.message.voice:
-        file_id = update.message.voice.file_id
-        file_type = "voice"
-    elif update.message.audio:
-        file_id = update.message.audio.file_id
-        file_type = "audio"
-    elif update.message.document:
-        file_id = update.message.document.file_id
-        file_type = "document"
-    elif update.message.photo:
-        file_id = update.message.photo[-1].file_id
-        file_type = "photo"
-    elif update.message.video_note:
-        file_id = update.message.video_note.file_id
-        file_type = "video_note"
+    media = extract_media(update.message)
     
-    if file_id and file_type:
+    if media:
         # Get caption from message if available
         caption = update.message.caption or None
         
-        if database.update_drop_learning_content(content_id, file_id, file_type, caption=caption):
+        if database.update_drop_learning_content(
+            content_id,
+            media["file_id"],
+            media["file_type"],
+            caption=caption,
+            file_unique_id=media["file_unique_id"],
+        ):
             caption_msg = " (با کپشن)" if caption else ""
             await update.message.reply_text(f"محتوا با موفقیت به‌روزرسانی شد ✅{caption_msg}")
             context.user_data.pop("drop_learning_flow", None)
@@ -1979,153 +1998,56 @@ async def admin_case_studies_add_cover(
 async def admin_case_studies_add_content(
     update: Update, context: ContextTypes.DEFAULT_TYPE
 ) -> int:
-    if not await ensure_channel_membership(update, context):
-        return ConversationHandler.END
-    if not await ensure_registered_user(update, context):
-        return ConversationHandler.END
-    if not is_admin_user(update.effective_user.id):
-        await update.message.reply_text("دسترسی شما قطع شده است.")
-        return ConversationHandler.END
-
-    flow = context.user_data.get("case_studies_flow") or {}
-    content_items = flow.get("content_items", [])
-    
-    file_id = None
-    file_type = None
-    
-    if update.message.video:
-        file_id = update.message.video.file_id
-        file_type = "video"
-    elif update.message.voice:
-        file_id = update.message.voice.file_id
-        file_type = "voice"
-    elif update.message.audio:
-        file_id = update.message.audio.file_id
-        file_type = "audio"
-    elif update.message.document:
-        file_id = update.message.document.file_id
-        file_type = "document"
-    elif update.message.photo:
-        file_id = update.message.photo[-1].file_id
-        file_type = "photo"
-    elif update.message.video_note:
-        file_id = update.message.video_note.file_id
-        file_type = "video_note"
-    
-    if file_id and file_type:
-        content_items.append({
-            "file_id": file_id,
-            "file_type": file_type,
-            "order": len(content_items)
-        })
-        flow["content_items"] = content_items
-        context.user_data["case_studies_flow"] = flow
-        await update.message.reply_text(
-            f"محتوای {len(content_items)} ثبت شد.\n"
-            "می‌توانید محتوای دیگری ارسال کنید یا دکمه «پایان ✅» را بزنید.",
-            reply_markup=CASE_STUDIES_CONTENT_MARKUP,
-        )
-    else:
-        await update.message.reply_text(
-            "لطفاً یک فایل (ویدیو، وویس، فایل و...) ارسال کنید.",
-            reply_markup=CASE_STUDIES_CONTENT_MARKUP,
-        )
-    
-    return ADMIN_PANEL_CASE_STUDIES_ADD_CONTENT
+    return await _collect_section_content(update, context, "case_study")
 
 
 async def admin_case_studies_edit_description(
     update: Update, context: ContextTypes.DEFAULT_TYPE
 ) -> int:
-    if not await ensure_channel_membership(update, context):
-        return ConversationHandler.END
-    if not await ensure_registered_user(update, context):
-        return ConversationHandler.END
-    if not is_admin_user(update.effective_user.id):
-        await update.message.reply_text("دسترسی شما قطع شده است.")
-        return ConversationHandler.END
-
-    item_id = context.user_data.get("case_studies_selected")
-    if not item_id:
-        await update.message.reply_text("ابتدا کیس استادی را از فهرست انتخاب کنید.")
-        await show_case_studies_menu(update.effective_chat.id, context)
-        return ADMIN_PANEL_CASE_STUDIES_MENU
-
-    description = (update.message.text or "").strip()
-    if not description:
-        await update.message.reply_text(
-            "توضیحات جدید نمی‌تواند خالی باشد.",
-            reply_markup=CASE_STUDIES_CANCEL_MARKUP,
-        )
-        return ADMIN_PANEL_CASE_STUDIES_EDIT_DESCRIPTION
-
-    database.update_case_study(item_id, description=description)
-    context.user_data.pop("case_studies_flow", None)
-    await update.message.reply_text("توضیحات کیس استادی به‌روزرسانی شد ✅")
-    await show_case_studies_menu(update.effective_chat.id, context)
-    return ADMIN_PANEL_CASE_STUDIES_MENU
+    return await _edit_section_field(update, context, "case_study", "description")
 
 
 async def admin_case_studies_edit_title(
     update: Update, context: ContextTypes.DEFAULT_TYPE
 ) -> int:
-    if not await ensure_channel_membership(update, context):
-        return ConversationHandler.END
-    if not await ensure_registered_user(update, context):
-        return ConversationHandler.END
-    if not is_admin_user(update.effective_user.id):
-        await update.message.reply_text("دسترسی شما قطع شده است.")
-        return ConversationHandler.END
-
-    item_id = context.user_data.get("case_studies_selected")
-    if not item_id:
-        await update.message.reply_text("ابتدا کیس استادی را از فهرست انتخاب کنید.")
-        await show_case_studies_menu(update.effective_chat.id, context)
-        return ADMIN_PANEL_CASE_STUDIES_MENU
-
-    title = (update.message.text or "").strip()
-    if not title:
-        await update.message.reply_text(
-            "عنوان نمی‌تواند خالی باشد.",
-            reply_markup=CASE_STUDIES_CANCEL_MARKUP,
-        )
-        return ADMIN_PANEL_CASE_STUDIES_EDIT_TITLE
-
-    database.update_case_study(item_id, title=title)
-    context.user_data.pop("case_studies_flow", None)
-    await update.message.reply_text("عنوان کیس استادی به‌روزرسانی شد ✅")
-    await show_case_studies_menu(update.effective_chat.id, context)
-    return ADMIN_PANEL_CASE_STUDIES_MENU
+    return await _edit_section_field(update, context, "case_study", "title")
 
 
-async def show_remove_admin_menu(query, context: ContextTypes.DEFAULT_TYPE) -> None:
-    admins = [
-        record
-        for record in database.list_admins()
-        if record["telegram_id"] not in TEMP_ADMIN_IDS
-    ]
+async def show_remove_admin_menu(
+    query,
+    context: ContextTypes.DEFAULT_TYPE,
+    *,
+    cursor: int | None = None,
+    backward: bool = False,
+) -> None:
+    page = database.list_admins_page(
+        cursor,
+        limit=ADMIN_LIST_PAGE_SIZE,
+        backward=backward,
+        exclude_ids=TEMP_ADMIN_IDS,
+    )
 
-    if not admins:
+    if not page["items"]:
         await query.edit_message_text(
             "ادمینی برای حذف وجود ندارد.",
             reply_markup=admin_manage_keyboard(),
         )
         return
 
-    keyboard = [
-        [
-            InlineKeyboardButton(
-                f"{admin['phone_number']} | {admin['fname'] or 'بدون نام'}",
-                callback_data=f"remove:{admin['telegram_id']}",
-            )
-        ]
-        for admin in admins
-    ]
-    keyboard.append([InlineKeyboardButton("بازگشت 🔙", callback_data="remove:back")])
+    markup = build_paginated_keyboard(
+        page,
+        prefix="remove",
+        cursor_key="telegram_id",
+        item_button=lambda admin: InlineKeyboardButton(
+            f"{admin['phone_number']} | {admin['fname'] or 'بدون نام'}",
+            callback_data=f"remove:{admin['telegram_id']}",
+        ),
+        footer_rows=[[InlineKeyboardButton("بازگشت 🔙", callback_data="remove:back")]],
+    )
 
     await query.edit_message_text(
         "یکی از ادمین‌ها را برای حذف انتخاب کنید:",
-        reply_markup=InlineKeyboardMarkup(keyboard),
+        reply_markup=markup,
     )
 
 
@@ -2214,6 +2136,12 @@ async def handle_remove_admin_selection(
         )
         return ADMIN_PANEL_MANAGE
 
+    page_request = parse_page_callback(data, "remove")
+    if page_request is not None:
+        cursor, backward = page_request
+        await show_remove_admin_menu(query, context, cursor=cursor, backward=backward)
+        return ADMIN_PANEL_REMOVE_PHONE
+
     try:
         target_id = int(data.split(":", maxsplit=1)[1])
     except (IndexError, ValueError):
@@ -2387,6 +2315,7 @@ async def handle_consultation_approval(
         )
     except Exception as e:
         logging.warning(f"Failed to send approval message to user {request['user_id']}: {e}")
+        record_delivery_failure(request["user_id"], e)
 
     # Request custom message from admin
     context.user_data["consultation_send_message"] = request_id
@@ -2476,6 +2405,7 @@ async def handle_consultation_rejection_reason(
         )
     except Exception as e:
         logging.warning(f"Failed to send rejection message to user {user_id}: {e}")
+        record_delivery_failure(user_id, e)
 
     # Request custom message from admin (optional)
     context.user_data["consultation_reject_message"] = request_id
@@ -2565,6 +2495,7 @@ async def handle_consultation_custom_message(
         await update.message.reply_text("پیام به کاربر ارسال شد.")
     except Exception as e:
         logging.warning(f"Failed to send custom message to user {user_id}: {e}")
+        record_delivery_failure(user_id, e)
         await update.message.reply_text("خطا در ارسال پیام.")
 
 
@@ -2830,6 +2761,8 @@ async def admin_cancel(
     update: Update, context: ContextTypes.DEFAULT_TYPE
 ) -> int:
     context.user_data.pop("broadcast_target", None)
+    context.user_data.pop("broadcast_album", None)
+    context.user_data.pop("broadcast_payload", None)
     context.user_data.pop("webinar_flow", None)
     context.user_data.pop("webinar_selected", None)
     if update.message:
@@ -2868,31 +2801,38 @@ def _drop_learning_preview_label(description: str) -> str:
 
 
 async def show_drop_learning_menu(
-    target, context: ContextTypes.DEFAULT_TYPE, status: str | None = None
+    target,
+    context: ContextTypes.DEFAULT_TYPE,
+    status: str | None = None,
+    *,
+    cursor: int | None = None,
+    backward: bool = False,
 ) -> None:
-    items = list(database.list_drop_learning())
-    keyboard = [
-        [InlineKeyboardButton("➕ افزودن دراپ لرنینگ", callback_data="drop_learning:add")]
-    ]
-    for item in items:
-        keyboard.append(
-            [
-                InlineKeyboardButton(
-                    (item["title"] or "").strip()
-                    or _drop_learning_preview_label(item["description"]),
-                    callback_data=f"drop_learning:select:{item['id']}",
-                )
-            ]
-        )
-    keyboard.append([InlineKeyboardButton("بازگشت 🔙", callback_data="drop_learning:back")])
+    page = database.list_drop_learning_page(
+        cursor, limit=ADMIN_LIST_PAGE_SIZE, backward=backward
+    )
+    markup = build_paginated_keyboard(
+        page,
+        prefix="drop_learning",
+        item_button=lambda item: InlineKeyboardButton(
+            (item["title"] or "").strip()
+            or _drop_learning_preview_label(item["description"]),
+            callback_data=f"drop_learning:select:{item['id']}",
+        ),
+        header_rows=[
+            [InlineKeyboardButton("➕ افزودن دراپ لرنینگ", callback_data="drop_learning:add")]
+        ],
+        footer_rows=[
+            [InlineKeyboardButton("بازگشت 🔙", callback_data="drop_learning:back")]
+        ],
+    )
 
     text = "مدیریت دراپ لرنینگ:"
     if status:
         text += f"\n\n{status}"
-    if not items:
+    if not page["items"]:
         text += "\n\nدراپ لرنینگی ثبت نشده است."
 
-    markup = InlineKeyboardMarkup(keyboard)
     if hasattr(target, "edit_message_text"):
         try:
             await target.edit_message_text(text, reply_markup=markup)
@@ -3023,31 +2963,38 @@ def _case_studies_preview_label(description: str) -> str:
 
 
 async def show_case_studies_menu(
-    target, context: ContextTypes.DEFAULT_TYPE, status: str | None = None
+    target,
+    context: ContextTypes.DEFAULT_TYPE,
+    status: str | None = None,
+    *,
+    cursor: int | None = None,
+    backward: bool = False,
 ) -> None:
-    items = list(database.list_case_studies())
-    keyboard = [
-        [InlineKeyboardButton("➕ افزودن کیس استادی", callback_data="case_studies:add")]
-    ]
-    for item in items:
-        keyboard.append(
-            [
-                InlineKeyboardButton(
-                    (item["title"] or "").strip()
-                    or _case_studies_preview_label(item["description"]),
-                    callback_data=f"case_studies:select:{item['id']}",
-                )
-            ]
-        )
-    keyboard.append([InlineKeyboardButton("بازگشت 🔙", callback_data="case_studies:back")])
+    page = database.list_case_studies_page(
+        cursor, limit=ADMIN_LIST_PAGE_SIZE, backward=backward
+    )
+    markup = build_paginated_keyboard(
+        page,
+        prefix="case_studies",
+        item_button=lambda item: InlineKeyboardButton(
+            (item["title"] or "").strip()
+            or _case_studies_preview_label(item["description"]),
+            callback_data=f"case_studies:select:{item['id']}",
+        ),
+        header_rows=[
+            [InlineKeyboardButton("➕ افزودن کیس استادی", callback_data="case_studies:add")]
+        ],
+        footer_rows=[
+            [InlineKeyboardButton("بازگشت 🔙", callback_data="case_studies:back")]
+        ],
+    )
 
     text = "مدیریت کیس استادی:"
     if status:
         text += f"\n\n{status}"
-    if not items:
+    if not page["items"]:
         text += "\n\nکیس استادی ثبت نشده است."
 
-    markup = InlineKeyboardMarkup(keyboard)
     if hasattr(target, "edit_message_text"):
         try:
             await target.edit_message_text(text, reply_markup=markup)
@@ -3083,6 +3030,168 @@ async def show_selected_case_study(
     await query.edit_message_text(text, reply_markup=keyboard)
 
 
+# Admin steps shared by the catalogue sections
+ADMIN_SECTIONS: Dict[str, Dict[str, Any]] = {
+    "webinar": {
+        "flow_key": "webinar_flow",
+        "selected_key": "webinar_selected",
+        "show_menu": show_webinar_menu,
+        "menu_state": ADMIN_PANEL_WEBINAR_MENU,
+        "add_content_state": ADMIN_PANEL_WEBINAR_ADD_CONTENT,
+        "edit_states": {
+            "title": ADMIN_PANEL_WEBINAR_EDIT_TITLE,
+            "description": ADMIN_PANEL_WEBINAR_EDIT_DESCRIPTION,
+        },
+        "cancel_markup": WEBINAR_CANCEL_MARKUP,
+        "content_markup": WEBINAR_CONTENT_MARKUP,
+        "captions": False,
+    },
+    "drop_learning": {
+        "flow_key": "drop_learning_flow",
+        "selected_key": "drop_learning_selected",
+        "show_menu": show_drop_learning_menu,
+        "menu_state": ADMIN_PANEL_DROP_LEARNING_MENU,
+        "add_content_state": ADMIN_PANEL_DROP_LEARNING_ADD_CONTENT,
+        "edit_states": {
+            "title": ADMIN_PANEL_DROP_LEARNING_EDIT_TITLE,
+            "description": ADMIN_PANEL_DROP_LEARNING_EDIT_DESCRIPTION,
+        },
+        "cancel_markup": DROP_LEARNING_CANCEL_MARKUP,
+        "content_markup": DROP_LEARNING_CONTENT_MARKUP,
+        "captions": True,
+    },
+    "case_study": {
+        "flow_key": "case_studies_flow",
+        "selected_key": "case_studies_selected",
+        "show_menu": show_case_studies_menu,
+        "menu_state": ADMIN_PANEL_CASE_STUDIES_MENU,
+        "add_content_state": ADMIN_PANEL_CASE_STUDIES_ADD_CONTENT,
+        "edit_states": {
+            "title": ADMIN_PANEL_CASE_STUDIES_EDIT_TITLE,
+            "description": ADMIN_PANEL_CASE_STUDIES_EDIT_DESCRIPTION,
+        },
+        "cancel_markup": CASE_STUDIES_CANCEL_MARKUP,
+        "content_markup": CASE_STUDIES_CONTENT_MARKUP,
+        "captions": False,
+    },
+}
+
+SECTION_FIELD_LABELS = {"title": "عنوان", "description": "توضیحات"}
+
+
+async def _ensure_admin_message(
+    update: Update, context: ContextTypes.DEFAULT_TYPE
+) -> bool:
+    if not await ensure_channel_membership(update, context):
+        return False
+    if not await ensure_registered_user(update, context):
+        return False
+    if not is_admin_user(update.effective_user.id):
+        await update.message.reply_text("دسترسی شما قطع شده است.")
+        return False
+    return True
+
+
+async def _edit_section_field(
+    update: Update, context: ContextTypes.DEFAULT_TYPE, section: str, field: str
+) -> int:
+    if not await _ensure_admin_message(update, context):
+        return ConversationHandler.END
+
+    config = ADMIN_SECTIONS[section]
+    label = SECTIONS[section].label
+    item_id = context.user_data.get(config["selected_key"])
+    if not item_id:
+        await update.message.reply_text(f"ابتدا {label} را از فهرست انتخاب کنید.")
+        await config["show_menu"](update.effective_chat.id, context)
+        return config["menu_state"]
+
+    value = (update.message.text or "").strip()
+    if not value:
+        await update.message.reply_text(
+            f"{SECTION_FIELD_LABELS[field]} نمی‌تواند خالی باشد. دوباره ارسال کنید.",
+            reply_markup=config["cancel_markup"],
+        )
+        return config["edit_states"][field]
+
+    database.update_section_item(section, item_id, **{field: value})
+    context.user_data.pop(config["flow_key"], None)
+    await update.message.reply_text(
+        f"{SECTION_FIELD_LABELS[field]} {label} به‌روزرسانی شد ✅"
+    )
+    await config["show_menu"](update.effective_chat.id, context)
+    return config["menu_state"]
+
+
+async def _collect_section_content(
+    update: Update, context: ContextTypes.DEFAULT_TYPE, section: str
+) -> int:
+    """Queue one uploaded file in the section's creation flow."""
+    if not await _ensure_admin_message(update, context):
+        return ConversationHandler.END
+
+    config = ADMIN_SECTIONS[section]
+    flow = context.user_data.get(config["flow_key"]) or {}
+    content_items = flow.get("content_items", [])
+    media = extract_media(update.message)
+    if not media:
+        await update.message.reply_text(
+            "لطفاً یک فایل (ویدیو، وویس، فایل و...) ارسال کنید.",
+            reply_markup=config["content_markup"],
+        )
+        return config["add_content_state"]
+
+    caption = (update.message.caption or None) if config["captions"] else None
+    content_items.append({
+        "file_id": media["file_id"],
+        "file_type": media["file_type"],
+        "file_unique_id": media["file_unique_id"],
+        "order": len(content_items),
+        "caption": caption,
+    })
+    flow["content_items"] = content_items
+    context.user_data[config["flow_key"]] = flow
+    caption_msg = " (با کپشن)" if caption else ""
+    await update.message.reply_text(
+        f"محتوای {len(content_items)} ثبت شد{caption_msg}.\n"
+        "می‌توانید محتوای دیگری ارسال کنید یا دکمه «پایان ✅» را بزنید.",
+        reply_markup=config["content_markup"],
+    )
+    return config["add_content_state"]
+
+
+async def _finish_section_item(query, context: ContextTypes.DEFAULT_TYPE, section: str) -> int:
+    """Save the item collected by the creation flow and pre-build its delivery plan."""
+    config = ADMIN_SECTIONS[section]
+    label = SECTIONS[section].label
+    flow = context.user_data.get(config["flow_key"]) or {}
+    title = flow.get("title")
+    description = flow.get("description")
+    if not title or not description:
+        await query.answer(f"اطلاعات {label} ناقص است.", show_alert=True)
+        return config["add_content_state"]
+
+    item_id = database.create_section_item(
+        section, title, description, flow.get("cover_photo_file_id")
+    )
+    for item in flow.get("content_items", []):
+        database.add_section_content(
+            section,
+            item_id,
+            item["file_id"],
+            item["file_type"],
+            item["order"],
+            caption=item.get("caption"),
+            file_unique_id=item.get("file_unique_id"),
+        )
+    build_delivery_plan(section, item_id)
+
+    context.user_data.pop(config["flow_key"], None)
+    await query.answer(f"{label} با موفقیت ثبت شد ✅", show_alert=False)
+    await config["show_menu"](query, context, status=f"{label} جدید ثبت شد ✅")
+    return config["menu_state"]
+
+
 def create_admin_conversation() -> ConversationHandler:
     private_text = filters.ChatType.PRIVATE & filters.TEXT
 
@@ -3111,9 +3220,29 @@ def create_admin_conversation() -> ConversationHandler:
                 CallbackQueryHandler(
                     admin_panel_broadcast_callback, pattern="^broadcast:"
                 ),
+                CallbackQueryHandler(
+                    admin_scheduled_broadcasts_callback, pattern="^schedule:"
+                ),
             ],
             ADMIN_PANEL_BROADCAST_MESSAGE: [
-                MessageHandler(private_text & ~filters.COMMAND, admin_broadcast_message),
+                MessageHandler(
+                    filters.ChatType.PRIVATE & ~filters.COMMAND, admin_broadcast_message
+                ),
+                CallbackQueryHandler(
+                    admin_broadcast_album_callback, pattern="^broadcast:send_album$"
+                ),
+                CallbackQueryHandler(
+                    admin_broadcast_dispatch_callback,
+                    pattern="^broadcast:(send_now|schedule)$",
+                ),
+                CallbackQueryHandler(
+                    admin_broadcast_cancel_callback, pattern="^broadcast:cancel$"
+                ),
+            ],
+            ADMIN_PANEL_BROADCAST_SCHEDULE: [
+                MessageHandler(
+                    private_text & ~filters.COMMAND, admin_broadcast_schedule_time
+                ),
                 CallbackQueryHandler(
                     admin_broadcast_cancel_callback, pattern="^broadcast:cancel$"
                 ),
@@ -3302,6 +3431,10 @@ def create_admin_conversation() -> ConversationHandler:
 
 __all__ = [
     "admin_broadcast_message",
+    "admin_broadcast_album_callback",
+    "admin_broadcast_dispatch_callback",
+    "admin_broadcast_schedule_time",
+    "admin_scheduled_broadcasts_callback",
     "admin_cancel",
     "admin_panel_entry",
     "create_admin_conversation",
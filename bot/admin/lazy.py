@@ -0,0 +1,106 @@
+"""Deferred loading of the admin console.
+
+``bot.admin.conversation`` is by far the largest module of the bot and only
+admins ever reach it. ``LazyAdminConversation`` takes its place in the
+handler list and imports it on the first ``/panel`` or admin-button update,
+or earlier when ``warm_up_admin`` runs shortly after startup. Callbacks of
+the admin module used outside the conversation go through
+``lazy_admin_callback``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+import logging
+import time
+from types import ModuleType
+from typing import Any, Awaitable, Callable, Optional
+
+from telegram import Update
+from telegram.ext import Application, BaseHandler, ContextTypes, ConversationHandler, filters
+
+ADMIN_MODULE = "bot.admin.conversation"
+# Must match the entry points built by create_admin_conversation
+ADMIN_ENTRY_FILTER = filters.ChatType.PRIVATE & (
+    filters.Regex("^/panel(@\\w+)?(\\s|$)") | filters.Regex("^🛠️ پنل ادمین$")
+)
+
+_module: Optional[ModuleType] = None
+
+
+def load_admin_module() -> ModuleType:
+    global _module
+    if _module is None:
+        started = time.perf_counter()
+        _module = importlib.import_module(ADMIN_MODULE)
+        logging.info(
+            "Loaded admin console in %.1f ms", (time.perf_counter() - started) * 1000
+        )
+    return _module
+
+
+def lazy_admin_callback(name: str) -> Callable[[Update, ContextTypes.DEFAULT_TYPE], Awaitable[Any]]:
+    """Handler callback that resolves ``name`` in the admin module when first called."""
+
+    async def callback(update: Update, context: ContextTypes.DEFAULT_TYPE) -> Any:
+        return await getattr(load_admin_module(), name)(update, context)
+
+    callback.__qualname__ = f"lazy_admin_callback.{name}"
+    return callback
+
+
+class LazyAdminConversation(BaseHandler[Update, ContextTypes.DEFAULT_TYPE]):
+    """Placeholder for the admin ConversationHandler until it is needed."""
+
+    __slots__ = ("conversation",)
+
+    def __init__(self) -> None:
+        super().__init__(self._unused)
+        self.conversation: Optional[ConversationHandler] = None
+
+    @staticmethod
+    async def _unused(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+        raise RuntimeError("LazyAdminConversation delegates every update")
+
+    def load(self) -> ConversationHandler:
+        if self.conversation is None:
+            self.conversation = load_admin_module().create_admin_conversation()
+            self.block = self.conversation.block
+        return self.conversation
+
+    def check_update(self, update: object) -> Any:
+        if self.conversation is None:
+            # Nobody can be inside a conversation that was never built
+            if not isinstance(update, Update) or not update.effective_message:
+                return None
+            if not ADMIN_ENTRY_FILTER.check_update(update):
+                return None
+            self.load()
+        return self.conversation.check_update(update)
+
+    async def handle_update(
+        self,
+        update: Update,
+        application: Application,
+        check_result: Any,
+        context: ContextTypes.DEFAULT_TYPE,
+    ) -> Any:
+        return await self.load().handle_update(update, application, check_result, context)
+
+
+async def warm_up_admin(context: ContextTypes.DEFAULT_TYPE) -> None:
+    """JobQueue callback importing the admin console once startup is over."""
+    await asyncio.to_thread(load_admin_module)
+    for handlers in context.application.handlers.values():
+        for handler in handlers:
+            if isinstance(handler, LazyAdminConversation):
+                handler.load()
+
+
+__all__ = [
+    "LazyAdminConversation",
+    "lazy_admin_callback",
+    "load_admin_module",
+    "warm_up_admin",
+]
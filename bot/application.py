@@ -1,21 +1,137 @@
 """Application factory for the Telegram bot."""
 
 import os
+from typing import Optional, Tuple
 
 from telegram.ext import Application
 
+from .admin.lazy import warm_up_admin
+from .constants import (
+    ADMIN_NOTIFY_RETRY_INTERVAL,
+    ADMIN_WARMUP_DELAY,
+    CACHE_REFRESH_INTERVAL,
+    CONTENT_ROLLUP_INTERVAL,
+    LEADER_RENEW_INTERVAL,
+    MAINTENANCE_CHECKPOINT_INTERVAL,
+    MAINTENANCE_OPTIMIZE_INTERVAL,
+    MEDIA_VALIDATION_INTERVAL,
+)
+from .config import get_bot_timezone, get_maintenance_window
 from .errors import handle_error
 from .handlers import register_handlers
+from .health import TrackedRequest, health
+from .leader import leader, leader_only, maintain_leadership, start_leader_election
+from .logs import UnboundJobQueue, UpdateContextApplication
+from .maintenance import checkpoint_database, nightly_maintenance, optimize_database
+from .media import validate_media_assets
+from .notifications import retry_failed_admin_notifications
+from .throttle import throttle
+from .utils import refresh_shared_caches
+from .views import roll_up_content_events, view_buffer
 
 
-def create_application(token: str) -> Application:
-    application = Application.builder().token(token).build()
+async def _post_init(application: Application) -> None:
+    await view_buffer.start()
+    await start_leader_election(application)
+    await health.start(application)
+
+
+async def _post_shutdown(application: Application) -> None:
+    await view_buffer.stop()
+    await leader.release()
+    await health.stop()
+
+
+def create_application(
+    token: str,
+    *,
+    updater: bool = True,
+    health_address: Optional[Tuple[str, int]] = None,
+) -> Application:
+    """Build the bot application.
+
+    Cluster workers pass ``updater=False`` because their updates come from
+    the ingress process. ``health_address`` enables the health endpoint
+    (``bot/health.py``) on that host and port. Jobs that must run once per deployment are
+    registered everywhere but only fire in the process holding the leader
+    lease (``bot/leader.py``).
+    """
+    builder = (
+        Application.builder()
+        .application_class(UpdateContextApplication)
+        .job_queue(UnboundJobQueue())
+        .token(token)
+        .post_init(_post_init)
+        .post_shutdown(_post_shutdown)
+    )
+    if updater:
+        # Same pool size as the default getUpdates request
+        builder = builder.get_updates_request(TrackedRequest(connection_pool_size=1))
+    else:
+        builder = builder.updater(None)
+    health.address = health_address
+    health.polling = updater
+    health.metrics["throttle"] = throttle.metrics
+    application = builder.build()
     require_phone_env = os.getenv("REQUIRE_PHONE_DEFAULT", "").strip().lower()
     phone_required = require_phone_env in {"1", "true", "yes", "on"}
     application.bot_data.setdefault("require_phone", phone_required)
 
     register_handlers(application)
     application.add_error_handler(handle_error)
+
+    if application.job_queue is not None:
+        application.job_queue.run_once(
+            warm_up_admin, when=ADMIN_WARMUP_DELAY, name="admin_warm_up"
+        )
+        application.job_queue.run_repeating(
+            refresh_shared_caches,
+            interval=CACHE_REFRESH_INTERVAL,
+            first=CACHE_REFRESH_INTERVAL,
+            name="shared_cache_refresh",
+        )
+        application.job_queue.run_repeating(
+            maintain_leadership,
+            interval=LEADER_RENEW_INTERVAL,
+            first=LEADER_RENEW_INTERVAL,
+            name="leader_lease",
+        )
+        application.job_queue.run_repeating(
+            leader_only(retry_failed_admin_notifications),
+            interval=ADMIN_NOTIFY_RETRY_INTERVAL,
+            first=ADMIN_NOTIFY_RETRY_INTERVAL,
+            name="admin_notification_retry",
+        )
+        application.job_queue.run_repeating(
+            leader_only(roll_up_content_events),
+            interval=CONTENT_ROLLUP_INTERVAL,
+            first=CONTENT_ROLLUP_INTERVAL,
+            name="content_events_rollup",
+        )
+        application.job_queue.run_repeating(
+            leader_only(validate_media_assets),
+            interval=MEDIA_VALIDATION_INTERVAL,
+            first=MEDIA_VALIDATION_INTERVAL,
+            name="media_validation",
+        )
+        application.job_queue.run_repeating(
+            leader_only(checkpoint_database),
+            interval=MAINTENANCE_CHECKPOINT_INTERVAL,
+            first=MAINTENANCE_CHECKPOINT_INTERVAL,
+            name="db_checkpoint",
+        )
+        application.job_queue.run_repeating(
+            leader_only(optimize_database),
+            interval=MAINTENANCE_OPTIMIZE_INTERVAL,
+            first=MAINTENANCE_OPTIMIZE_INTERVAL,
+            name="db_optimize",
+        )
+        window_start, _ = get_maintenance_window()
+        application.job_queue.run_daily(
+            leader_only(nightly_maintenance),
+            time=window_start.replace(tzinfo=get_bot_timezone()),
+            name="db_nightly_maintenance",
+        )
     return application
 
 
@@ -0,0 +1,178 @@
+"""Online database snapshots: paged backup, gzip rotation and restore checks.
+
+Snapshots are taken with SQLite's backup API while the bot keeps serving
+(``database.backup_database``), compressed to ``bot-YYYYmmdd-HHMMSS.sqlite3.gz``
+in ``BACKUP_DIR`` and rotated down to ``BACKUP_KEEP`` files. Every new
+snapshot is restored into a temporary file and checked before it counts as
+good.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import logging
+import shutil
+import sqlite3
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List
+
+from telegram import Update
+from telegram.ext import ContextTypes
+
+import database
+from .config import get_backup_dir, get_backup_keep
+from .constants import BACKUP_MAX_RESTARTS, BACKUP_PAGES_PER_STEP, BACKUP_STEP_PAUSE
+from .utils import is_admin_user
+
+SNAPSHOT_PREFIX = "bot-"
+SNAPSHOT_SUFFIX = ".sqlite3.gz"
+# Tables a restored snapshot must contain to be usable
+REQUIRED_TABLES = ("users", "admins", "bot_settings")
+
+_backup_lock = asyncio.Lock()
+
+
+def list_snapshots(directory: Path) -> List[Path]:
+    """Snapshots in ``directory``, newest first."""
+    if not directory.exists():
+        return []
+    return sorted(directory.glob(f"{SNAPSHOT_PREFIX}*{SNAPSHOT_SUFFIX}"), reverse=True)
+
+
+def rotate_snapshots(directory: Path, keep: int) -> int:
+    removed = 0
+    for path in list_snapshots(directory)[keep:]:
+        path.unlink(missing_ok=True)
+        removed += 1
+    return removed
+
+
+def create_snapshot(directory: Path, keep: int) -> Dict[str, Any]:
+    """Back up, compress and rotate; blocking, so call it from a thread."""
+    directory.mkdir(parents=True, exist_ok=True)
+    name = f"{SNAPSHOT_PREFIX}{datetime.now():%Y%m%d-%H%M%S}{SNAPSHOT_SUFFIX}"
+    final = directory / name
+    raw = directory / f".{name}.raw"
+    partial = directory / f".{name}.partial"
+    started = time.perf_counter()
+    try:
+        stats = database.backup_database(
+            raw, BACKUP_PAGES_PER_STEP, BACKUP_STEP_PAUSE, BACKUP_MAX_RESTARTS
+        )
+        with raw.open("rb") as source, gzip.open(partial, "wb", compresslevel=6) as target:
+            shutil.copyfileobj(source, target, 1024 * 1024)
+        raw_bytes = raw.stat().st_size
+        # Only complete snapshots ever carry the final name
+        partial.replace(final)
+    finally:
+        raw.unlink(missing_ok=True)
+        partial.unlink(missing_ok=True)
+    return {
+        "path": str(final),
+        "duration": time.perf_counter() - started,
+        "db_bytes": raw_bytes,
+        "compressed_bytes": final.stat().st_size,
+        "removed": rotate_snapshots(directory, keep),
+        **stats,
+    }
+
+
+def verify_snapshot(path: Path) -> Dict[str, Any]:
+    """Restore ``path`` into a temporary file and check it can serve the bot."""
+    with tempfile.TemporaryDirectory() as tmp:
+        restored = Path(tmp) / "restored.sqlite3"
+        with gzip.open(path, "rb") as source, restored.open("wb") as target:
+            shutil.copyfileobj(source, target, 1024 * 1024)
+        conn = sqlite3.connect(f"file:{restored}?mode=ro", uri=True)
+        try:
+            integrity = conn.execute("PRAGMA integrity_check").fetchone()[0]
+            tables = {
+                row[0]
+                for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+            }
+            counts = {
+                table: conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                for table in REQUIRED_TABLES
+                if table in tables
+            }
+        finally:
+            conn.close()
+    missing = [table for table in REQUIRED_TABLES if table not in tables]
+    return {
+        "ok": integrity == "ok" and not missing,
+        "integrity": integrity,
+        "missing_tables": missing,
+        "row_counts": counts,
+    }
+
+
+async def run_backup() -> Dict[str, Any]:
+    """Take, rotate and verify one snapshot; concurrent calls wait their turn."""
+    async with _backup_lock:
+        result = await asyncio.to_thread(create_snapshot, get_backup_dir(), get_backup_keep())
+        result["verification"] = await asyncio.to_thread(verify_snapshot, Path(result["path"]))
+    level = logging.INFO if result["verification"]["ok"] else logging.ERROR
+    logging.log(
+        level,
+        "Backup %s: %.1fs, %d -> %d bytes, %d restarts, verification %s",
+        result["path"],
+        result["duration"],
+        result["db_bytes"],
+        result["compressed_bytes"],
+        result["restarts"],
+        result["verification"],
+    )
+    return result
+
+
+def format_backup_result(result: Dict[str, Any]) -> str:
+    mib = 1024 * 1024
+    verification = result["verification"]
+    if verification["ok"]:
+        check = "✅ بازیابی آزمایشی موفق بود."
+    else:
+        check = (
+            "❌ بازیابی آزمایشی ناموفق بود: "
+            f"{verification['integrity']} {', '.join(verification['missing_tables'])}".strip()
+        )
+    return "\n".join([
+        "💾 نسخه پشتیبان تهیه شد.",
+        f"- فایل: {Path(result['path']).name}",
+        f"- مدت: {result['duration']:.1f} ثانیه",
+        f"- حجم: {result['db_bytes'] / mib:.1f} MB (فشرده: {result['compressed_bytes'] / mib:.1f} MB)",
+        f"- کاربران: {verification['row_counts'].get('users', 0)}",
+        check,
+    ])
+
+
+async def handle_backup_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """/backup: admins take a snapshot on demand."""
+    user = update.effective_user
+    if not user or not update.message or not is_admin_user(user.id):
+        return
+    if _backup_lock.locked():
+        await update.message.reply_text("⏳ یک پشتیبان‌گیری در حال انجام است؛ صبر کنید.")
+    else:
+        await update.message.reply_text("⏳ در حال تهیه نسخه پشتیبان...")
+    try:
+        result = await run_backup()
+    except (OSError, sqlite3.Error) as exc:
+        logging.exception("Backup failed")
+        await update.message.reply_text(f"❌ پشتیبان‌گیری ناموفق بود: {exc}")
+        return
+    await update.message.reply_text(format_backup_result(result))
+
+
+__all__ = [
+    "create_snapshot",
+    "format_backup_result",
+    "handle_backup_command",
+    "list_snapshots",
+    "rotate_snapshots",
+    "run_backup",
+    "verify_snapshot",
+]
@@ -0,0 +1,97 @@
+"""Broadcast engine streaming audience segments from the database."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, Dict, Iterable, Optional, Sequence
+
+from telegram import Bot
+from telegram.error import TelegramError
+
+import database
+from .constants import BROADCAST_PAGE_SIZE
+from .delivery import record_delivery_failure
+from .logs import log_sampled
+
+
+def make_copy_sender(
+    bot: Bot, from_chat_id: int, message_ids: Sequence[int]
+) -> Callable[[int], Awaitable[object]]:
+    """Build a per-recipient sender copying the source message(s).
+
+    Only the source chat and message ids are sent per recipient, so the
+    request size is the same whatever media the message carries. Several ids
+    (an album) are copied together so they stay grouped.
+    """
+    message_ids = list(message_ids)
+    if len(message_ids) == 1:
+        async def send(chat_id: int) -> object:
+            return await bot.copy_message(
+                chat_id=chat_id, from_chat_id=from_chat_id, message_id=message_ids[0]
+            )
+    else:
+        async def send(chat_id: int) -> object:
+            return await bot.copy_messages(
+                chat_id=chat_id, from_chat_id=from_chat_id, message_ids=message_ids
+            )
+    return send
+
+
+async def run_broadcast(
+    segment: Iterable[tuple],
+    send: Callable[[int], Awaitable[object]],
+    *,
+    spread_seconds: float = 0,
+) -> Dict[str, int]:
+    """Call ``send`` for every user in ``segment`` and return delivery counts.
+
+    Recipients are read one keyset page at a time, so memory use does not
+    depend on the audience size. Users known to be unreachable are skipped,
+    and users found to be unreachable are marked so later broadcasts skip them.
+    With ``spread_seconds`` the sends are paced evenly over that window.
+    """
+    segment = tuple(segment)
+    delay = 0.0
+    if spread_seconds > 0:
+        audience = await asyncio.to_thread(database.count_segment, segment)
+        delay = spread_seconds / audience if audience else 0.0
+    sent = 0
+    failed = 0
+    pruned = 0
+    after_id: Optional[int] = None
+    while True:
+        user_ids = await asyncio.to_thread(
+            database.list_segment_user_ids, segment, after_id, BROADCAST_PAGE_SIZE
+        )
+        if not user_ids:
+            break
+        for user_id in user_ids:
+            try:
+                await send(user_id)
+                sent += 1
+            except TelegramError as exc:
+                # Counted in the summary; a sample is enough to see the causes
+                log_sampled(logging.WARNING, "Failed to broadcast to %s: %s", user_id, exc)
+                if record_delivery_failure(user_id, exc):
+                    pruned += 1
+                failed += 1
+            if delay:
+                await asyncio.sleep(delay)
+        after_id = user_ids[-1]
+    return {"total": sent + failed, "sent": sent, "failed": failed, "pruned": pruned}
+
+
+def format_broadcast_summary(label: str, result: Dict[str, int]) -> str:
+    return "\n".join(
+        [
+            f"پیام برای «{label}» ارسال شد.",
+            f"کل مخاطبان: {result['total']}",
+            f"موفق: {result['sent']}",
+            f"ناموفق: {result['failed']}",
+            f"کاربران غیرقابل دسترس (حذف از ارسال‌های بعدی): {result['pruned']}",
+        ]
+    )
+
+
+__all__ = ["format_broadcast_summary", "make_copy_sender", "run_broadcast"]
@@ -0,0 +1,217 @@
+"""Multi-process deployment: one ingress process feeding N bot workers.
+
+The ingress long-polls ``getUpdates`` and routes every update to a worker
+chosen by hashing its user id, so all updates of one user land on the same
+worker. Each worker is a full ``Application`` without an updater; it
+processes its inbox in arrival order, which preserves per-user ordering.
+Workers share the SQLite database, keep their in-process caches in sync
+through the version rows in ``bot_settings`` and elect the one that runs the
+singleton jobs through ``bot.leader``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import signal
+from typing import Any, Callable, Dict, List, Optional
+
+from telegram import Bot, Update
+from telegram.error import RetryAfter, TelegramError
+
+from .config import get_health_address
+from .constants import INGRESS_POLL_TIMEOUT, WORKER_INBOX_SIZE
+from .health import health
+
+ALLOWED_UPDATES = ["message", "callback_query"]
+
+# Update fields carrying the acting user, in the order they are checked
+_ROUTED_FIELDS = (
+    "message",
+    "edited_message",
+    "callback_query",
+    "inline_query",
+    "chosen_inline_result",
+    "my_chat_member",
+    "chat_member",
+    "chat_join_request",
+)
+
+
+def route_key(data: Dict[str, Any]) -> int:
+    """Id used to pick a worker: the sender, else the chat, else the update."""
+    for field in _ROUTED_FIELDS:
+        payload = data.get(field)
+        if not payload:
+            continue
+        sender = payload.get("from") or payload.get("chat") or {}
+        if "id" in sender:
+            return int(sender["id"])
+    return int(data.get("update_id", 0))
+
+
+def worker_index(data: Dict[str, Any], workers: int) -> int:
+    return route_key(data) % workers
+
+
+class WorkerPool:
+    """Processes with one FIFO inbox each; dead workers are restarted on their inbox."""
+
+    def __init__(self, target: Callable, workers: int, args: tuple = ()) -> None:
+        self._context = multiprocessing.get_context("spawn")
+        self.target = target
+        self.args = args
+        self.inboxes = [
+            self._context.Queue(maxsize=WORKER_INBOX_SIZE) for _ in range(workers)
+        ]
+        self.processes: List[Optional[multiprocessing.Process]] = [None] * workers
+
+    def _spawn(self, index: int) -> None:
+        process = self._context.Process(
+            target=self.target,
+            args=(index, self.inboxes[index], *self.args),
+            name=f"bot-worker-{index}",
+            daemon=True,
+        )
+        process.start()
+        self.processes[index] = process
+
+    def start(self) -> None:
+        for index in range(len(self.inboxes)):
+            self._spawn(index)
+
+    def dispatch(self, data: Dict[str, Any]) -> int:
+        index = worker_index(data, len(self.inboxes))
+        self.inboxes[index].put(data)
+        return index
+
+    def supervise(self) -> None:
+        for index, process in enumerate(self.processes):
+            if process is not None and not process.is_alive():
+                logging.error(
+                    "Worker %d exited with %s; restarting", index, process.exitcode
+                )
+                self._spawn(index)
+
+    def alive(self) -> int:
+        return sum(1 for process in self.processes if process is not None and process.is_alive())
+
+    def stop(self, timeout: float = 10.0) -> None:
+        for inbox in self.inboxes:
+            inbox.put(None)
+        for process in self.processes:
+            if process is None:
+                continue
+            process.join(timeout)
+            if process.is_alive():
+                # Workers ignore SIGTERM, so a stuck one has to be killed
+                process.kill()
+
+
+def _bootstrap_process() -> None:
+    import database
+    from .config import configure_channel, get_slow_query_seconds, load_env
+    from .logs import configure_logging
+
+    load_env()
+    database.set_slow_query_threshold(get_slow_query_seconds())
+    database.load_settings()
+    database.load_admins()
+    configure_channel()
+    configure_logging()
+
+
+async def _serve_worker(index: int, inbox: Any, token: str) -> None:
+    from .application import create_application
+
+    address = get_health_address()
+    if address is not None:
+        address = (address[0], address[1] + 1 + index)
+    application = create_application(token, updater=False, health_address=address)
+    async with application:
+        await application.post_init(application)
+        await application.start()
+        logging.info("Worker %d ready", index)
+        try:
+            while True:
+                data = await asyncio.to_thread(inbox.get)
+                if data is None:
+                    break
+                await application.update_queue.put(Update.de_json(data, application.bot))
+            # Let queued updates finish before stopping
+            while not application.update_queue.empty():
+                await asyncio.sleep(0.1)
+        finally:
+            await application.stop()
+            await application.post_shutdown(application)
+
+
+def run_worker(index: int, inbox: Any, token: str) -> None:
+    """Entry point of a worker process."""
+    _bootstrap_process()
+    # The ingress coordinates shutdown through the inbox sentinel. Supervisors
+    # signal the whole process group, and a worker dying on SIGTERM would skip
+    # post_shutdown: buffered views lost and the leader lease left to expire.
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, signal.SIG_IGN)
+    asyncio.run(_serve_worker(index, inbox, token))
+
+
+async def _poll(bot: Bot, pool: WorkerPool, stop: asyncio.Event) -> None:
+    offset: Optional[int] = None
+    async with bot:
+        await bot.delete_webhook(drop_pending_updates=True)
+        while not stop.is_set():
+            pool.supervise()
+            try:
+                updates = await bot.get_updates(
+                    offset=offset,
+                    timeout=INGRESS_POLL_TIMEOUT,
+                    allowed_updates=ALLOWED_UPDATES,
+                )
+            except RetryAfter as exc:
+                await asyncio.sleep(exc.retry_after)
+                continue
+            except TelegramError as exc:
+                logging.warning("getUpdates failed: %s", exc)
+                await asyncio.sleep(1)
+                continue
+            health.mark_get_updates()
+            for update in updates:
+                # A full inbox blocks only the ingress, never other workers' backlog
+                await asyncio.to_thread(pool.dispatch, update.to_dict())
+                offset = update.update_id + 1
+
+
+def run_cluster(token: str, workers: int) -> None:
+    """Run the ingress in this process and ``workers`` bot worker processes."""
+    pool = WorkerPool(run_worker, workers, args=(token,))
+    pool.start()
+    logging.info("Started %d bot workers", workers)
+
+    async def main() -> None:
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(signum, stop.set)
+        health.address = get_health_address()
+        health.polling = True
+        health.details = lambda: (
+            {"workers": len(pool.processes), "workers_alive": pool.alive()},
+            [] if pool.alive() == len(pool.processes) else ["workers"],
+        )
+        await health.start()
+        poller = asyncio.create_task(_poll(Bot(token), pool, stop))
+        await stop.wait()
+        poller.cancel()
+        await asyncio.gather(poller, return_exceptions=True)
+        await health.stop()
+
+    try:
+        asyncio.run(main())
+    finally:
+        pool.stop()
+
+
+__all__ = ["WorkerPool", "route_key", "run_cluster", "run_worker", "worker_index"]
@@ -2,13 +2,30 @@
 
 from __future__ import annotations
 
+import logging
 import os
+from datetime import datetime, time
 from pathlib import Path
-from typing import Optional, Tuple, Union
+from typing import Dict, Optional, Tuple, Union
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 CHANNEL_INVITE_LINK: str = ""
 CHANNEL_CHAT_IDENTIFIER: Optional[Union[int, str]] = None
 
+DEFAULT_CONTENT_EVENTS_RETENTION_DAYS = 90
+DEFAULT_BOT_TIMEZONE = "Asia/Tehran"
+DEFAULT_BROADCAST_SPREAD_SECONDS = 600
+DEFAULT_BOT_WORKERS = 1
+DEFAULT_MAINTENANCE_WINDOW = "03:00-05:00"
+DEFAULT_BACKUP_DIR = Path(__file__).resolve().parent.parent / "backups"
+DEFAULT_BACKUP_KEEP = 7
+DEFAULT_LOG_LEVELS = "httpx=WARNING,apscheduler=WARNING"
+DEFAULT_LOG_SAMPLE_RATE = 0.01
+DEFAULT_SLOW_QUERY_MS = 200
+DEFAULT_HEALTH_HOST = "127.0.0.1"
+DEFAULT_HEALTH_MAX_LAG_MS = 1000
+LOG_FORMATS = ("json", "text")
+
 
 def load_env() -> None:
     """Load key/value pairs from the project .env file into os.environ."""
@@ -33,6 +50,168 @@ def get_bot_token() -> str:
     return token
 
 
+def get_content_events_retention_days() -> int:
+    """Days of raw content events to keep once they are rolled up."""
+    raw = os.getenv("CONTENT_EVENTS_RETENTION_DAYS", "").strip()
+    if not raw:
+        return DEFAULT_CONTENT_EVENTS_RETENTION_DAYS
+    try:
+        return max(1, int(raw))
+    except ValueError as exc:
+        raise RuntimeError(
+            "CONTENT_EVENTS_RETENTION_DAYS must be a whole number of days."
+        ) from exc
+
+
+def get_bot_timezone() -> ZoneInfo:
+    """Timezone used to interpret times typed by admins."""
+    name = os.getenv("BOT_TIMEZONE", "").strip() or DEFAULT_BOT_TIMEZONE
+    try:
+        return ZoneInfo(name)
+    except ZoneInfoNotFoundError as exc:
+        raise RuntimeError(
+            f"BOT_TIMEZONE '{name}' is not a known timezone (install tzdata on Windows)."
+        ) from exc
+
+
+def get_broadcast_spread_seconds() -> int:
+    """Window over which scheduled broadcasts spread their sends."""
+    raw = os.getenv("BROADCAST_SPREAD_SECONDS", "").strip()
+    if not raw:
+        return DEFAULT_BROADCAST_SPREAD_SECONDS
+    try:
+        return max(0, int(raw))
+    except ValueError as exc:
+        raise RuntimeError("BROADCAST_SPREAD_SECONDS must be a whole number.") from exc
+
+
+def get_bot_workers() -> int:
+    """Worker processes behind the update ingress; 1 runs the classic single process."""
+    raw = os.getenv("BOT_WORKERS", "").strip()
+    if not raw:
+        return DEFAULT_BOT_WORKERS
+    try:
+        return max(1, int(raw))
+    except ValueError as exc:
+        raise RuntimeError("BOT_WORKERS must be a whole number.") from exc
+
+
+def get_maintenance_window() -> Tuple[time, time]:
+    """Daily ``HH:MM-HH:MM`` window (bot timezone) for heavy database upkeep."""
+    raw = os.getenv("MAINTENANCE_WINDOW", "").strip() or DEFAULT_MAINTENANCE_WINDOW
+    try:
+        start, end = (datetime.strptime(part.strip(), "%H:%M").time() for part in raw.split("-"))
+    except ValueError as exc:
+        raise RuntimeError("MAINTENANCE_WINDOW must look like 03:00-05:00.") from exc
+    if start == end:
+        raise RuntimeError("MAINTENANCE_WINDOW must not be empty.")
+    return start, end
+
+
+def get_backup_dir() -> Path:
+    """Directory holding the compressed database snapshots."""
+    raw = os.getenv("BACKUP_DIR", "").strip()
+    return Path(raw).expanduser() if raw else DEFAULT_BACKUP_DIR
+
+
+def get_backup_keep() -> int:
+    """Number of snapshots kept by rotation."""
+    raw = os.getenv("BACKUP_KEEP", "").strip()
+    if not raw:
+        return DEFAULT_BACKUP_KEEP
+    try:
+        return max(1, int(raw))
+    except ValueError as exc:
+        raise RuntimeError("BACKUP_KEEP must be a whole number.") from exc
+
+
+def _parse_level(name: str, source: str) -> int:
+    level = logging.getLevelName(name.strip().upper())
+    if not isinstance(level, int):
+        raise RuntimeError(f"{source}: unknown log level '{name}'.")
+    return level
+
+
+def get_log_level() -> int:
+    """Level applied to modules without an entry in LOG_LEVELS."""
+    return _parse_level(os.getenv("LOG_LEVEL", "").strip() or "INFO", "LOG_LEVEL")
+
+
+def get_log_levels() -> Dict[str, int]:
+    """Per-module levels from ``LOG_LEVELS=name=LEVEL,...``.
+
+    Names match logger names (``httpx``, ``telegram.ext``) and, for the
+    bot's own root-logger calls, module names (``menu``, ``broadcast``).
+    """
+    raw = os.getenv("LOG_LEVELS")
+    raw = DEFAULT_LOG_LEVELS if raw is None else raw
+    levels: Dict[str, int] = {}
+    for item in filter(None, (part.strip() for part in raw.split(","))):
+        name, sep, level = item.partition("=")
+        if not sep or not name.strip():
+            raise RuntimeError("LOG_LEVELS must look like httpx=WARNING,menu=DEBUG.")
+        levels[name.strip()] = _parse_level(level, "LOG_LEVELS")
+    return levels
+
+
+def get_log_format() -> str:
+    value = os.getenv("LOG_FORMAT", "").strip().lower() or LOG_FORMATS[0]
+    if value not in LOG_FORMATS:
+        raise RuntimeError(f"LOG_FORMAT must be one of: {', '.join(LOG_FORMATS)}.")
+    return value
+
+
+def get_log_sample_rate() -> float:
+    """Share of hot-path log lines that are kept."""
+    raw = os.getenv("LOG_SAMPLE_RATE", "").strip()
+    if not raw:
+        return DEFAULT_LOG_SAMPLE_RATE
+    try:
+        rate = float(raw)
+    except ValueError as exc:
+        raise RuntimeError("LOG_SAMPLE_RATE must be a number between 0 and 1.") from exc
+    if not 0 <= rate <= 1:
+        raise RuntimeError("LOG_SAMPLE_RATE must be a number between 0 and 1.")
+    return rate
+
+
+def get_slow_query_seconds() -> Optional[float]:
+    """Threshold of the slow-query log; ``SLOW_QUERY_MS=0`` turns it off."""
+    raw = os.getenv("SLOW_QUERY_MS", "").strip()
+    if not raw:
+        return DEFAULT_SLOW_QUERY_MS / 1000
+    try:
+        value = int(raw)
+    except ValueError as exc:
+        raise RuntimeError("SLOW_QUERY_MS must be a whole number of milliseconds.") from exc
+    return value / 1000 if value > 0 else None
+
+
+def get_health_address() -> Optional[Tuple[str, int]]:
+    """Host and port of the health endpoint; None when HEALTH_PORT is unset."""
+    raw = os.getenv("HEALTH_PORT", "").strip()
+    if not raw:
+        return None
+    try:
+        port = int(raw)
+    except ValueError as exc:
+        raise RuntimeError("HEALTH_PORT must be a port number.") from exc
+    if not 0 < port < 65536:
+        raise RuntimeError("HEALTH_PORT must be a port number.")
+    return os.getenv("HEALTH_HOST", "").strip() or DEFAULT_HEALTH_HOST, port
+
+
+def get_health_max_lag() -> float:
+    """Event-loop lag in seconds above which the bot reports not ready."""
+    raw = os.getenv("HEALTH_MAX_LAG_MS", "").strip()
+    if not raw:
+        return DEFAULT_HEALTH_MAX_LAG_MS / 1000
+    try:
+        return max(1, int(raw)) / 1000
+    except ValueError as exc:
+        raise RuntimeError("HEALTH_MAX_LAG_MS must be a whole number of milliseconds.") from exc
+
+
 def configure_channel() -> Tuple[str, Union[int, str]]:
     """Populate global channel configuration from environment variables."""
     invite_link, chat_identifier = load_channel_configuration()
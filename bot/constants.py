@@ -1,6 +1,6 @@
 """Shared constants used across bot modules."""
 
-from typing import Dict, Optional
+from typing import Any, Dict, Optional
 
 TEMP_ADMIN_IDS = {234368567}
 
@@ -44,15 +44,110 @@ TEMP_ADMIN_IDS = {234368567}
     ADMIN_PANEL_CONSULTATION_SETTINGS_EDIT_CARD,
     ADMIN_PANEL_CONSULTATION_SETTINGS_EDIT_APPROVAL_MESSAGE,
     ADMIN_PANEL_CONSULTATION_SETTINGS_EDIT_REJECTION_TEMPLATE,
-) = range(36)
+    ADMIN_PANEL_BROADCAST_SCHEDULE,
+) = range(37)
 
 MEMBERSHIP_VERIFY_CALLBACK = "verify_membership"
 
-BROADCAST_OPTIONS: Dict[str, Dict[str, Optional[bool]]] = {
-    "broadcast:all": {"label": "همه کاربران", "filter": None},
-    "broadcast:with_phone": {"label": "کاربران دارای شماره", "filter": True},
-    "broadcast:without_phone": {"label": "کاربران بدون شماره", "filter": False},
+# bot_settings key of the admin phone-requirement toggle ("1"/"0")
+PHONE_REQUIREMENT_SETTING = "require_phone"
+
+# Seconds after startup before the admin console is imported in the background
+ADMIN_WARMUP_DELAY = 5
+
+# Number of items per page in admin inline lists
+ADMIN_LIST_PAGE_SIZE = 10
+
+# Consultation receipt fan-out to admins
+ADMIN_FANOUT_CONCURRENCY = 5
+ADMIN_NOTIFY_RETRY_INTERVAL = 300  # seconds
+ADMIN_NOTIFY_MAX_ATTEMPTS = 5
+
+# How often each process checks the shared cache version rows
+CACHE_REFRESH_INTERVAL = 30  # seconds
+
+# Write-behind buffer for content views
+VIEW_FLUSH_INTERVAL_MS = 500
+VIEW_FLUSH_MAX_EVENTS = 200
+# While flushes fail: pending events kept at most, and the retry backoff cap
+VIEW_BUFFER_MAX_EVENTS = 50000
+VIEW_FLUSH_MAX_BACKOFF_MS = 30000
+CONTENT_ROLLUP_INTERVAL = 300  # seconds
+
+# Background getFile probes of stored media
+MEDIA_VALIDATION_INTERVAL = 60  # seconds
+MEDIA_VALIDATION_BATCH = 10  # probes per tick
+MEDIA_RECHECK_SECONDS = 86400
+
+# Multi-process mode: ingress long-poll timeout and per-worker backlog
+INGRESS_POLL_TIMEOUT = 30  # seconds
+WORKER_INBOX_SIZE = 1000
+
+# Leader lease for jobs that must run once across processes; a leader that
+# misses renewals steps down LEADER_LEASE_MARGIN before its lease expires
+LEADER_LEASE_NAME = "jobs"
+LEADER_LEASE_TTL = 30  # seconds
+LEADER_RENEW_INTERVAL = 10  # seconds
+LEADER_LEASE_MARGIN = 5  # seconds
+
+# SQLite upkeep (bot/maintenance.py); the nightly window is MAINTENANCE_WINDOW
+MAINTENANCE_CHECKPOINT_INTERVAL = 300  # seconds
+MAINTENANCE_OPTIMIZE_INTERVAL = 3600  # seconds
+MAINTENANCE_WAL_TRUNCATE_BYTES = 64 * 1024 * 1024
+MAINTENANCE_VACUUM_STEP_PAGES = 1000
+MAINTENANCE_VACUUM_PAUSE = 0.5  # seconds between vacuum steps
+
+# On-demand profiling (/profile): default and maximum session length
+PROFILE_DEFAULT_SECONDS = 30
+PROFILE_MAX_SECONDS = 300
+PROFILE_MAX_UPDATES = 10000
+PROFILE_TOP_N = 15
+PROFILE_TRACEMALLOC_FRAMES = 1
+
+# Health endpoint (bot/health.py): lag timer period, samples behind the
+# readiness decision, DB ping timeout and how old a getUpdates may be
+HEALTH_LAG_INTERVAL = 1.0  # seconds
+HEALTH_LAG_SAMPLES = 10
+HEALTH_DB_TIMEOUT = 2.0  # seconds
+HEALTH_POLL_STALE_SECONDS = 90
+HEALTH_REQUEST_TIMEOUT = 5.0  # seconds
+
+# Per-user anti-flood token bucket (bot/throttle.py): refill rate in updates
+# per second, burst size, and at most one "slow down" notice per window
+THROTTLE_RATE = 1.0
+THROTTLE_BURST = 8
+THROTTLE_NOTICE_WINDOW = 10  # seconds
+THROTTLE_PRUNE_EVERY = 1000  # updates between sweeps of idle buckets
+THROTTLE_TOP_BLOCKED = 50  # per-user blocked counts kept across sweeps
+
+# Online backups (bot/backup.py); directory and retention come from the env
+BACKUP_PAGES_PER_STEP = 256
+BACKUP_STEP_PAUSE = 0.02  # seconds between backup steps
+BACKUP_MAX_RESTARTS = 3
+
+# Broadcast audiences; "segment" is compiled by database.compile_segment
+BROADCAST_OPTIONS: Dict[str, Dict[str, Any]] = {
+    "broadcast:all": {"label": "همه کاربران", "segment": ()},
+    "broadcast:with_phone": {
+        "label": "کاربران دارای شماره",
+        "segment": (("has_phone", True),),
+    },
+    "broadcast:without_phone": {
+        "label": "کاربران بدون شماره",
+        "segment": (("has_phone", False),),
+    },
+    "broadcast:recent": {
+        "label": "کاربران ۷ روز اخیر",
+        "segment": (("joined_within_days", 7),),
+    },
+    "broadcast:no_consultation": {
+        "label": "بازدیدکنندگان وبینار بدون درخواست مشاوره",
+        "segment": (("viewed", "webinar", None), ("has_consultation", False)),
+    },
 }
+# Prefix of the per-webinar "viewed but no consultation" picker
+BROADCAST_WEBINAR_PREFIX = "broadcast:webinar"
+BROADCAST_PAGE_SIZE = 500
 
 CORE_MENU_BUTTONS = [
     "Case Studies",
@@ -0,0 +1,33 @@
+"""Classification of permanent delivery failures to user chats."""
+
+from __future__ import annotations
+
+import logging
+from typing import Optional
+
+from telegram.error import BadRequest, Forbidden
+
+import database
+
+
+def classify_delivery_error(exc: BaseException) -> Optional[str]:
+    """Map a send error to a delivery state, or None if it may be transient."""
+    message = str(exc).lower()
+    if isinstance(exc, Forbidden):
+        if "deactivated" in message:
+            return database.DELIVERY_DEACTIVATED
+        return database.DELIVERY_BLOCKED
+    if isinstance(exc, BadRequest) and "chat not found" in message:
+        return database.DELIVERY_DEACTIVATED
+    return None
+
+
+def record_delivery_failure(telegram_id: int, exc: BaseException) -> Optional[str]:
+    """Persist the delivery state implied by ``exc``; return it if permanent."""
+    state = classify_delivery_error(exc)
+    if state and database.set_delivery_state(telegram_id, state):
+        logging.info("Marked user %s as %s: %s", telegram_id, state, exc)
+    return state
+
+
+__all__ = ["classify_delivery_error", "record_delivery_failure"]
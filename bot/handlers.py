@@ -1,21 +1,19 @@
 """Handler registration for the Telegram bot."""
 
+from telegram import Update
 from telegram.ext import (
     Application,
     CallbackQueryHandler,
     CommandHandler,
     MessageHandler,
+    TypeHandler,
     filters,
 )
 
-from .admin.conversation import (
-    create_admin_conversation,
-    handle_consultation_approval,
-    handle_consultation_custom_message,
-    handle_consultation_rejection,
-    handle_consultation_rejection_reason,
-)
+from .admin.lazy import LazyAdminConversation, lazy_admin_callback
+from .backup import handle_backup_command
 from .constants import MEMBERSHIP_VERIFY_CALLBACK
+from .logs import bind_update_context
 from .menu import (
     handle_contact,
     handle_consultation_payment_callback,
@@ -27,12 +25,21 @@ from .menu import (
     handle_sendphone_command,
     start,
 )
+from .profiling import count_profiled_update, handle_dbstats_command, handle_profile_command
+from .throttle import throttle_updates
 
 
 def register_handlers(application: Application) -> None:
-    admin_panel_handler = create_admin_conversation()
+    # The admin console is imported on first use (or by the warm-up job)
+    admin_panel_handler = LazyAdminConversation()
     private_text = filters.ChatType.PRIVATE & filters.TEXT
 
+    # Lowest group, so it runs first and every log line carries the update's ids
+    application.add_handler(TypeHandler(Update, bind_update_context), group=-3)
+    # Counts updates for /profile sessions limited to the next N updates
+    application.add_handler(TypeHandler(Update, count_profiled_update), group=-2)
+    # Drops updates of users over their rate before any guard or DB work
+    application.add_handler(TypeHandler(Update, throttle_updates), group=-1)
     application.add_handler(
         CallbackQueryHandler(
             handle_membership_verification,
@@ -59,13 +66,13 @@ def register_handlers(application: Application) -> None:
     )
     application.add_handler(
         CallbackQueryHandler(
-            handle_consultation_approval,
+            lazy_admin_callback("handle_consultation_approval"),
             pattern="^consultation:approve:",
         )
     )
     application.add_handler(
         CallbackQueryHandler(
-            handle_consultation_rejection,
+            lazy_admin_callback("handle_consultation_rejection"),
             pattern="^consultation:reject:",
         )
     )
@@ -75,6 +82,15 @@ def register_handlers(application: Application) -> None:
     application.add_handler(
         CommandHandler("sendphone", handle_sendphone_command, filters=filters.ChatType.PRIVATE)
     )
+    application.add_handler(
+        CommandHandler("backup", handle_backup_command, filters=filters.ChatType.PRIVATE)
+    )
+    application.add_handler(
+        CommandHandler("profile", handle_profile_command, filters=filters.ChatType.PRIVATE)
+    )
+    application.add_handler(
+        CommandHandler("dbstats", handle_dbstats_command, filters=filters.ChatType.PRIVATE)
+    )
     application.add_handler(admin_panel_handler)
     application.add_handler(
         MessageHandler(filters.ChatType.PRIVATE & filters.CONTACT, handle_contact)
@@ -92,13 +108,13 @@ def register_handlers(application: Application) -> None:
     application.add_handler(
         MessageHandler(
             private_text & ~filters.COMMAND,
-            handle_consultation_rejection_reason,
+            lazy_admin_callback("handle_consultation_rejection_reason"),
         )
     )
     application.add_handler(
         MessageHandler(
             filters.ChatType.PRIVATE & ~filters.COMMAND,
-            handle_consultation_custom_message,
+            lazy_admin_callback("handle_consultation_custom_message"),
         )
     )
 
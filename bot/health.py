@@ -0,0 +1,204 @@
+"""Local HTTP health and readiness endpoints.
+
+``GET /healthz`` answers 200 whenever the event loop is responsive and
+reports event-loop lag, update queue depth, the last successful
+``getUpdates``, database round-trip time and pending jobs. ``GET /readyz``
+reports the same but answers 503 while the process should not get traffic:
+lag above ``HEALTH_MAX_LAG_MS`` within the last ``HEALTH_LAG_SAMPLES``
+timer ticks, a failing database ping, or a stale ``getUpdates``. A loop
+wedged on a blocking call does not answer at all, which probes treat as a
+failure too.
+
+Lag is measured by a timer that sleeps ``HEALTH_LAG_INTERVAL`` seconds and
+records how late it wakes up. The server only runs when ``HEALTH_PORT`` is
+set; in multi-process mode the ingress serves that port and worker ``i``
+serves ``HEALTH_PORT + 1 + i``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from collections import deque
+from http import HTTPStatus
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from telegram.ext import Application
+from telegram.request import HTTPXRequest
+
+import database
+from .config import get_health_max_lag
+from .constants import (
+    HEALTH_DB_TIMEOUT,
+    HEALTH_LAG_INTERVAL,
+    HEALTH_LAG_SAMPLES,
+    HEALTH_POLL_STALE_SECONDS,
+    HEALTH_REQUEST_TIMEOUT,
+)
+
+
+class HealthMonitor:
+    """Process-wide health state and the HTTP server exposing it."""
+
+    def __init__(self) -> None:
+        self.address: Optional[Tuple[str, int]] = None
+        self.application: Optional[Application] = None
+        # Extra report fields and problems; the ingress adds worker liveness
+        self.details: Optional[Callable[[], Tuple[Dict[str, Any], List[str]]]] = None
+        # Named counters reported as they are, e.g. the throttle's
+        self.metrics: Dict[str, Callable[[], Dict[str, Any]]] = {}
+        self.polling = False
+        self.last_get_updates: Optional[float] = None
+        self.lag_samples: Deque[float] = deque(maxlen=HEALTH_LAG_SAMPLES)
+        self.max_lag = 0.0
+        self._timer: Optional[asyncio.Task] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    def mark_get_updates(self) -> None:
+        self.last_get_updates = time.time()
+
+    async def _measure_lag(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + HEALTH_LAG_INTERVAL
+            await asyncio.sleep(HEALTH_LAG_INTERVAL)
+            self.lag_samples.append(max(0.0, loop.time() - expected))
+
+    async def start(self, application: Optional[Application] = None) -> None:
+        if self.address is None or self._server is not None:
+            return
+        self.application = application
+        self.max_lag = get_health_max_lag()
+        self._timer = asyncio.create_task(self._measure_lag())
+        host, port = self.address
+        self._server = await asyncio.start_server(self._serve, host, port)
+        logging.info("Health endpoint listening on %s:%d", host, port)
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if self._timer is not None:
+            self._timer.cancel()
+            await asyncio.gather(self._timer, return_exceptions=True)
+            self._timer = None
+
+    async def _database_rtt(self) -> Optional[float]:
+        started = time.perf_counter()
+        try:
+            await asyncio.wait_for(
+                asyncio.to_thread(database.ping_database), HEALTH_DB_TIMEOUT
+            )
+        except Exception as exc:
+            logging.warning("Health check database ping failed: %s", exc)
+            return None
+        return time.perf_counter() - started
+
+    def _jobs(self) -> Dict[str, int]:
+        job_queue = self.application.job_queue if self.application else None
+        if job_queue is None:
+            return {}
+        now = time.time()
+        jobs = job_queue.jobs()
+        # Pending jobs of a scheduler that has not started have no run time yet
+        run_times = (getattr(job.job, "next_run_time", None) for job in jobs)
+        overdue = sum(
+            1 for run_at in run_times if run_at and run_at.timestamp() < now - HEALTH_LAG_INTERVAL
+        )
+        return {"scheduled": len(jobs), "overdue": overdue}
+
+    async def report(self) -> Dict[str, Any]:
+        lag = self.lag_samples[-1] if self.lag_samples else 0.0
+        recent_max = max(self.lag_samples, default=0.0)
+        db_rtt = await self._database_rtt()
+        poll_age = (
+            time.time() - self.last_get_updates if self.last_get_updates is not None else None
+        )
+        problems: List[str] = []
+        if recent_max > self.max_lag:
+            problems.append("event_loop_lag")
+        if db_rtt is None:
+            problems.append("database")
+        if self.polling and (poll_age is None or poll_age > HEALTH_POLL_STALE_SECONDS):
+            problems.append("get_updates")
+        extra: Dict[str, Any] = {}
+        if self.details is not None:
+            extra, extra_problems = self.details()
+            problems.extend(extra_problems)
+
+        report: Dict[str, Any] = {
+            "ready": not problems,
+            "problems": problems,
+            "loop_lag_ms": round(lag * 1000, 1),
+            "loop_lag_max_ms": round(recent_max * 1000, 1),
+            "loop_lag_threshold_ms": round(self.max_lag * 1000),
+            "db_rtt_ms": round(db_rtt * 1000, 1) if db_rtt is not None else None,
+            "last_get_updates_age_s": round(poll_age, 1) if poll_age is not None else None,
+            "tasks": len(asyncio.all_tasks()),
+        }
+        if self.application is not None:
+            report["update_queue"] = self.application.update_queue.qsize()
+            report["jobs"] = self._jobs()
+        for name, collect in self.metrics.items():
+            report[name] = collect()
+        report.update(extra)
+        return report
+
+    async def _respond(self, path: str) -> Tuple[HTTPStatus, Dict[str, Any]]:
+        if path in ("/healthz", "/health"):
+            return HTTPStatus.OK, await self.report()
+        if path in ("/readyz", "/ready"):
+            report = await self.report()
+            status = HTTPStatus.OK if report["ready"] else HTTPStatus.SERVICE_UNAVAILABLE
+            return status, report
+        return HTTPStatus.NOT_FOUND, {"error": "not found"}
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            request_line = await asyncio.wait_for(reader.readline(), HEALTH_REQUEST_TIMEOUT)
+            # Headers carry nothing we need; read them so the client is not reset
+            while True:
+                line = await asyncio.wait_for(reader.readline(), HEALTH_REQUEST_TIMEOUT)
+                if line in (b"\r\n", b"\n", b""):
+                    break
+            parts = request_line.decode("latin-1").split()
+            if len(parts) < 2 or parts[0] not in ("GET", "HEAD"):
+                status, body = HTTPStatus.METHOD_NOT_ALLOWED, {"error": "use GET"}
+            else:
+                try:
+                    status, body = await self._respond(parts[1].split("?", 1)[0])
+                except Exception:
+                    logging.exception("Health report failed")
+                    status, body = HTTPStatus.INTERNAL_SERVER_ERROR, {"error": "report failed"}
+            payload = json.dumps(body).encode("utf-8")
+            head = (
+                f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+                "Content-Type: application/json\r\n"
+                f"Content-Length: {len(payload)}\r\n"
+                "Connection: close\r\n\r\n"
+            ).encode("latin-1")
+            writer.write(head if parts[:1] == ["HEAD"] else head + payload)
+            await writer.drain()
+        except (asyncio.TimeoutError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+class TrackedRequest(HTTPXRequest):
+    """``getUpdates`` request that records each successful poll."""
+
+    async def do_request(self, *args: Any, **kwargs: Any) -> Tuple[int, bytes]:
+        code, payload = await super().do_request(*args, **kwargs)
+        if 200 <= code < 300:
+            health.mark_get_updates()
+        return code, payload
+
+
+health = HealthMonitor()
+
+
+__all__ = ["HealthMonitor", "TrackedRequest", "health"]
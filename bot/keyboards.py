@@ -9,7 +9,12 @@ from telegram import (
 )
 
 from . import config
-from .constants import MEMBERSHIP_VERIFY_CALLBACK, SERVICE_BUTTONS
+from .constants import (
+    BROADCAST_OPTIONS,
+    BROADCAST_WEBINAR_PREFIX,
+    MEMBERSHIP_VERIFY_CALLBACK,
+    SERVICE_BUTTONS,
+)
 
 REQUEST_CONTACT_KEYBOARD = ReplyKeyboardMarkup(
     keyboard=[[KeyboardButton("ارسال شماره موبایل", request_contact=True)]],
@@ -96,6 +101,15 @@ def admin_stats_keyboard() -> InlineKeyboardMarkup:
                     "📥 دانلود لیست کاربران", callback_data="stats:download_users"
                 )
             ],
+            [
+                InlineKeyboardButton("🎥 وبینارها", callback_data="stats:items:webinar"),
+                InlineKeyboardButton(
+                    "📚 دراپ لرنینگ", callback_data="stats:items:drop_learning"
+                ),
+                InlineKeyboardButton(
+                    "📁 کیس استادی", callback_data="stats:items:case_study"
+                ),
+            ],
             [
                 InlineKeyboardButton(
                     "بازگشت 🔙", callback_data="stats:back"
@@ -105,6 +119,13 @@ def admin_stats_keyboard() -> InlineKeyboardMarkup:
     )
 
 
+def admin_item_stats_keyboard() -> InlineKeyboardMarkup:
+    """Keyboard under a per-item engagement report."""
+    return InlineKeyboardMarkup(
+        [[InlineKeyboardButton("بازگشت 🔙", callback_data="stats:back")]]
+    )
+
+
 def admin_settings_keyboard(require_phone: bool) -> InlineKeyboardMarkup:
     toggle_label = (
         "اجبار شماره موبایل: روشن ✅" if require_phone else "اجبار شماره موبایل: خاموش ❌"
@@ -146,24 +167,23 @@ def admin_add_cancel_keyboard() -> InlineKeyboardMarkup:
 
 
 def admin_broadcast_keyboard() -> InlineKeyboardMarkup:
-    return InlineKeyboardMarkup(
+    keyboard = [
+        [InlineKeyboardButton(f"ارسال به {option['label']}", callback_data=key)]
+        for key, option in BROADCAST_OPTIONS.items()
+    ]
+    keyboard.append(
         [
-            [InlineKeyboardButton("ارسال به همه کاربران", callback_data="broadcast:all")],
-            [
-                InlineKeyboardButton(
-                    "ارسال به کاربران دارای شماره",
-                    callback_data="broadcast:with_phone",
-                )
-            ],
-            [
-                InlineKeyboardButton(
-                    "ارسال به کاربران بدون شماره",
-                    callback_data="broadcast:without_phone",
-                )
-            ],
-            [InlineKeyboardButton("بازگشت 🔙", callback_data="broadcast:back")],
+            InlineKeyboardButton(
+                "بازدیدکنندگان یک وبینار بدون درخواست مشاوره",
+                callback_data=f"{BROADCAST_WEBINAR_PREFIX}:list",
+            )
         ]
     )
+    keyboard.append(
+        [InlineKeyboardButton("📅 پیام‌های زمان‌بندی‌شده", callback_data="broadcast:scheduled")]
+    )
+    keyboard.append([InlineKeyboardButton("بازگشت 🔙", callback_data="broadcast:back")])
+    return InlineKeyboardMarkup(keyboard)
 
 
 def admin_broadcast_cancel_keyboard() -> InlineKeyboardMarkup:
@@ -172,6 +192,27 @@ def admin_broadcast_cancel_keyboard() -> InlineKeyboardMarkup:
     )
 
 
+def admin_broadcast_album_keyboard() -> InlineKeyboardMarkup:
+    return InlineKeyboardMarkup(
+        [
+            [InlineKeyboardButton("تایید و ارسال آلبوم ✅", callback_data="broadcast:send_album")],
+            [InlineKeyboardButton("لغو ارسال 🔙", callback_data="broadcast:cancel")],
+        ]
+    )
+
+
+def admin_broadcast_dispatch_keyboard() -> InlineKeyboardMarkup:
+    return InlineKeyboardMarkup(
+        [
+            [
+                InlineKeyboardButton("ارسال اکنون 🚀", callback_data="broadcast:send_now"),
+                InlineKeyboardButton("زمان‌بندی 📅", callback_data="broadcast:schedule"),
+            ],
+            [InlineKeyboardButton("لغو ارسال 🔙", callback_data="broadcast:cancel")],
+        ]
+    )
+
+
 def register_phone_keyboard() -> InlineKeyboardMarkup:
     """Keyboard for requesting phone number registration."""
     return InlineKeyboardMarkup(
@@ -273,10 +314,13 @@ __all__ = [
     "admin_main_reply_keyboard",
     "admin_settings_keyboard",
     "admin_stats_keyboard",
+    "admin_item_stats_keyboard",
     "admin_manage_keyboard",
     "admin_add_cancel_keyboard",
     "admin_broadcast_keyboard",
     "admin_broadcast_cancel_keyboard",
+    "admin_broadcast_album_keyboard",
+    "admin_broadcast_dispatch_keyboard",
     "register_phone_keyboard",
     "consultation_payment_keyboard",
     "consultation_receipt_keyboard",
@@ -0,0 +1,141 @@
+"""Lease-based leader election for jobs that must run once across processes.
+
+Every process competes for the same row in ``leases``. The holder renews
+it every ``LEADER_RENEW_INTERVAL`` seconds; when it dies or stalls the lease
+expires and the next renewal tick of another process takes it over.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import logging
+import os
+import socket
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Dict
+
+from telegram.ext import Application, ContextTypes
+
+import database
+from .constants import (
+    LEADER_LEASE_MARGIN,
+    LEADER_LEASE_NAME,
+    LEADER_LEASE_TTL,
+)
+from .scheduling import restore_scheduled_broadcasts
+
+
+class LeaderElection:
+    """This process's view of one lease.
+
+    Leadership is trusted locally only until ``margin`` seconds before the
+    lease would expire, so a process whose renewals stop steps down before
+    anyone else can take over.
+    """
+
+    def __init__(
+        self,
+        name: str = LEADER_LEASE_NAME,
+        *,
+        ttl: float = LEADER_LEASE_TTL,
+        margin: float = LEADER_LEASE_MARGIN,
+    ) -> None:
+        self.name = name
+        self.ttl = ttl
+        self.margin = margin
+        self._token = uuid.uuid4().hex[:8]
+        self._valid_until = 0.0
+        self._stats: Dict[str, Any] = {"acquired": 0, "lost": 0, "renew_errors": 0}
+
+    @property
+    def owner(self) -> str:
+        # The pid keeps owners distinct even if a process forks after import
+        return f"{socket.gethostname()}:{os.getpid()}:{self._token}"
+
+    @property
+    def is_leader(self) -> bool:
+        return time.monotonic() < self._valid_until
+
+    async def renew(self) -> bool:
+        """Take or extend the lease; return whether this process leads now."""
+        was_leader = self.is_leader
+        started = time.monotonic()
+        try:
+            held = await asyncio.to_thread(
+                database.acquire_lease, self.name, self.owner, self.ttl
+            )
+        except Exception as exc:
+            # Keep the current term; it runs out on its own if this persists
+            self._stats["renew_errors"] += 1
+            logging.warning("Could not renew %s lease: %s", self.name, exc)
+            return self.is_leader
+        if held:
+            self._valid_until = started + self.ttl - self.margin
+            if not was_leader:
+                self._stats["acquired"] += 1
+                logging.info("Process %s became leader for %s", self.owner, self.name)
+        else:
+            self._valid_until = 0.0
+            if was_leader:
+                self._stats["lost"] += 1
+                logging.warning("Process %s lost the %s lease", self.owner, self.name)
+        return held
+
+    async def release(self) -> None:
+        """Hand the lease back on shutdown so another process takes over at once."""
+        if not self.is_leader:
+            return
+        self._valid_until = 0.0
+        try:
+            await asyncio.to_thread(database.release_lease, self.name, self.owner)
+        except Exception as exc:
+            logging.warning("Could not release %s lease: %s", self.name, exc)
+
+    def metrics(self) -> Dict[str, Any]:
+        stats = dict(self._stats)
+        stats["owner"] = self.owner
+        stats["is_leader"] = self.is_leader
+        return stats
+
+
+leader = LeaderElection()
+
+
+def leader_only(
+    callback: Callable[[ContextTypes.DEFAULT_TYPE], Awaitable[None]]
+) -> Callable[[ContextTypes.DEFAULT_TYPE], Awaitable[None]]:
+    """Wrap a JobQueue callback so only the current leader runs it."""
+
+    @functools.wraps(callback)
+    async def wrapper(context: ContextTypes.DEFAULT_TYPE) -> None:
+        if leader.is_leader:
+            await callback(context)
+
+    return wrapper
+
+
+async def _renew(application: Application) -> None:
+    if await leader.renew():
+        # Queues broadcasts that are new or were scheduled by another process
+        restore_scheduled_broadcasts(application)
+
+
+async def start_leader_election(application: Application) -> None:
+    """Try to become leader right away instead of waiting for the first tick."""
+    await _renew(application)
+
+
+async def maintain_leadership(context: ContextTypes.DEFAULT_TYPE) -> None:
+    """JobQueue callback renewing (or competing for) the leader lease."""
+    await _renew(context.application)
+
+
+__all__ = [
+    "LeaderElection",
+    "leader",
+    "leader_only",
+    "maintain_leadership",
+    "start_leader_election",
+]
@@ -0,0 +1,228 @@
+"""Logging pipeline: queue-backed, JSON lines, per-module levels, sampling.
+
+Log calls on the event loop only build the record and put it on a queue;
+a ``QueueListener`` thread formats and writes it. Every record carries the
+``update_id`` and ``user_id`` of the update being handled, taken from
+context variables that ``bind_update_context`` sets for each update.
+``UpdateContextApplication`` unbinds them once the update is handled and
+``UnboundJobQueue`` before every job run, so jobs never log with the ids of
+the update that happened to schedule them.
+"""
+
+from __future__ import annotations
+
+import atexit
+import contextvars
+import copy
+import json
+import logging
+import queue
+import random
+import sys
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Optional
+
+from telegram import Update
+from telegram.ext import Application, ContextTypes, Job, JobQueue
+
+from .config import get_log_format, get_log_level, get_log_levels, get_log_sample_rate
+
+update_id_var: contextvars.ContextVar[Optional[int]] = contextvars.ContextVar(
+    "update_id", default=None
+)
+user_id_var: contextvars.ContextVar[Optional[int]] = contextvars.ContextVar(
+    "user_id", default=None
+)
+
+TEXT_FORMAT = (
+    "%(asctime)s - %(processName)s - %(name)s - %(levelname)s"
+    " - [update=%(update_id)s user=%(user_id)s] %(message)s"
+)
+
+_sample_rate = 1.0
+_listener: Optional[QueueListener] = None
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: Dict[str, Any] = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(
+                timespec="milliseconds"
+            ),
+            "level": record.levelname,
+            "logger": record.name,
+            "module": record.module,
+            "process": record.processName,
+            "msg": record.getMessage(),
+        }
+        for key in ("update_id", "user_id", "sample_rate"):
+            value = getattr(record, key, None)
+            if value is not None:
+                entry[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exc"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class LevelFilter(logging.Filter):
+    """Apply per-module levels.
+
+    Named loggers (``httpx``, ``telegram.ext``) are matched by the longest
+    configured prefix; records from the root logger, which the bot modules
+    use, are matched by module name.
+    """
+
+    def __init__(self, default: int, levels: Dict[str, int]) -> None:
+        super().__init__()
+        self.default = default
+        self.levels = levels
+        self._cache: Dict[tuple, int] = {}
+
+    def threshold(self, record: logging.LogRecord) -> int:
+        key = (record.name, record.module)
+        level = self._cache.get(key)
+        if level is None:
+            level = self.default
+            if record.name == "root":
+                level = self.levels.get(record.module, self.default)
+            else:
+                name = record.name
+                while name:
+                    if name in self.levels:
+                        level = self.levels[name]
+                        break
+                    name = name.rpartition(".")[0]
+            self._cache[key] = level
+        return level
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.levelno >= self.threshold(record)
+
+
+class CorrelationFilter(logging.Filter):
+    """Stamp records with the ids of the update being handled."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.update_id = update_id_var.get()
+        record.user_id = user_id_var.get()
+        return True
+
+
+class _QueueHandler(QueueHandler):
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Keep the traceback as text instead of folding it into the message
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        record.msg = record.message
+        record.args = None
+        record.exc_info = None
+        return record
+
+
+def configure_logging() -> QueueListener:
+    """Route all logging through a queue to a JSON (or text) stderr writer."""
+    global _listener, _sample_rate
+    if _listener is None:
+        atexit.register(shutdown_logging)
+    shutdown_logging()
+    default = get_log_level()
+    levels = get_log_levels()
+    _sample_rate = get_log_sample_rate()
+
+    writer = logging.StreamHandler(sys.stderr)
+    if get_log_format() == "json":
+        writer.setFormatter(JsonFormatter())
+    else:
+        writer.setFormatter(logging.Formatter(TEXT_FORMAT))
+
+    handler = _QueueHandler(queue.SimpleQueue())
+    handler.addFilter(LevelFilter(default, levels))
+    handler.addFilter(CorrelationFilter())
+
+    root = logging.getLogger()
+    for existing in list(root.handlers):
+        root.removeHandler(existing)
+    root.addHandler(handler)
+    # Loggers must let through anything some module asked for; LevelFilter decides
+    root.setLevel(min([default, *levels.values()]))
+    for name, level in levels.items():
+        logging.getLogger(name).setLevel(level)
+
+    _listener = QueueListener(handler.queue, writer)
+    _listener.start()
+    return _listener
+
+
+def shutdown_logging() -> None:
+    """Flush queued records and stop the writer thread."""
+    if _listener is not None and _listener._thread is not None:
+        _listener.stop()
+
+
+def log_sampled(level: int, msg: str, *args: Any, rate: Optional[float] = None) -> None:
+    """Log only a ``rate`` share of calls, for lines emitted on every update."""
+    rate = _sample_rate if rate is None else rate
+    if rate < 1.0 and random.random() >= rate:
+        return
+    logging.log(level, msg, *args, extra={"sample_rate": rate}, stacklevel=2)
+
+
+async def bind_update_context(update: object, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """TypeHandler callback run first for every update."""
+    if not isinstance(update, Update):
+        return
+    update_id_var.set(update.update_id)
+    user = update.effective_user
+    user_id_var.set(user.id if user else None)
+
+
+def clear_update_context() -> None:
+    update_id_var.set(None)
+    user_id_var.set(None)
+
+
+class UpdateContextApplication(Application):
+    """Application keeping the correlation ids scoped to one update."""
+
+    async def process_update(self, update: object) -> None:
+        try:
+            await super().process_update(update)
+        finally:
+            clear_update_context()
+
+
+class UnboundJobQueue(JobQueue):
+    """JobQueue whose jobs run without correlation ids.
+
+    APScheduler runs a job in the context captured when it was added, so a
+    job scheduled by a handler would log every later run with that update's
+    ids.
+    """
+
+    @staticmethod
+    async def job_callback(job_queue: JobQueue, job: Job) -> None:
+        clear_update_context()
+        await job.run(job_queue.application)
+
+
+__all__ = [
+    "CorrelationFilter",
+    "JsonFormatter",
+    "LevelFilter",
+    "UnboundJobQueue",
+    "UpdateContextApplication",
+    "bind_update_context",
+    "clear_update_context",
+    "configure_logging",
+    "log_sampled",
+    "shutdown_logging",
+    "update_id_var",
+    "user_id_var",
+]
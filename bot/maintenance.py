@@ -0,0 +1,124 @@
+"""Periodic SQLite upkeep: WAL checkpoints, planner statistics and vacuuming.
+
+Cheap work runs all day: a passive checkpoint every few minutes and an
+hourly ``PRAGMA optimize``. Heavier work (the nightly snapshot, truncating
+checkpoints, ``ANALYZE``, vacuuming) waits for the daily maintenance window
+unless the WAL has grown past ``MAINTENANCE_WAL_TRUNCATE_BYTES``. Every run
+is recorded in ``maintenance_runs`` so any process can report it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+
+from telegram.ext import ContextTypes
+
+import database
+from .backup import run_backup
+from .config import get_bot_timezone, get_maintenance_window
+from .constants import (
+    MAINTENANCE_VACUUM_PAUSE,
+    MAINTENANCE_VACUUM_STEP_PAGES,
+    MAINTENANCE_WAL_TRUNCATE_BYTES,
+)
+
+
+def in_maintenance_window(now: Optional[datetime] = None) -> bool:
+    start, end = get_maintenance_window()
+    current = (now or datetime.now(get_bot_timezone())).time()
+    if start < end:
+        return start <= current < end
+    # The window wraps past midnight
+    return current >= start or current < end
+
+
+async def _run(task: str, func: Callable[..., Any], *args: Any) -> Any:
+    started = time.perf_counter()
+    result = await asyncio.to_thread(func, *args)
+    duration_ms = (time.perf_counter() - started) * 1000
+    details = result if isinstance(result, dict) else {"result": result}
+    await asyncio.to_thread(database.record_maintenance_run, task, duration_ms, details)
+    logging.info("Database %s took %.0f ms: %s", task, duration_ms, details)
+    return result
+
+
+async def checkpoint_database(context: ContextTypes.DEFAULT_TYPE) -> None:
+    """JobQueue callback copying the WAL back into the database file."""
+    metrics = await asyncio.to_thread(database.get_database_size_metrics)
+    if in_maintenance_window() or metrics["wal_bytes"] > MAINTENANCE_WAL_TRUNCATE_BYTES:
+        result = await _run("checkpoint_truncate", database.checkpoint_wal, "TRUNCATE")
+        if not result["busy"]:
+            return
+        logging.info("Truncating checkpoint blocked by readers; falling back to passive")
+    await _run("checkpoint_passive", database.checkpoint_wal, "PASSIVE")
+
+
+async def optimize_database(context: ContextTypes.DEFAULT_TYPE) -> None:
+    """JobQueue callback letting SQLite refresh statistics it considers stale."""
+    await _run("optimize", database.optimize_database)
+
+
+async def _vacuum_until_window_closes() -> Dict[str, int]:
+    freed = steps = 0
+    while in_maintenance_window():
+        step = await asyncio.to_thread(
+            database.incremental_vacuum, MAINTENANCE_VACUUM_STEP_PAGES
+        )
+        if not step:
+            break
+        freed += step
+        steps += 1
+        # Let queued writers through between steps
+        await asyncio.sleep(MAINTENANCE_VACUUM_PAUSE)
+    return {"freed_pages": freed, "steps": steps}
+
+
+async def nightly_maintenance(context: ContextTypes.DEFAULT_TYPE) -> None:
+    """JobQueue callback for the daily window: snapshot, analyze, vacuum, truncate the WAL."""
+    if not in_maintenance_window():
+        return
+    # Snapshot before the file is rewritten; a failed backup must not stop upkeep
+    try:
+        backup = await run_backup()
+        await asyncio.to_thread(
+            database.record_maintenance_run,
+            "backup",
+            backup["duration"] * 1000,
+            {
+                "path": backup["path"],
+                "compressed_bytes": backup["compressed_bytes"],
+                "verified": backup["verification"]["ok"],
+            },
+        )
+    except Exception:
+        logging.exception("Nightly backup failed")
+    await _run("enable_incremental_vacuum", database.enable_incremental_vacuum)
+    await _run("analyze", database.optimize_database, True)
+    started = time.perf_counter()
+    result = await _vacuum_until_window_closes()
+    duration_ms = (time.perf_counter() - started) * 1000
+    await asyncio.to_thread(
+        database.record_maintenance_run, "incremental_vacuum", duration_ms, result
+    )
+    logging.info("Database incremental_vacuum took %.0f ms: %s", duration_ms, result)
+    await _run("checkpoint_truncate", database.checkpoint_wal, "TRUNCATE")
+
+
+def database_health() -> Dict[str, Any]:
+    """Size metrics plus the latest run of every maintenance task."""
+    metrics: Dict[str, Any] = database.get_database_size_metrics()
+    metrics["runs"] = {run["task"]: run for run in database.list_maintenance_runs()}
+    return metrics
+
+
+__all__ = [
+    "checkpoint_database",
+    "database_health",
+    "in_maintenance_window",
+    "nightly_maintenance",
+    "optimize_database",
+]
@@ -0,0 +1,147 @@
+"""Media file registry helpers and the background file_id validator."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, Optional
+
+from telegram import Bot, Message
+from telegram.error import BadRequest, TelegramError
+from telegram.ext import ContextTypes
+
+import database
+from .constants import MEDIA_RECHECK_SECONDS, MEDIA_VALIDATION_BATCH
+from .delivery import record_delivery_failure
+from .sections import SECTIONS
+
+# Attribute on Message, in the order the admin flows used to check them
+MEDIA_ATTRIBUTES = ("video", "voice", "audio", "document", "photo", "video_note")
+
+
+def extract_media(message: Message) -> Optional[Dict[str, Any]]:
+    """Return the file attached to ``message`` or None if it has none."""
+    for file_type in MEDIA_ATTRIBUTES:
+        media = getattr(message, file_type, None)
+        if not media:
+            continue
+        if file_type == "photo":
+            media = media[-1]
+        return {
+            "file_id": media.file_id,
+            "file_unique_id": media.file_unique_id,
+            "file_type": file_type,
+            "file_size": media.file_size,
+        }
+    return None
+
+
+def _probe_error(exc: BadRequest) -> Optional[str]:
+    """Bot API refuses getFile above 20 MB, but the file_id is still valid."""
+    if "too big" in str(exc).lower():
+        return None
+    return str(exc)
+
+
+async def _probe(bot: Bot, file_id: str) -> tuple:
+    """Return ``(file, error)``; both None when the outcome is inconclusive."""
+    try:
+        return await bot.get_file(file_id), None
+    except BadRequest as exc:
+        return None, _probe_error(exc)
+
+
+async def _alert_admins(bot: Bot, file_unique_id: str, error: str) -> None:
+    references = await asyncio.to_thread(database.list_media_references, file_unique_id)
+    lines = [
+        f"• {SECTIONS[ref['item_type']].label}: {ref['title']}"
+        for ref in references
+    ]
+    text = "⚠️ یک فایل محتوا دیگر قابل ارسال نیست و باید دوباره آپلود شود.\n\n"
+    text += "\n".join(lines) if lines else "(این فایل در هیچ محتوایی استفاده نشده است)"
+    text += f"\n\nخطا: {error}"
+    for admin_id in database.filter_reachable(database.list_admin_ids()):
+        try:
+            await bot.send_message(chat_id=admin_id, text=text)
+        except TelegramError as exc:
+            logging.warning("Failed to alert admin %s about media: %s", admin_id, exc)
+            record_delivery_failure(admin_id, exc)
+
+
+async def _backfill_legacy(bot: Bot, limit: int) -> int:
+    """Look up file_unique_id for content saved before the registry existed."""
+    rows = await asyncio.to_thread(database.list_unregistered_media, limit)
+    for row in rows:
+        try:
+            file, error = await _probe(bot, row["file_id"])
+        except TelegramError as exc:
+            logging.info("Skipping media backfill this round: %s", exc)
+            break
+        if file is not None:
+            await asyncio.to_thread(
+                database.link_media_asset,
+                row["file_id"],
+                file.file_unique_id,
+                row["file_type"],
+                file.file_size,
+            )
+        elif error is not None:
+            key = await asyncio.to_thread(
+                database.register_broken_legacy_media,
+                row["file_id"],
+                row["file_type"],
+                error,
+            )
+            await _alert_admins(bot, key, error)
+        else:
+            # Too big to probe; the file_unique_id is unknown but the file is fine
+            await asyncio.to_thread(
+                database.link_media_asset,
+                row["file_id"],
+                f"{database.LEGACY_MEDIA_PREFIX}{row['file_id']}",
+                row["file_type"],
+            )
+    return len(rows)
+
+
+async def _recheck_assets(bot: Bot, limit: int) -> None:
+    due = await asyncio.to_thread(
+        database.list_media_assets_due, int(time.time()) - MEDIA_RECHECK_SECONDS, limit
+    )
+    for asset in due:
+        key = asset["file_unique_id"]
+        try:
+            file, error = await _probe(bot, asset["file_id"])
+        except TelegramError as exc:
+            logging.info("Skipping media validation this round: %s", exc)
+            return
+        if file is not None and key.startswith(database.LEGACY_MEDIA_PREFIX):
+            await asyncio.to_thread(
+                database.link_media_asset,
+                asset["file_id"],
+                file.file_unique_id,
+                asset["file_type"],
+                file.file_size,
+                previous_key=key,
+            )
+            continue
+        if await asyncio.to_thread(database.mark_media_asset_checked, key, error):
+            logging.warning("Media asset %s is broken: %s", key, error)
+            await _alert_admins(bot, key, error)
+
+
+async def validate_media_assets(context: ContextTypes.DEFAULT_TYPE) -> None:
+    """JobQueue callback probing a few stored file_ids per tick.
+
+    Legacy rows are registered first; the remaining budget re-checks the
+    assets with the oldest probe so the whole registry is covered roughly
+    every ``MEDIA_RECHECK_SECONDS`` without bursting getFile calls.
+    """
+    backfilled = await _backfill_legacy(context.bot, MEDIA_VALIDATION_BATCH)
+    remaining = MEDIA_VALIDATION_BATCH - backfilled
+    if remaining > 0:
+        await _recheck_assets(context.bot, remaining)
+
+
+__all__ = ["MEDIA_ATTRIBUTES", "extract_media", "validate_media_assets"]
@@ -49,12 +49,17 @@ from .keyboards import (
     consultation_payment_keyboard,
     consultation_receipt_keyboard,
 )
+from .logs import log_sampled
+from .notifications import build_consultation_caption, notify_admins_of_consultation
+from .plans import deliver_plan, get_delivery_plan
+from .sections import SECTIONS, SECTIONS_BY_BUTTON, Section, pop_pending_item
 from .utils import (
     ensure_user_record,
     extract_phone_last10,
     is_admin_user,
     phone_requirement_enabled,
 )
+from .views import record_view
 
 
 def build_main_menu_keyboard(user_id: int | None) -> ReplyKeyboardMarkup:
@@ -140,19 +145,9 @@ async def handle_contact(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
     )
     
     # Check if there's a pending item
-    pending_webinar_id = context.user_data.get("pending_webinar_id")
-    pending_drop_learning_id = context.user_data.get("pending_drop_learning_id")
-    pending_case_study_id = context.user_data.get("pending_case_study_id")
-    
-    if pending_webinar_id:
-        context.user_data.pop("pending_webinar_id", None)
-        await send_webinar_content(update, context, pending_webinar_id)
-    elif pending_drop_learning_id:
-        context.user_data.pop("pending_drop_learning_id", None)
-        await send_drop_learning_content(update, context, pending_drop_learning_id)
-    elif pending_case_study_id:
-        context.user_data.pop("pending_case_study_id", None)
-        await send_case_study_content(update, context, pending_case_study_id)
+    section, item_id = pop_pending_item(context.user_data)
+    if section:
+        await send_section_content(update, context, section, item_id)
     else:
         await send_main_menu(update, context)
 
@@ -178,7 +173,7 @@ async def handle_menu_selection(
     user_id = update.effective_user.id if update.effective_user else None
     text = update.message.text or ""
     
-    logging.info(f"Handling menu selection: text='{text}', user_id={user_id}")
+    log_sampled(logging.INFO, "Handling menu selection: text=%r, user_id=%s", text, user_id)
     
     # Ignore admin panel messages - they should be handled by admin conversation handler
     admin_panel_texts = [
@@ -207,186 +202,21 @@ async def handle_menu_selection(
         )
         return
     
-    webinar_map = context.user_data.get("webinar_menu")
-    if webinar_map and text in webinar_map:
-        webinar_id = webinar_map[text]
-        webinar = database.get_webinar(webinar_id)
-        if not webinar:
-            await update.message.reply_text(
-                "این وبینار دیگر در دسترس نیست!",
-                reply_markup=build_main_menu_keyboard(user_id),
-            )
-            context.user_data.pop("webinar_menu", None)
-            return
-
-        # Check if user has phone number
-        user = update.effective_user
-        if not user or not database.user_has_phone(user.id):
-            # User doesn't have phone, show registration message
-            context.user_data["pending_webinar_id"] = webinar_id
-            await update.message.reply_text(
-                "جهت ثبت نام در ربات دکمه رو بزنید",
-                reply_markup=register_phone_keyboard(),
-            )
-            return
-
-        # User has phone, show webinar content
-        await send_webinar_content(update, context, webinar_id)
-        return
-
-    if text == "وبینار ها":
-        # Optimized: build menu and map in single pass
-        rows: list[list[KeyboardButton]] = []
-        menu_map: dict[str, int] = {}
-        has_webinars = False
-        
-        for webinar in database.list_webinars():
-            has_webinars = True
-            title = webinar["title"] or "وبینار بدون عنوان"
-            rows.append([KeyboardButton(title)])
-            menu_map[title] = webinar["id"]
-        
-        if not has_webinars:
-            await update.message.reply_text(
-                "در حال حاضر وبیناری ثبت نشده است.",
-                reply_markup=build_main_menu_keyboard(user_id),
-            )
+    for section in SECTIONS.values():
+        section_map = context.user_data.get(section.menu_key)
+        if section_map and text in section_map:
+            await _open_section_item(update, context, section, section_map[text])
             return
 
-        rows.append([KeyboardButton("بازگشت")])
-        webinar_keyboard = ReplyKeyboardMarkup(rows, resize_keyboard=True)
-        context.user_data["webinar_menu"] = menu_map
-        await update.message.reply_text(
-            "یکی از وبینارهای زیر را انتخاب کن:",
-            reply_markup=webinar_keyboard,
-        )
-        return
-
-    if text == "دراپ لرنینگ":
-        # Optimized: build menu and map in single pass
-        rows: list[list[KeyboardButton]] = []
-        menu_map: dict[str, int] = {}
-        has_items = False
-        
-        for item in database.list_drop_learning():
-            has_items = True
-            title = item["title"] or "دراپ لرنینگ بدون عنوان"
-            rows.append([KeyboardButton(title)])
-            menu_map[title] = item["id"]
-        
-        if not has_items:
-            await update.message.reply_text(
-                "در حال حاضر دراپ لرنینگی ثبت نشده است.",
-                reply_markup=build_main_menu_keyboard(user_id),
-            )
-            return
-
-        rows.append([KeyboardButton("بازگشت")])
-        drop_learning_keyboard = ReplyKeyboardMarkup(rows, resize_keyboard=True)
-        context.user_data["drop_learning_menu"] = menu_map
-        await update.message.reply_text(
-            "یکی از دراپ لرنینگ‌های زیر را انتخاب کن:",
-            reply_markup=drop_learning_keyboard,
-        )
-        return
-
-    if text == "Case Studies":
-        # Optimized: build menu and map in single pass
-        rows: list[list[KeyboardButton]] = []
-        menu_map: dict[str, int] = {}
-        has_items = False
-        
-        for item in database.list_case_studies():
-            has_items = True
-            title = item["title"] or "کیس استادی بدون عنوان"
-            rows.append([KeyboardButton(title)])
-            menu_map[title] = item["id"]
-        
-        if not has_items:
-            await update.message.reply_text(
-                "در حال حاضر کیس استادی ثبت نشده است.",
-                reply_markup=build_main_menu_keyboard(user_id),
-            )
-            return
-
-        rows.append([KeyboardButton("بازگشت")])
-        case_studies_keyboard = ReplyKeyboardMarkup(rows, resize_keyboard=True)
-        context.user_data["case_studies_menu"] = menu_map
-        await update.message.reply_text(
-            "یکی از کیس استادی‌های زیر را انتخاب کن:",
-            reply_markup=case_studies_keyboard,
-        )
-        return
-
-    # Handle drop learning selection
-    drop_learning_map = context.user_data.get("drop_learning_menu")
-    if drop_learning_map and text in drop_learning_map:
-        item_id = drop_learning_map[text]
-        item = database.get_drop_learning(item_id)
-        if not item:
-            await update.message.reply_text(
-                "این دراپ لرنینگ دیگر در دسترس نیست.",
-                reply_markup=build_main_menu_keyboard(user_id),
-            )
-            context.user_data.pop("drop_learning_menu", None)
-            return
-
-        user = update.effective_user
-        if not user or not database.user_has_phone(user.id):
-            context.user_data["pending_drop_learning_id"] = item_id
-            await update.message.reply_text(
-                "جهت ثبت نام در ربات دکمه رو بزنید",
-                reply_markup=register_phone_keyboard(),
-            )
-            return
-
-        await send_drop_learning_content(update, context, item_id)
-        return
-
-    # Handle case studies selection
-    case_studies_map = context.user_data.get("case_studies_menu")
-    if case_studies_map and text in case_studies_map:
-        item_id = case_studies_map[text]
-        item = database.get_case_study(item_id)
-        if not item:
-            await update.message.reply_text(
-                "این کیس استادی دیگر در دسترس نیست.",
-                reply_markup=build_main_menu_keyboard(user_id),
-            )
-            context.user_data.pop("case_studies_menu", None)
-            return
-
-        user = update.effective_user
-        if not user or not database.user_has_phone(user.id):
-            context.user_data["pending_case_study_id"] = item_id
-            await update.message.reply_text(
-                "جهت ثبت نام در ربات دکمه رو بزنید",
-                reply_markup=register_phone_keyboard(),
-            )
-            return
-
-        await send_case_study_content(update, context, item_id)
+    section = SECTIONS_BY_BUTTON.get(text)
+    if section:
+        await _show_section_list(update, context, section)
         return
 
     if text == "بازگشت":
-        if context.user_data.pop("webinar_menu", None):
-            await update.message.reply_text(
-                "بازگشت به منوی اصلی.",
-                reply_markup=build_main_menu_keyboard(user_id),
-            )
-            return
-        if context.user_data.pop("drop_learning_menu", None):
-            await update.message.reply_text(
-                "بازگشت به منوی اصلی.",
-                reply_markup=build_main_menu_keyboard(user_id),
-            )
-            return
-        if context.user_data.pop("case_studies_menu", None):
-            await update.message.reply_text(
-                "بازگشت به منوی اصلی.",
-                reply_markup=build_main_menu_keyboard(user_id),
-            )
-            return
+        for section in SECTIONS.values():
+            if context.user_data.pop(section.menu_key, None):
+                break
         await update.message.reply_text(
             "بازگشت به منوی اصلی.",
             reply_markup=build_main_menu_keyboard(user_id),
@@ -408,175 +238,73 @@ async def handle_menu_selection(
         )
 
 
-async def send_webinar_content(
-    update: Update, context: ContextTypes.DEFAULT_TYPE, webinar_id: int
+async def _show_section_list(
+    update: Update, context: ContextTypes.DEFAULT_TYPE, section: Section
 ) -> None:
-    """Send webinar content to user."""
-    webinar = database.get_webinar(webinar_id)
-    if not webinar:
-        await update.message.reply_text("این وبینار دیگر در دسترس نیست.")
+    """Reply with a keyboard of the section's items and remember the title map."""
+    user_id = update.effective_user.id if update.effective_user else None
+    rows: list[list[KeyboardButton]] = []
+    menu_map: dict[str, int] = {}
+    for item in database.list_section_items(section.name):
+        title = item["title"] or section.untitled
+        rows.append([KeyboardButton(title)])
+        menu_map[title] = item["id"]
+
+    if not menu_map:
+        await update.message.reply_text(
+            section.empty_text,
+            reply_markup=build_main_menu_keyboard(user_id),
+        )
         return
 
-    # Record view
-    user_id = update.effective_user.id if update.effective_user else None
-    if user_id:
-        database.record_webinar_view(user_id, webinar_id)
-
-    # Send cover photo if available
-    if webinar.get("cover_photo_file_id"):
-        try:
-            await context.bot.send_photo(
-                chat_id=update.effective_chat.id,
-                photo=webinar["cover_photo_file_id"],
-                caption=webinar["description"],
-            )
-        except Exception:
-            # If photo fails, send description as text
-            await update.message.reply_text(webinar["description"])
-    else:
-        await update.message.reply_text(webinar["description"])
+    rows.append([KeyboardButton("بازگشت")])
+    context.user_data[section.menu_key] = menu_map
+    await update.message.reply_text(
+        section.choose_text,
+        reply_markup=ReplyKeyboardMarkup(rows, resize_keyboard=True),
+    )
 
-    # Send content items - optimized: iterate directly without converting to list
-    chat_id = update.effective_chat.id
-    for item in database.get_webinar_content(webinar_id):
-        try:
-            file_type = item["file_type"]
-            file_id = item["file_id"]
-            
-            if file_type == "video":
-                await context.bot.send_video(chat_id=chat_id, video=file_id)
-            elif file_type == "voice":
-                await context.bot.send_voice(chat_id=chat_id, voice=file_id)
-            elif file_type == "audio":
-                await context.bot.send_audio(chat_id=chat_id, audio=file_id)
-            elif file_type == "document":
-                await context.bot.send_document(chat_id=chat_id, document=file_id)
-            elif file_type == "photo":
-                await context.bot.send_photo(chat_id=chat_id, photo=file_id)
-            elif file_type == "video_note":
-                await context.bot.send_video_note(chat_id=chat_id, video_note=file_id)
-        except Exception as e:
-            logging.warning(f"Failed to send webinar content {item.get('id', 'unknown')}: {e}")
-            continue
-
-
-async def send_drop_learning_content(
-    update: Update, context: ContextTypes.DEFAULT_TYPE, item_id: int
+
+async def _open_section_item(
+    update: Update, context: ContextTypes.DEFAULT_TYPE, section: Section, item_id: int
 ) -> None:
-    """Send drop learning content to user."""
-    item = database.get_drop_learning(item_id)
-    if not item:
-        await update.message.reply_text("این دراپ لرنینگ دیگر در دسترس نیست.")
+    user_id = update.effective_user.id if update.effective_user else None
+    if get_delivery_plan(section.name, item_id) is None:
+        await update.message.reply_text(
+            section.unavailable_text,
+            reply_markup=build_main_menu_keyboard(user_id),
+        )
+        context.user_data.pop(section.menu_key, None)
         return
 
-    # Record view
-    user_id = update.effective_user.id if update.effective_user else None
-    if user_id:
-        database.record_drop_learning_view(user_id, item_id)
+    if not user_id or not database.user_has_phone(user_id):
+        context.user_data[section.pending_key] = item_id
+        await update.message.reply_text(
+            "جهت ثبت نام در ربات دکمه رو بزنید",
+            reply_markup=register_phone_keyboard(),
+        )
+        return
 
-    # Send description
-    await update.message.reply_text(item["description"])
+    await send_section_content(update, context, section.name, item_id)
 
-    # Send content items - optimized: iterate directly without converting to list
-    chat_id = update.effective_chat.id
-    for content_item in database.get_drop_learning_content(item_id):
-        try:
-            caption = content_item.get("caption") or None
-            file_type = content_item["file_type"]
-            file_id = content_item["file_id"]
-            
-            if file_type == "video":
-                await context.bot.send_video(
-                    chat_id=chat_id,
-                    video=file_id,
-                    caption=caption,
-                )
-            elif file_type == "voice":
-                await context.bot.send_voice(
-                    chat_id=chat_id,
-                    voice=file_id,
-                    caption=caption,
-                )
-            elif file_type == "audio":
-                await context.bot.send_audio(
-                    chat_id=chat_id,
-                    audio=file_id,
-                    caption=caption,
-                )
-            elif file_type == "document":
-                await context.bot.send_document(
-                    chat_id=chat_id,
-                    document=file_id,
-                    caption=caption,
-                )
-            elif file_type == "photo":
-                await context.bot.send_photo(
-                    chat_id=chat_id,
-                    photo=file_id,
-                    caption=caption,
-                )
-            elif file_type == "video_note":
-                # video_note doesn't support caption
-                await context.bot.send_video_note(
-                    chat_id=chat_id,
-                    video_note=file_id,
-                )
-                if caption:
-                    await context.bot.send_message(chat_id=chat_id, text=caption)
-        except Exception as e:
-            logging.warning(f"Failed to send drop learning content {content_item.get('id', 'unknown')}: {e}")
-            continue
-
-
-async def send_case_study_content(
-    update: Update, context: ContextTypes.DEFAULT_TYPE, item_id: int
+
+async def send_section_content(
+    update: Update, context: ContextTypes.DEFAULT_TYPE, section: str, item_id: int
 ) -> None:
-    """Send case study content to user."""
-    item = database.get_case_study(item_id)
-    if not item:
-        await update.message.reply_text("این کیس استادی دیگر در دسترس نیست.")
+    """Send a catalogue item to the user by replaying its delivery plan."""
+    chat_id = update.effective_chat.id
+    plan = get_delivery_plan(section, item_id)
+    if plan is None:
+        await context.bot.send_message(
+            chat_id=chat_id, text=SECTIONS[section].unavailable_text
+        )
         return
 
-    # Record view
     user_id = update.effective_user.id if update.effective_user else None
     if user_id:
-        database.record_case_study_view(user_id, item_id)
-
-    # Send cover photo if available
-    if item.get("cover_photo_file_id"):
-        try:
-            await context.bot.send_photo(
-                chat_id=update.effective_chat.id,
-                photo=item["cover_photo_file_id"],
-                caption=item["description"],
-            )
-        except Exception:
-            await update.message.reply_text(item["description"])
-    else:
-        await update.message.reply_text(item["description"])
+        record_view(section, user_id, item_id)
 
-    # Send content items - optimized: iterate directly without converting to list
-    chat_id = update.effective_chat.id
-    for content_item in database.get_case_study_content(item_id):
-        try:
-            file_type = content_item["file_type"]
-            file_id = content_item["file_id"]
-            
-            if file_type == "video":
-                await context.bot.send_video(chat_id=chat_id, video=file_id)
-            elif file_type == "voice":
-                await context.bot.send_voice(chat_id=chat_id, voice=file_id)
-            elif file_type == "audio":
-                await context.bot.send_audio(chat_id=chat_id, audio=file_id)
-            elif file_type == "document":
-                await context.bot.send_document(chat_id=chat_id, document=file_id)
-            elif file_type == "photo":
-                await context.bot.send_photo(chat_id=chat_id, photo=file_id)
-            elif file_type == "video_note":
-                await context.bot.send_video_note(chat_id=chat_id, video_note=file_id)
-        except Exception as e:
-            logging.warning(f"Failed to send case study content {content_item.get('id', 'unknown')}: {e}")
-            continue
+    await deliver_plan(context.bot, chat_id, plan, f"{section} content")
 
 
 async def handle_register_phone_callback(
@@ -598,24 +326,10 @@ async def handle_register_phone_callback(
     # Check if user already has phone
     if database.user_has_phone(user.id):
         # User already has phone, show pending content if any
-        pending_webinar_id = context.user_data.get("pending_webinar_id")
-        pending_drop_learning_id = context.user_data.get("pending_drop_learning_id")
-        pending_case_study_id = context.user_data.get("pending_case_study_id")
-        
-        if pending_webinar_id:
-            context.user_data.pop("pending_webinar_id", None)
-            await query.edit_message_text("شماره شما قبلاً ثبت شده است.")
-            await send_webinar_content(update, context, pending_webinar_id)
-        elif pending_drop_learning_id:
-            context.user_data.pop("pending_drop_learning_id", None)
-            await query.edit_message_text("شماره شما قبلاً ثبت شده است.")
-            await send_drop_learning_content(update, context, pending_drop_learning_id)
-        elif pending_case_study_id:
-            context.user_data.pop("pending_case_study_id", None)
-            await query.edit_message_text("شماره شما قبلاً ثبت شده است.")
-            await send_case_study_content(update, context, pending_case_study_id)
-        else:
-            await query.edit_message_text("شماره شما قبلاً ثبت شده است.")
+        section, item_id = pop_pending_item(context.user_data)
+        await query.edit_message_text("شماره شما قبلاً ثبت شده است.")
+        if section:
+            await send_section_content(update, context, section, item_id)
         return
 
     # Request phone number
@@ -671,9 +385,10 @@ async def handle_consultation_payment_callback(
     if not await ensure_registered_user(update, context):
         return
 
-    payment_amount = database.get_bot_setting("payment_amount")
-    payment_card_number = database.get_bot_setting("payment_card_number")
-    
+    settings = database.get_settings(("payment_amount", "payment_card_number"))
+    payment_amount = settings["payment_amount"]
+    payment_card_number = settings["payment_card_number"]
+
     payment_message = f"""💳 اطلاعات پرداخت:
 
 مبلغ: {payment_amount} تومان
@@ -735,33 +450,22 @@ async def handle_receipt_photo(
     request_id = database.create_consultation_request(user.id, receipt_file_id)
     context.user_data.pop("waiting_for_receipt", None)
 
-    # Get user info
-    user_info = database.get_user(user.id)
-    user_info_text = f"""کاربر: {user_info['fname']} {user_info['lname']}
-شماره موبایل: {user_info['phone_number']}
-یوزرنیم: @{user_info['username']}""" if user_info else f"کاربر ID: {user.id}"
-
-    # Send to all admins
-    from .utils import is_admin_user
-    from .keyboards import consultation_approval_keyboard
-
-    admins = list(database.list_admins())
-    for admin in admins:
-        try:
-            await context.bot.send_photo(
-                chat_id=admin["telegram_id"],
-                photo=receipt_file_id,
-                caption=f"درخواست مشاوره جدید\n\n{user_info_text}",
-                reply_markup=consultation_approval_keyboard(request_id),
-            )
-        except Exception as e:
-            logging.warning(f"Failed to send receipt to admin {admin['telegram_id']}: {e}")
-
     await update.message.reply_text(
         "رسید واریز شما دریافت شد. پس از بررسی، با شما تماس گرفته خواهد شد.",
         reply_markup=build_main_menu_keyboard(user.id),
     )
 
+    # Fan out to admins in the background so the user is not kept waiting
+    context.application.create_task(
+        notify_admins_of_consultation(
+            context.bot,
+            request_id,
+            receipt_file_id,
+            build_consultation_caption(user.id),
+        ),
+        update=update,
+    )
+
 
 async def handle_membership_verification(
     update: Update, context: ContextTypes.DEFAULT_TYPE
@@ -802,9 +506,7 @@ __all__ = [
     "handle_register_phone_callback",
     "handle_sendphone_command",
     "send_main_menu",
-    "send_webinar_content",
-    "send_drop_learning_content",
-    "send_case_study_content",
+    "send_section_content",
     "start",
 ]
 
@@ -0,0 +1,91 @@
+"""Fan-out of consultation receipts to admins."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Iterable, Optional
+
+from telegram import Bot
+from telegram.error import TelegramError
+from telegram.ext import ContextTypes
+
+import database
+from .constants import ADMIN_FANOUT_CONCURRENCY, ADMIN_NOTIFY_MAX_ATTEMPTS
+from .delivery import record_delivery_failure
+from .keyboards import consultation_approval_keyboard
+
+
+def build_consultation_caption(user_id: int) -> str:
+    user_info = database.get_user(user_id)
+    user_info_text = f"""کاربر: {user_info['fname']} {user_info['lname']}
+شماره موبایل: {user_info['phone_number']}
+یوزرنیم: @{user_info['username']}""" if user_info else f"کاربر ID: {user_id}"
+    return f"درخواست مشاوره جدید\n\n{user_info_text}"
+
+
+async def notify_admins_of_consultation(
+    bot: Bot,
+    request_id: int,
+    receipt_file_id: str,
+    caption: str,
+    admin_ids: Optional[Iterable[int]] = None,
+) -> None:
+    """Send a consultation receipt to admins concurrently and record the outcome."""
+    admin_ids = list(database.list_admin_ids() if admin_ids is None else admin_ids)
+    targets = database.filter_reachable(admin_ids)
+    # Unreachable admins get a final status instead of staying due for retry
+    skipped = set(admin_ids).difference(targets)
+
+    semaphore = asyncio.Semaphore(ADMIN_FANOUT_CONCURRENCY)
+
+    async def send(admin_id: int) -> tuple:
+        async with semaphore:
+            try:
+                await bot.send_photo(
+                    chat_id=admin_id,
+                    photo=receipt_file_id,
+                    caption=caption,
+                    reply_markup=consultation_approval_keyboard(request_id),
+                )
+            except Exception as exc:
+                # Any failure must end up as a row the retry job can pick up
+                logging.warning("Failed to send receipt to admin %s: %r", admin_id, exc)
+                if isinstance(exc, TelegramError):
+                    try:
+                        record_delivery_failure(admin_id, exc)
+                    except Exception:
+                        logging.exception("Failed to record delivery state of admin %s", admin_id)
+                return admin_id, str(exc) or type(exc).__name__
+        return admin_id, None
+
+    results = await asyncio.gather(*(send(admin_id) for admin_id in targets))
+    database.record_admin_notifications(request_id, results, skipped)
+
+
+async def retry_failed_admin_notifications(
+    context: ContextTypes.DEFAULT_TYPE,
+) -> None:
+    """JobQueue callback re-sending receipts whose admin delivery failed."""
+    pending: dict[int, list[int]] = {}
+    for row in database.list_failed_admin_notifications(ADMIN_NOTIFY_MAX_ATTEMPTS):
+        pending.setdefault(row["request_id"], []).append(row["admin_id"])
+
+    for request_id, admin_ids in pending.items():
+        request = database.get_consultation_request(request_id)
+        if not request or not request["receipt_photo_file_id"]:
+            continue
+        await notify_admins_of_consultation(
+            context.bot,
+            request_id,
+            request["receipt_photo_file_id"],
+            build_consultation_caption(request["user_id"]),
+            admin_ids=admin_ids,
+        )
+
+
+__all__ = [
+    "build_consultation_caption",
+    "notify_admins_of_consultation",
+    "retry_failed_admin_notifications",
+]
@@ -0,0 +1,78 @@
+"""Cursor-paginated inline lists shared by admin menus."""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+from telegram import InlineKeyboardButton, InlineKeyboardMarkup
+
+PAGE_PREV = "prev"
+PAGE_NEXT = "next"
+
+
+def page_callback(prefix: str, direction: str, cursor: Any) -> str:
+    return f"{prefix}:page:{direction}:{cursor}"
+
+
+def parse_page_callback(data: str, prefix: str) -> Optional[Tuple[int, bool]]:
+    """Return ``(cursor, backward)`` for a page navigation callback, else None."""
+    head = f"{prefix}:page:"
+    if not data.startswith(head):
+        return None
+    try:
+        direction, raw_cursor = data[len(head) :].split(":", maxsplit=1)
+        cursor = int(raw_cursor)
+    except ValueError:
+        return None
+    if direction not in (PAGE_PREV, PAGE_NEXT):
+        return None
+    return cursor, direction == PAGE_PREV
+
+
+def build_paginated_keyboard(
+    page: Dict[str, Any],
+    *,
+    prefix: str,
+    item_button: Callable[[Dict[str, Any]], InlineKeyboardButton],
+    cursor_key: str = "id",
+    header_rows: Sequence[Sequence[InlineKeyboardButton]] = (),
+    footer_rows: Sequence[Sequence[InlineKeyboardButton]] = (),
+) -> InlineKeyboardMarkup:
+    """Render a page returned by the ``*_page`` database helpers.
+
+    Navigation buttons carry the keyset cursor (first/last item key of the
+    page), so rendering the neighbouring page only queries that page.
+    """
+    items = page["items"]
+    keyboard = [list(row) for row in header_rows]
+    keyboard.extend([item_button(item)] for item in items)
+
+    nav_row = []
+    if items and page.get("has_prev"):
+        nav_row.append(
+            InlineKeyboardButton(
+                "« قبلی",
+                callback_data=page_callback(prefix, PAGE_PREV, items[0][cursor_key]),
+            )
+        )
+    if items and page.get("has_next"):
+        nav_row.append(
+            InlineKeyboardButton(
+                "بعدی »",
+                callback_data=page_callback(prefix, PAGE_NEXT, items[-1][cursor_key]),
+            )
+        )
+    if nav_row:
+        keyboard.append(nav_row)
+
+    keyboard.extend(list(row) for row in footer_rows)
+    return InlineKeyboardMarkup(keyboard)
+
+
+__all__ = [
+    "PAGE_NEXT",
+    "PAGE_PREV",
+    "build_paginated_keyboard",
+    "page_callback",
+    "parse_page_callback",
+]
@@ -0,0 +1,118 @@
+"""Pre-resolved delivery plans for catalogue items.
+
+A plan is a JSON-serialisable list of steps. Each step holds the Bot API
+calls to make in order (``method`` plus ``kwargs`` without ``chat_id``) and
+an optional ``fallback`` replayed when any call in the step fails. Plans are
+built from the catalogue rows once, persisted in ``delivery_plans`` and
+invalidated by the database layer whenever the item or its files change.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, Callable, Dict, List, Optional
+
+from telegram import Bot
+
+import database
+from .sections import SECTIONS
+
+PLAN_FORMAT = 1
+
+# file_type -> (Bot method, media keyword)
+SEND_METHODS = {
+    "video": ("send_video", "video"),
+    "voice": ("send_voice", "voice"),
+    "audio": ("send_audio", "audio"),
+    "document": ("send_document", "document"),
+    "photo": ("send_photo", "photo"),
+    "video_note": ("send_video_note", "video_note"),
+}
+# Types whose send method has no caption; the caption follows as a message
+CAPTIONLESS_TYPES = {"video_note"}
+
+
+def _call(method: str, **kwargs: Any) -> Dict[str, Any]:
+    return {"method": method, "kwargs": kwargs}
+
+
+def _intro_step(item: Dict[str, Any], with_cover: bool) -> Dict[str, Any]:
+    description = item["description"]
+    text = _call("send_message", text=description)
+    cover = item.get("cover_photo_file_id") if with_cover else None
+    if not cover:
+        return {"group": "intro", "calls": [text]}
+    return {
+        "group": "intro",
+        "calls": [_call("send_photo", photo=cover, caption=description)],
+        "fallback": [text],
+    }
+
+
+def _content_step(content: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    file_type = content["file_type"]
+    if file_type not in SEND_METHODS:
+        return None
+    method, field = SEND_METHODS[file_type]
+    kwargs = {field: content["file_id"]}
+    caption = content.get("caption") or None
+    calls = [{"method": method, "kwargs": kwargs}]
+    if caption and file_type in CAPTIONLESS_TYPES:
+        calls.append(_call("send_message", text=caption))
+    elif caption:
+        kwargs["caption"] = caption
+    return {"group": f"content:{content['id']}", "calls": calls}
+
+
+def build_delivery_plan(section: str, item_id: int) -> Optional[Dict[str, Any]]:
+    """Compile and persist the plan for an item; None if the item is gone."""
+    version = database.read_plans_version()
+    item = database.get_section_item(section, item_id)
+    if not item:
+        return None
+    steps: List[Dict[str, Any]] = [_intro_step(item, SECTIONS[section].send_cover)]
+    for content in database.get_section_content(section, item_id):
+        step = _content_step(content)
+        if step is not None:
+            steps.append(step)
+    plan = {"format": PLAN_FORMAT, "steps": steps}
+    if not database.save_delivery_plan(section, item_id, plan, version):
+        logging.info("Catalogue changed while building %s %s plan", section, item_id)
+    return plan
+
+
+def get_delivery_plan(section: str, item_id: int) -> Optional[Dict[str, Any]]:
+    """Return the cached plan, building it on first use."""
+    plan = database.get_delivery_plan(section, item_id)
+    if plan is None or plan.get("format") != PLAN_FORMAT:
+        plan = build_delivery_plan(section, item_id)
+    return plan
+
+
+async def _replay(bot: Bot, chat_id: int, calls: List[Dict[str, Any]]) -> None:
+    for call in calls:
+        method: Callable = getattr(bot, call["method"])
+        await method(chat_id=chat_id, **call["kwargs"])
+
+
+async def deliver_plan(bot: Bot, chat_id: int, plan: Dict[str, Any], label: str) -> int:
+    """Replay ``plan`` into ``chat_id``; return the number of failed steps."""
+    failed = 0
+    for step in plan["steps"]:
+        try:
+            await _replay(bot, chat_id, step["calls"])
+            continue
+        except Exception as exc:
+            if not step.get("fallback"):
+                failed += 1
+                logging.warning("Failed to send %s %s: %s", label, step["group"], exc)
+                continue
+        try:
+            await _replay(bot, chat_id, step["fallback"])
+        except Exception as exc:
+            failed += 1
+            logging.warning("Failed to send %s %s fallback: %s", label, step["group"], exc)
+    return failed
+
+
+__all__ = ["build_delivery_plan", "deliver_plan", "get_delivery_plan"]
@@ -0,0 +1,246 @@
+"""On-demand profiling of a running bot, driven by admin commands.
+
+``/profile 30s`` profiles the next 30 seconds, ``/profile 200u`` the next
+200 updates (bounded by ``PROFILE_MAX_SECONDS``). While a session runs,
+cProfile records everything executed on the event loop thread, including
+handler dispatch, and ``tracemalloc`` traces allocations. At the end the
+admin receives the top hotspots and allocation growth as a message and the
+raw stats as a ``.prof`` file (``python -m pstats`` or snakeviz can open it).
+Only the process that handles the admin's updates is profiled.
+
+``/dbstats`` reports the per-statement counters kept by ``database`` (the
+busiest statements as a message, all of them as a JSON file);
+``/dbstats reset`` clears them.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import io
+import json
+import logging
+import marshal
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from telegram import Bot, InputFile, Update
+from telegram.error import TelegramError
+from telegram.ext import ContextTypes
+
+import database
+from .constants import (
+    PROFILE_DEFAULT_SECONDS,
+    PROFILE_MAX_SECONDS,
+    PROFILE_MAX_UPDATES,
+    PROFILE_TOP_N,
+    PROFILE_TRACEMALLOC_FRAMES,
+)
+from .utils import is_admin_user
+
+USAGE = (
+    "استفاده: /profile [مدت]\n"
+    "مثال: /profile 30s برای ۳۰ ثانیه یا /profile 200u برای ۲۰۰ آپدیت بعدی."
+)
+JOB_NAME = "profile_session"
+TELEGRAM_TEXT_LIMIT = 4096
+
+
+def parse_profile_args(args: List[str]) -> Tuple[int, Optional[int]]:
+    """Return ``(seconds, updates)``; ``updates`` is None for a timed session."""
+    if not args:
+        return PROFILE_DEFAULT_SECONDS, None
+    raw = args[0].strip().lower()
+    unit = raw[-1] if raw[-1:] in ("s", "u") else "s"
+    value = int(raw.rstrip("su"))
+    if value <= 0:
+        raise ValueError("duration must be positive")
+    if unit == "u":
+        return PROFILE_MAX_SECONDS, min(value, PROFILE_MAX_UPDATES)
+    return min(value, PROFILE_MAX_SECONDS), None
+
+
+def _short_path(filename: str) -> str:
+    parts = Path(filename).parts
+    return "/".join(parts[-2:]) if len(parts) > 1 else filename
+
+
+class ProfileSession:
+    """One cProfile + tracemalloc recording, started and stopped on the loop thread."""
+
+    def __init__(self, chat_id: int, seconds: int, updates: Optional[int]) -> None:
+        self.chat_id = chat_id
+        self.seconds = seconds
+        self.updates = updates
+        self.updates_seen = 0
+        self.profiler = cProfile.Profile()
+        self._owns_tracemalloc = False
+        self._snapshot: Optional[tracemalloc.Snapshot] = None
+        self._started = 0.0
+        self.elapsed = 0.0
+
+    @property
+    def updates_profiled(self) -> int:
+        # A count session ends on the update after its last one, before handling it
+        if self.updates is None:
+            return self.updates_seen
+        return min(self.updates_seen, self.updates)
+
+    def start(self) -> None:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(PROFILE_TRACEMALLOC_FRAMES)
+            self._owns_tracemalloc = True
+        self._snapshot = tracemalloc.take_snapshot()
+        self._started = time.perf_counter()
+        self.profiler.enable()
+
+    def stop(self) -> List[tracemalloc.StatisticDiff]:
+        self.profiler.disable()
+        self.elapsed = time.perf_counter() - self._started
+        growth = tracemalloc.take_snapshot().compare_to(self._snapshot, "lineno")
+        if self._owns_tracemalloc:
+            tracemalloc.stop()
+        return growth
+
+    def hotspots(self, limit: int) -> List[str]:
+        self.profiler.create_stats()
+        rows = sorted(
+            self.profiler.stats.items(), key=lambda item: item[1][2], reverse=True
+        )[:limit]
+        lines = []
+        for (filename, line, func), (_, calls, self_time, cumulative, _) in rows:
+            lines.append(
+                f"{self_time * 1000:8.1f}ms self {cumulative * 1000:8.1f}ms cum "
+                f"{calls:7d}x {_short_path(filename)}:{line} {func}"
+            )
+        return lines
+
+    def dump(self) -> bytes:
+        """Stats in the ``pstats`` file format."""
+        self.profiler.create_stats()
+        return marshal.dumps(self.profiler.stats)
+
+
+_session: Optional[ProfileSession] = None
+
+
+def _format_report(session: ProfileSession, growth: List[tracemalloc.StatisticDiff]) -> str:
+    lines = [
+        f"📈 نتیجه پروفایل ({session.elapsed:.1f} ثانیه، {session.updates_profiled} آپدیت)",
+        "",
+        f"Top {PROFILE_TOP_N} by self time:",
+        *session.hotspots(PROFILE_TOP_N),
+        "",
+        "Allocation growth (tracemalloc):",
+    ]
+    for stat in growth[:PROFILE_TOP_N]:
+        frame = stat.traceback[0]
+        lines.append(
+            f"{stat.size_diff / 1024:+9.1f} KiB {stat.count_diff:+7d} blocks "
+            f"{_short_path(frame.filename)}:{frame.lineno}"
+        )
+    text = "\n".join(lines)
+    return text[: TELEGRAM_TEXT_LIMIT - 1] + "…" if len(text) > TELEGRAM_TEXT_LIMIT else text
+
+
+async def finish_profile_session(bot: Bot) -> None:
+    """Stop the running session and send its report to the admin who started it."""
+    global _session
+    session, _session = _session, None
+    if session is None:
+        return
+    growth = session.stop()
+    report = _format_report(session, growth)
+    logging.info("Profile session finished after %.1fs", session.elapsed)
+    filename = f"profile-{datetime.now():%Y%m%d-%H%M%S}.prof"
+    try:
+        await bot.send_message(chat_id=session.chat_id, text=report)
+        await bot.send_document(
+            chat_id=session.chat_id,
+            document=InputFile(io.BytesIO(session.dump()), filename=filename),
+        )
+    except TelegramError as exc:
+        logging.warning("Failed to send profile report to %s: %s", session.chat_id, exc)
+
+
+async def _finish_job(context: ContextTypes.DEFAULT_TYPE) -> None:
+    await finish_profile_session(context.bot)
+
+
+async def handle_profile_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """/profile [Ns|Nu]: admins profile the next N seconds or N updates."""
+    global _session
+    user = update.effective_user
+    if not user or not update.message or not is_admin_user(user.id):
+        return
+    if _session is not None:
+        await update.message.reply_text("⏳ یک پروفایل در حال اجراست؛ صبر کنید تا نتیجه ارسال شود.")
+        return
+    try:
+        seconds, updates = parse_profile_args(context.args or [])
+    except ValueError:
+        await update.message.reply_text(USAGE)
+        return
+
+    _session = ProfileSession(update.effective_chat.id, seconds, updates)
+    _session.start()
+    # Timed sessions end here; update-count sessions use it as a cap
+    context.job_queue.run_once(_finish_job, when=seconds, name=JOB_NAME)
+    scope = f"{updates} آپدیت بعدی" if updates else f"{seconds} ثانیه"
+    await update.message.reply_text(f"🔬 پروفایل برای {scope} فعال شد.")
+
+
+async def count_profiled_update(update: object, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """TypeHandler callback ending update-count sessions after N updates."""
+    session = _session
+    if session is None:
+        return
+    session.updates_seen += 1
+    if session.updates is not None and session.updates_seen > session.updates:
+        for job in context.job_queue.get_jobs_by_name(JOB_NAME):
+            job.schedule_removal()
+        await finish_profile_session(context.bot)
+
+
+def _format_query_stats(stats: List[dict]) -> str:
+    lines = [f"🗄 آمار کوئری‌ها ({len(stats)} دستور)", ""]
+    for stat in stats[:PROFILE_TOP_N]:
+        lines.append(
+            f"{stat['total_ms']:9.1f}ms total {stat['calls']:7d}x "
+            f"mean {stat['mean_ms']:.2f}ms max {stat['max_ms']:.1f}ms slow {stat['slow']}"
+        )
+        lines.append(f"  {stat['sql'][:200]}")
+    text = "\n".join(lines)
+    return text[: TELEGRAM_TEXT_LIMIT - 1] + "…" if len(text) > TELEGRAM_TEXT_LIMIT else text
+
+
+async def handle_dbstats_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """/dbstats [reset]: admins get the per-statement database timings."""
+    user = update.effective_user
+    if not user or not update.message or not is_admin_user(user.id):
+        return
+    if context.args and context.args[0].lower() == "reset":
+        database.reset_query_stats()
+        await update.message.reply_text("🧹 آمار کوئری‌ها پاک شد.")
+        return
+    stats = database.query_stats()
+    if not stats:
+        await update.message.reply_text("هنوز کوئری‌ای ثبت نشده است.")
+        return
+    await update.message.reply_text(_format_query_stats(stats))
+    payload = json.dumps(stats, ensure_ascii=False, indent=2).encode("utf-8")
+    await update.message.reply_document(
+        InputFile(io.BytesIO(payload), filename=f"query-stats-{datetime.now():%Y%m%d-%H%M%S}.json")
+    )
+
+
+__all__ = [
+    "ProfileSession",
+    "count_profiled_update",
+    "finish_profile_session",
+    "handle_dbstats_command",
+    "handle_profile_command",
+    "parse_profile_args",
+]
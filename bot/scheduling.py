@@ -0,0 +1,151 @@
+"""Scheduled and recurring broadcasts persisted in SQLite and run by the JobQueue."""
+
+from __future__ import annotations
+
+import logging
+import time
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+from telegram.error import TelegramError
+from telegram.ext import Application, ContextTypes, JobQueue
+
+import database
+from .broadcast import format_broadcast_summary, make_copy_sender, run_broadcast
+from .config import get_bot_timezone
+
+SCHEDULE_TIME_FORMAT = "%Y-%m-%d %H:%M"
+
+RECURRENCE_KEYWORDS = {
+    "daily": 86400,
+    "روزانه": 86400,
+    "weekly": 7 * 86400,
+    "هفتگی": 7 * 86400,
+}
+RECURRENCE_LABELS = {86400: "روزانه", 7 * 86400: "هفتگی"}
+
+
+def _job_name(broadcast_id: int) -> str:
+    return f"scheduled_broadcast:{broadcast_id}"
+
+
+def parse_schedule(text: str, now: Optional[float] = None) -> Tuple[int, Optional[int]]:
+    """Parse ``YYYY-MM-DD HH:MM [daily|weekly]`` into ``(run_at, interval)``.
+
+    Times are read in the configured bot timezone. Raises ValueError for
+    malformed input or a one-off time in the past.
+    """
+    parts = text.split()
+    interval = None
+    if len(parts) == 3:
+        interval = RECURRENCE_KEYWORDS.get(parts[2].lower())
+        if interval is None:
+            raise ValueError("unknown recurrence")
+        parts = parts[:2]
+    if len(parts) != 2:
+        raise ValueError("expected date and time")
+
+    local = datetime.strptime(" ".join(parts), SCHEDULE_TIME_FORMAT)
+    run_at = int(local.replace(tzinfo=get_bot_timezone()).timestamp())
+    now = time.time() if now is None else now
+    if run_at <= now:
+        if interval is None:
+            raise ValueError("time is in the past")
+        run_at = _next_run_at(run_at, interval, now)
+    return run_at, interval
+
+
+def _next_run_at(run_at: int, interval: int, now: float) -> int:
+    missed = int((now - run_at) // interval) + 1
+    return run_at + max(missed, 1) * interval
+
+
+def format_run_at(run_at: int) -> str:
+    return datetime.fromtimestamp(run_at, get_bot_timezone()).strftime(SCHEDULE_TIME_FORMAT)
+
+
+def describe_scheduled_broadcast(broadcast: Dict[str, Any]) -> str:
+    recurrence = RECURRENCE_LABELS.get(broadcast["interval_seconds"], "یک‌بار")
+    return f"{format_run_at(broadcast['run_at'])} ({recurrence}) - {broadcast['label']}"
+
+
+def schedule_broadcast_job(job_queue: JobQueue, broadcast: Dict[str, Any]) -> None:
+    """Queue the next run of a persisted broadcast, replacing any earlier job."""
+    for job in job_queue.get_jobs_by_name(_job_name(broadcast["id"])):
+        job.schedule_removal()
+    job_queue.run_once(
+        run_scheduled_broadcast,
+        when=max(broadcast["run_at"] - time.time(), 0),
+        data=broadcast["id"],
+        name=_job_name(broadcast["id"]),
+    )
+
+
+def unschedule_broadcast_job(job_queue: JobQueue, broadcast_id: int) -> None:
+    for job in job_queue.get_jobs_by_name(_job_name(broadcast_id)):
+        job.schedule_removal()
+
+
+def restore_scheduled_broadcasts(application: Application) -> int:
+    """Queue every active scheduled broadcast that has no job in this process."""
+    job_queue = application.job_queue
+    if job_queue is None:
+        return 0
+    restored = 0
+    for broadcast in database.list_active_scheduled_broadcasts():
+        if not job_queue.get_jobs_by_name(_job_name(broadcast["id"])):
+            schedule_broadcast_job(job_queue, broadcast)
+            restored += 1
+    if restored:
+        logging.info("Restored %d scheduled broadcasts", restored)
+    return restored
+
+
+async def run_scheduled_broadcast(context: ContextTypes.DEFAULT_TYPE) -> None:
+    """JobQueue callback delivering one scheduled broadcast."""
+    broadcast = database.get_scheduled_broadcast(context.job.data)
+    if not broadcast or broadcast["status"] != database.SCHEDULE_ACTIVE:
+        return
+
+    # Advance the schedule before sending so a crash mid-run does not resend.
+    # The claim on run_at also stops a second process holding a job for the
+    # same broadcast (e.g. around a leader failover) from sending it again.
+    now = int(time.time())
+    next_run_at = None
+    if broadcast["interval_seconds"]:
+        next_run_at = _next_run_at(broadcast["run_at"], broadcast["interval_seconds"], now)
+    if not database.mark_scheduled_broadcast_run(
+        broadcast["id"], now, next_run_at, claimed_run_at=broadcast["run_at"]
+    ):
+        return
+    if next_run_at is not None:
+        schedule_broadcast_job(context.job_queue, {**broadcast, "run_at": next_run_at})
+
+    result = await run_broadcast(
+        broadcast["segment"],
+        make_copy_sender(context.bot, broadcast["from_chat_id"], broadcast["message_ids"]),
+        spread_seconds=broadcast["spread_seconds"],
+    )
+
+    if broadcast["created_by"]:
+        try:
+            await context.bot.send_message(
+                chat_id=broadcast["created_by"],
+                text="📅 ارسال زمان‌بندی‌شده انجام شد.\n\n"
+                + format_broadcast_summary(broadcast["label"], result),
+            )
+        except TelegramError as exc:
+            logging.warning(
+                "Failed to report scheduled broadcast %s: %s", broadcast["id"], exc
+            )
+
+
+__all__ = [
+    "describe_scheduled_broadcast",
+    "format_run_at",
+    "parse_schedule",
+    "restore_scheduled_broadcasts",
+    "run_scheduled_broadcast",
+    "schedule_broadcast_job",
+    "unschedule_broadcast_job",
+]
@@ -0,0 +1,78 @@
+"""User-facing configuration of the catalogue sections.
+
+The storage side of each section lives in ``database.CONTENT_SECTIONS``;
+this module only holds the texts and ``user_data`` keys the menus use.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, NamedTuple
+
+
+class Section(NamedTuple):
+    name: str  # key in database.CONTENT_SECTIONS
+    label: str
+    menu_button: str
+    untitled: str
+    empty_text: str
+    choose_text: str
+    unavailable_text: str
+    menu_key: str  # user_data: title -> item id of the open list
+    pending_key: str  # user_data: item waiting for phone registration
+    send_cover: bool
+
+
+SECTIONS: Dict[str, Section] = {
+    "webinar": Section(
+        name="webinar",
+        label="وبینار",
+        menu_button="وبینار ها",
+        untitled="وبینار بدون عنوان",
+        empty_text="در حال حاضر وبیناری ثبت نشده است.",
+        choose_text="یکی از وبینارهای زیر را انتخاب کن:",
+        unavailable_text="این وبینار دیگر در دسترس نیست.",
+        menu_key="webinar_menu",
+        pending_key="pending_webinar_id",
+        send_cover=True,
+    ),
+    "drop_learning": Section(
+        name="drop_learning",
+        label="دراپ لرنینگ",
+        menu_button="دراپ لرنینگ",
+        untitled="دراپ لرنینگ بدون عنوان",
+        empty_text="در حال حاضر دراپ لرنینگی ثبت نشده است.",
+        choose_text="یکی از دراپ لرنینگ‌های زیر را انتخاب کن:",
+        unavailable_text="این دراپ لرنینگ دیگر در دسترس نیست.",
+        menu_key="drop_learning_menu",
+        pending_key="pending_drop_learning_id",
+        send_cover=False,
+    ),
+    "case_study": Section(
+        name="case_study",
+        label="کیس استادی",
+        menu_button="Case Studies",
+        untitled="کیس استادی بدون عنوان",
+        empty_text="در حال حاضر کیس استادی ثبت نشده است.",
+        choose_text="یکی از کیس استادی‌های زیر را انتخاب کن:",
+        unavailable_text="این کیس استادی دیگر در دسترس نیست.",
+        menu_key="case_studies_menu",
+        pending_key="pending_case_study_id",
+        send_cover=True,
+    ),
+}
+
+SECTIONS_BY_BUTTON: Dict[str, Section] = {
+    section.menu_button: section for section in SECTIONS.values()
+}
+
+
+def pop_pending_item(user_data: dict) -> tuple:
+    """Return and clear the first ``(section, item_id)`` waiting for the user."""
+    for section in SECTIONS.values():
+        item_id = user_data.pop(section.pending_key, None)
+        if item_id:
+            return section.name, item_id
+    return None, None
+
+
+__all__ = ["SECTIONS", "SECTIONS_BY_BUTTON", "Section", "pop_pending_item"]
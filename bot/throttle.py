@@ -0,0 +1,129 @@
+"""Per-user anti-flood throttling ahead of every handler.
+
+Each user has a token bucket holding up to ``THROTTLE_BURST`` updates and
+refilling at ``THROTTLE_RATE`` per second. An update that finds the bucket
+empty is dropped before the membership guard, database work or content
+sends run: ``throttle_updates`` raises ``ApplicationHandlerStop`` from
+handler group -1. The user gets one short "slow down" notice per
+``THROTTLE_NOTICE_WINDOW``; further excess updates are dropped silently.
+Admins are never throttled. All updates of a user reach the same process,
+also in multi-process mode, so buckets stay per process.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+from telegram import Update
+from telegram.error import TelegramError
+from telegram.ext import ApplicationHandlerStop, ContextTypes
+
+from .constants import (
+    THROTTLE_BURST,
+    THROTTLE_NOTICE_WINDOW,
+    THROTTLE_PRUNE_EVERY,
+    THROTTLE_RATE,
+    THROTTLE_TOP_BLOCKED,
+)
+from .utils import is_admin_user
+
+SLOW_DOWN_TEXT = "⏳ لطفاً کمی آهسته‌تر؛ چند پیام آخر شما نادیده گرفته شد."
+
+
+class TokenBucketThrottle:
+    """Token buckets keyed by user id, plus counters for the metrics."""
+
+    def __init__(self, rate: float, burst: int, notice_window: float) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.notice_window = notice_window
+        # user id -> [tokens, refilled at, last notice at]
+        self.buckets: Dict[int, List[float]] = {}
+        self.allowed = 0
+        self.blocked = 0
+        self.notices = 0
+        self.blocked_by_user: Counter = Counter()
+        self._since_prune = 0
+
+    def allow(self, user_id: int, now: Optional[float] = None) -> bool:
+        now = time.monotonic() if now is None else now
+        bucket = self.buckets.get(user_id)
+        if bucket is None:
+            bucket = self.buckets[user_id] = [float(self.burst), now, float("-inf")]
+        else:
+            bucket[0] = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+            bucket[1] = now
+        self._since_prune += 1
+        if self._since_prune >= THROTTLE_PRUNE_EVERY:
+            self.prune(now)
+        if bucket[0] >= 1:
+            bucket[0] -= 1
+            self.allowed += 1
+            return True
+        return False
+
+    def record_blocked(self, user_id: int, now: Optional[float] = None) -> bool:
+        """Count a dropped update; True when the user should get a notice."""
+        now = time.monotonic() if now is None else now
+        self.blocked += 1
+        self.blocked_by_user[user_id] += 1
+        bucket = self.buckets[user_id]
+        if now - bucket[2] < self.notice_window:
+            return False
+        bucket[2] = now
+        self.notices += 1
+        return True
+
+    def prune(self, now: float) -> None:
+        """Forget idle buckets and all but the most blocked users' counts."""
+        self._since_prune = 0
+        idle = max(self.burst / self.rate, self.notice_window)
+        for user_id in [uid for uid, bucket in self.buckets.items() if now - bucket[1] > idle]:
+            del self.buckets[user_id]
+        if len(self.blocked_by_user) > THROTTLE_TOP_BLOCKED:
+            self.blocked_by_user = Counter(
+                dict(self.blocked_by_user.most_common(THROTTLE_TOP_BLOCKED))
+            )
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "allowed": self.allowed,
+            "blocked": self.blocked,
+            "notices": self.notices,
+            "tracked_users": len(self.buckets),
+            "top_blocked": [
+                {"user_id": user_id, "blocked": count}
+                for user_id, count in self.blocked_by_user.most_common(5)
+            ],
+        }
+
+
+throttle = TokenBucketThrottle(THROTTLE_RATE, THROTTLE_BURST, THROTTLE_NOTICE_WINDOW)
+
+
+async def throttle_updates(update: object, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """TypeHandler callback dropping updates of users over their rate."""
+    if not isinstance(update, Update) or update.effective_user is None:
+        return
+    user_id = update.effective_user.id
+    if throttle.allow(user_id):
+        return
+    # Checked only once over the limit, so normal traffic skips the lookup
+    if is_admin_user(user_id):
+        return
+    if throttle.record_blocked(user_id):
+        logging.info("Throttling user %s", user_id)
+        try:
+            if update.callback_query:
+                await update.callback_query.answer(SLOW_DOWN_TEXT)
+            elif update.effective_message:
+                await update.effective_message.reply_text(SLOW_DOWN_TEXT)
+        except TelegramError as exc:
+            logging.debug("Failed to send slow-down notice to %s: %s", user_id, exc)
+    raise ApplicationHandlerStop
+
+
+__all__ = ["TokenBucketThrottle", "throttle", "throttle_updates"]
@@ -11,7 +11,8 @@ from telegram.error import TelegramError
 from telegram.ext import ContextTypes
 
 import database
-from .constants import TEMP_ADMIN_IDS
+from .constants import PHONE_REQUIREMENT_SETTING, TEMP_ADMIN_IDS
+from .delivery import record_delivery_failure
 from .keyboards import REQUEST_CONTACT_KEYBOARD
 
 
@@ -28,10 +29,16 @@ def ensure_user_record(update: Update) -> None:
 
 
 def phone_requirement_enabled(context: ContextTypes.DEFAULT_TYPE) -> bool:
+    # Stored as a bot setting so every worker process sees the admin toggle;
+    # bot_data carries the REQUIRE_PHONE_DEFAULT fallback.
+    stored = database.get_bot_setting(PHONE_REQUIREMENT_SETTING)
+    if stored:
+        return stored == "1"
     return bool(context.application.bot_data.get("require_phone", False))
 
 
 def set_phone_requirement(context: ContextTypes.DEFAULT_TYPE, value: bool) -> None:
+    database.set_bot_setting(PHONE_REQUIREMENT_SETTING, "1" if value else "0")
     context.application.bot_data["require_phone"] = value
 
 
@@ -65,8 +72,16 @@ async def notify_admin_status_change(
             text=message,
             parse_mode=ParseMode.HTML,
         )
-    except TelegramError:
+    except TelegramError as exc:
         logging.warning("Failed to notify user %s about admin status change", telegram_id)
+        record_delivery_failure(telegram_id, exc)
+
+
+async def refresh_shared_caches(context: ContextTypes.DEFAULT_TYPE) -> None:
+    """JobQueue callback picking up cache changes made by other processes."""
+    database.refresh_settings()
+    database.refresh_admins()
+    database.refresh_delivery_plans()
 
 
 async def prompt_for_contact(update: Update) -> None:
@@ -85,6 +100,7 @@ __all__ = [
     "is_admin_user",
     "notify_admin_status_change",
     "prompt_for_contact",
+    "refresh_shared_caches",
 ]
 
 
@@ -0,0 +1,220 @@
+"""Write-behind buffer for content view tracking."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from telegram.ext import ContextTypes
+
+import database
+from .config import get_content_events_retention_days
+from .constants import (
+    VIEW_BUFFER_MAX_EVENTS,
+    VIEW_FLUSH_INTERVAL_MS,
+    VIEW_FLUSH_MAX_BACKOFF_MS,
+    VIEW_FLUSH_MAX_EVENTS,
+)
+
+
+class ViewBuffer:
+    """Collect view events in memory and persist them in batches.
+
+    Every view is appended to the ``content_events`` log, while first-view
+    rows are deduplicated per ``(section, user_id, item_id)`` until the next
+    flush. A flush happens every ``flush_interval_ms`` or as soon as
+    ``max_events`` events are pending, whichever comes first.
+
+    While flushes fail, retries back off exponentially up to
+    ``max_backoff_ms`` and at most ``max_buffered`` events are kept: the
+    oldest repeat views are dropped first, first-view keys are never dropped.
+    """
+
+    def __init__(
+        self,
+        *,
+        flush_interval_ms: int = VIEW_FLUSH_INTERVAL_MS,
+        max_events: int = VIEW_FLUSH_MAX_EVENTS,
+        max_buffered: int = VIEW_BUFFER_MAX_EVENTS,
+        max_backoff_ms: int = VIEW_FLUSH_MAX_BACKOFF_MS,
+    ) -> None:
+        self.flush_interval = flush_interval_ms / 1000
+        self.max_events = max_events
+        self.max_buffered = max_buffered
+        self.max_backoff = max_backoff_ms / 1000
+        self._failures = 0
+        self._retry_at = 0.0
+        self._pending: Set[Tuple[str, int, int]] = set()
+        self._events: List[Tuple[int, str, int, str, int]] = []
+        self._wake: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self._stats: Dict[str, Any] = {
+            "recorded": 0,
+            "deduplicated": 0,
+            "flushes": 0,
+            "failed_flushes": 0,
+            "dropped_events": 0,
+            "flushed_events": 0,
+            "last_batch_size": 0,
+            "max_batch_size": 0,
+            "last_flush_ms": 0.0,
+            "max_flush_ms": 0.0,
+            "total_flush_ms": 0.0,
+        }
+
+    def record(self, section: str, user_id: int, item_id: int) -> None:
+        if section not in database.VIEW_TABLES:
+            raise ValueError(f"Unknown view section: {section}")
+        key = (section, user_id, item_id)
+        self._stats["recorded"] += 1
+        self._events.append(
+            (user_id, section, item_id, database.CONTENT_EVENT_VIEW, int(time.time()))
+        )
+        if key in self._pending:
+            self._stats["deduplicated"] += 1
+        else:
+            self._pending.add(key)
+        if len(self._events) > self.max_buffered:
+            self._shed()
+        if len(self._events) >= self.max_events and self._wake is not None:
+            self._wake.set()
+
+    def _shed(self) -> None:
+        """Drop the oldest events down to 90% of ``max_buffered``.
+
+        Repeat views of a key go first; first-view keys stay in ``_pending``
+        either way, so only raw event log rows are lost.
+        """
+        excess = len(self._events) - self.max_buffered * 9 // 10
+        seen: Set[Tuple[str, int, int]] = set()
+        kept = []
+        for event in self._events:
+            key = (event[1], event[0], event[2])
+            if excess > 0 and key in seen:
+                excess -= 1
+                continue
+            seen.add(key)
+            kept.append(event)
+        if excess > 0:
+            kept = kept[excess:]
+        self._stats["dropped_events"] += len(self._events) - len(kept)
+        self._events = kept
+
+    @property
+    def pending(self) -> int:
+        return len(self._events)
+
+    def metrics(self) -> Dict[str, Any]:
+        stats = dict(self._stats)
+        stats["pending"] = len(self._events)
+        stats["avg_batch_size"] = (
+            stats["flushed_events"] / stats["flushes"] if stats["flushes"] else 0.0
+        )
+        stats["avg_flush_ms"] = (
+            stats["total_flush_ms"] / stats["flushes"] if stats["flushes"] else 0.0
+        )
+        return stats
+
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+        self._wake = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._task = asyncio.create_task(self._run(), name="view_buffer_flush")
+
+    async def stop(self) -> None:
+        """Stop the background flusher and persist anything still pending."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+        logging.info("View buffer stopped: %s", self.metrics())
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            # After failed flushes, wake-ups wait for the backoff to pass
+            delay = self._retry_at - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._wake.clear()
+            await self.flush()
+
+    async def flush(self) -> int:
+        """Write pending events in a single transaction; return the batch size."""
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
+        async with self._flush_lock:
+            if not self._events:
+                return 0
+            batch, self._pending = self._pending, set()
+            events, self._events = self._events, []
+            started = time.perf_counter()
+            try:
+                await asyncio.to_thread(database.record_views_batch, batch, events)
+            except Exception:
+                # The transaction rolled back; keep everything for the next attempt.
+                self._pending |= batch
+                self._events[:0] = events
+                if len(self._events) > self.max_buffered:
+                    self._shed()
+                self._failures += 1
+                backoff = min(self.flush_interval * 2 ** self._failures, self.max_backoff)
+                self._retry_at = time.monotonic() + backoff
+                self._stats["failed_flushes"] += 1
+                logging.exception(
+                    "Failed to flush %d view events; retrying in %.1fs", len(events), backoff
+                )
+                return 0
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            self._failures = 0
+            self._retry_at = 0.0
+
+        size = len(events)
+        stats = self._stats
+        stats["flushes"] += 1
+        stats["flushed_events"] += size
+        stats["last_batch_size"] = size
+        stats["max_batch_size"] = max(stats["max_batch_size"], size)
+        stats["last_flush_ms"] = elapsed_ms
+        stats["max_flush_ms"] = max(stats["max_flush_ms"], elapsed_ms)
+        stats["total_flush_ms"] += elapsed_ms
+        logging.debug("Flushed %d view events in %.1fms", size, elapsed_ms)
+        return size
+
+
+view_buffer = ViewBuffer()
+
+
+async def roll_up_content_events(context: ContextTypes.DEFAULT_TYPE) -> None:
+    """JobQueue callback folding raw view events into rollups and pruning old ones."""
+    retention_days = get_content_events_retention_days()
+    processed = await asyncio.to_thread(database.rollup_content_events)
+    pruned = await asyncio.to_thread(database.prune_content_events, retention_days)
+    # Daily viewer sketches follow the same retention as the raw events
+    pruned_sketches = await asyncio.to_thread(database.prune_viewer_sketches, retention_days)
+    if processed or pruned or pruned_sketches:
+        logging.info(
+            "Rolled up %d content events, pruned %d raw events and %d daily sketches",
+            processed,
+            pruned,
+            pruned_sketches,
+        )
+
+
+def record_view(section: str, user_id: int, item_id: int) -> None:
+    """Queue a content view for the next batched write."""
+    view_buffer.record(section, user_id, item_id)
+
+
+__all__ = ["ViewBuffer", "record_view", "roll_up_content_events", "view_buffer"]
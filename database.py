@@ -1,16 +1,229 @@
 from __future__ import annotations
 
+import json
+import logging
 import sqlite3
+import threading
+import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Iterable, Optional
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional
+
+from hyperloglog import HyperLogLog, merge_blobs
 
 DB_PATH = Path(__file__).resolve().parent / "bot.sqlite3"
 
+class ContentSection(NamedTuple):
+    items_table: str
+    content_table: str
+    views_table: str
+    item_column: str  # foreign key to items_table in the content and views tables
+
+
+CONTENT_SECTIONS: Dict[str, ContentSection] = {
+    "webinar": ContentSection("webinars", "webinar_content", "webinar_views", "webinar_id"),
+    "drop_learning": ContentSection(
+        "drop_learning", "drop_learning_content", "drop_learning_views", "drop_learning_id"
+    ),
+    "case_study": ContentSection(
+        "case_studies", "case_studies_content", "case_studies_views", "case_study_id"
+    ),
+}
+CATALOGUE_TABLES = tuple(section.items_table for section in CONTENT_SECTIONS.values())
+CONTENT_ITEM_TABLES = {name: section.items_table for name, section in CONTENT_SECTIONS.items()}
+CONTENT_TABLES = {
+    name: (section.content_table, section.item_column)
+    for name, section in CONTENT_SECTIONS.items()
+}
+VIEW_TABLES = {
+    name: (section.views_table, section.item_column)
+    for name, section in CONTENT_SECTIONS.items()
+}
+
+DELIVERY_ACTIVE = "active"
+DELIVERY_BLOCKED = "blocked"
+DELIVERY_DEACTIVATED = "deactivated"
+DELIVERY_STATES = (DELIVERY_ACTIVE, DELIVERY_BLOCKED, DELIVERY_DEACTIVATED)
+
+# Rollup table per bucket width in seconds
+CONTENT_ROLLUP_TABLES = {3600: "content_events_hourly", 86400: "content_events_daily"}
+CONTENT_EVENT_VIEW = "view"
+CONTENT_ROLLUP_WATERMARK = "content_events"
+
+
+# Per-statement timing. Every connection comes from _connect(), whose
+# cursors add execute and fetch time to _query_stats; a statement slower
+# than the threshold is logged once with redacted parameters and its plan.
+QUERY_PLAN_PREFIXES = ("SELECT", "WITH", "INSERT", "UPDATE", "DELETE", "REPLACE")
+
+_slow_query_seconds: Optional[float] = 0.2
+_query_stats: Dict[str, List[float]] = {}  # sql -> [calls, total, max, slow]
+_query_plans: Dict[str, str] = {}
+_query_stats_lock = threading.Lock()
+
+
+@lru_cache(maxsize=1024)
+def _normalize_sql(sql: str) -> str:
+    return " ".join(sql.split())
+
+
+def _redact(parameters: Any) -> Any:
+    def value(item: Any) -> str:
+        if item is None:
+            return "NULL"
+        if isinstance(item, (str, bytes)):
+            return f"<{type(item).__name__}:{len(item)}>"
+        return f"<{type(item).__name__}>"
+
+    if isinstance(parameters, dict):
+        return {key: value(item) for key, item in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [value(item) for item in parameters]
+    return "<many>"
+
+
+def _query_plan(conn: sqlite3.Connection, sql: str, parameters: Any) -> str:
+    plan = _query_plans.get(sql)
+    if plan is not None:
+        return plan
+    if not sql.upper().startswith(QUERY_PLAN_PREFIXES) or not isinstance(
+        parameters, (dict, list, tuple)
+    ):
+        return "n/a"
+    try:
+        # A plain cursor, so the EXPLAIN itself is not counted
+        rows = sqlite3.Cursor(conn).execute(f"EXPLAIN QUERY PLAN {sql}", parameters).fetchall()
+        plan = "; ".join(row[3] for row in rows)
+    except sqlite3.Error as exc:
+        plan = f"unavailable ({exc})"
+    _query_plans[sql] = plan
+    return plan
+
+
+class _InstrumentedCursor(sqlite3.Cursor):
+    _sql: Optional[str] = None
+    _parameters: Any = ()
+    _elapsed = 0.0
+    _reported = False
+
+    def _record(self, elapsed: float, new_call: bool) -> None:
+        self._elapsed += elapsed
+        with _query_stats_lock:
+            stat = _query_stats.get(self._sql)
+            if stat is None:
+                stat = _query_stats[self._sql] = [0, 0.0, 0.0, 0]
+            stat[0] += new_call
+            stat[1] += elapsed
+            stat[2] = max(stat[2], self._elapsed)
+            slow = (
+                not self._reported
+                and _slow_query_seconds is not None
+                and self._elapsed >= _slow_query_seconds
+            )
+            if slow:
+                stat[3] += 1
+        if slow:
+            self._reported = True
+            logging.warning(
+                "Slow query (%.0f ms): %s params=%s plan=%s",
+                self._elapsed * 1000,
+                self._sql,
+                _redact(self._parameters),
+                _query_plan(self.connection, self._sql, self._parameters),
+            )
+
+    def _timed(self, sql: str, parameters: Any, run: Callable[..., Any], *args: Any) -> Any:
+        self._sql, self._parameters = _normalize_sql(sql), parameters
+        self._elapsed, self._reported = 0.0, False
+        started = time.perf_counter()
+        try:
+            return run(*args)
+        finally:
+            self._record(time.perf_counter() - started, True)
+
+    def _fetch(self, fetch: Callable[..., Any], *args: Any) -> Any:
+        if self._sql is None:
+            return fetch(*args)
+        started = time.perf_counter()
+        try:
+            return fetch(*args)
+        finally:
+            self._record(time.perf_counter() - started, False)
+
+    def execute(self, sql: str, parameters: Any = ()) -> sqlite3.Cursor:
+        return self._timed(sql, parameters, super().execute, sql, parameters)
+
+    def executemany(self, sql: str, parameters: Iterable[Any]) -> sqlite3.Cursor:
+        return self._timed(sql, None, super().executemany, sql, parameters)
+
+    def executescript(self, script: str) -> sqlite3.Cursor:
+        return self._timed(script, None, super().executescript, script)
+
+    def fetchone(self) -> Any:
+        return self._fetch(super().fetchone)
+
+    def fetchmany(self, size: int = 1) -> List[Any]:
+        return self._fetch(super().fetchmany, size)
+
+    def fetchall(self) -> List[Any]:
+        return self._fetch(super().fetchall)
+
+
+class _InstrumentedConnection(sqlite3.Connection):
+    def cursor(self, factory: Any = _InstrumentedCursor) -> sqlite3.Cursor:
+        return super().cursor(factory)
+
+    def execute(self, sql: str, parameters: Any = ()) -> sqlite3.Cursor:
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql: str, parameters: Iterable[Any]) -> sqlite3.Cursor:
+        return self.cursor().executemany(sql, parameters)
+
+    def executescript(self, script: str) -> sqlite3.Cursor:
+        return self.cursor().executescript(script)
+
+
+def _connect(**kwargs: Any) -> sqlite3.Connection:
+    return sqlite3.connect(DB_PATH, factory=_InstrumentedConnection, **kwargs)
+
+
+def set_slow_query_threshold(seconds: Optional[float]) -> None:
+    """Log statements slower than ``seconds``; None turns the slow-query log off."""
+    global _slow_query_seconds
+    _slow_query_seconds = seconds
+
+
+def query_stats(limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Per-statement counters of this process, most total time first."""
+    with _query_stats_lock:
+        items = [(sql, list(stat)) for sql, stat in _query_stats.items()]
+    items.sort(key=lambda item: item[1][1], reverse=True)
+    return [
+        {
+            "sql": sql,
+            "calls": int(calls),
+            "total_ms": total * 1000,
+            "mean_ms": total * 1000 / calls if calls else 0.0,
+            "max_ms": longest * 1000,
+            "slow": int(slow),
+            "plan": _query_plans.get(sql),
+        }
+        for sql, (calls, total, longest, slow) in items[:limit]
+    ]
+
+
+def reset_query_stats() -> None:
+    with _query_stats_lock:
+        _query_stats.clear()
+        _query_plans.clear()
+
 
 def init_db() -> None:
-    with sqlite3.connect(DB_PATH) as conn:
+    with _connect() as conn:
         # Performance optimizations for SQLite
         conn.execute("PRAGMA foreign_keys = ON")
+        # Only takes effect on a new file; bot.maintenance converts older ones
+        conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
         conn.execute("PRAGMA journal_mode = WAL")  # Write-Ahead Logging for better concurrency
         conn.execute("PRAGMA synchronous = NORMAL")  # Balance between safety and speed
         conn.execute("PRAGMA cache_size = -64000")  # 64MB cache
@@ -83,7 +296,6 @@ def init_db() -> None:
             )
             """
         )
-        _ensure_drop_learning_content_schema(conn)
         conn.execute(
             """
             CREATE TABLE IF NOT EXISTS case_studies (
@@ -107,6 +319,7 @@ def init_db() -> None:
             )
             """
         )
+        _ensure_content_tables_schema(conn)
         conn.execute(
             """
             CREATE TABLE IF NOT EXISTS webinar_views (
@@ -153,6 +366,90 @@ def init_db() -> None:
             )
             """
         )
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS admin_notifications (
+                request_id INTEGER NOT NULL,
+                admin_id INTEGER NOT NULL,
+                status TEXT NOT NULL DEFAULT 'pending',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                last_error TEXT,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (request_id, admin_id),
+                FOREIGN KEY (request_id) REFERENCES consultation_requests (id) ON DELETE CASCADE
+            )
+            """
+        )
+        conn.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_admin_notifications_failed
+            ON admin_notifications (request_id)
+            WHERE status = 'failed'
+            """
+        )
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS content_events (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                user_id INTEGER NOT NULL,
+                item_type TEXT NOT NULL,
+                item_id INTEGER NOT NULL,
+                action TEXT NOT NULL,
+                created_at INTEGER NOT NULL
+            )
+            """
+        )
+        conn.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_content_events_created_at
+            ON content_events (created_at)
+            """
+        )
+        for rollup_table in CONTENT_ROLLUP_TABLES.values():
+            conn.execute(
+                f"""
+                CREATE TABLE IF NOT EXISTS {rollup_table} (
+                    bucket INTEGER NOT NULL,
+                    item_type TEXT NOT NULL,
+                    item_id INTEGER NOT NULL,
+                    action TEXT NOT NULL,
+                    events INTEGER NOT NULL DEFAULT 0,
+                    PRIMARY KEY (bucket, item_type, item_id, action)
+                )
+                """
+            )
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS rollup_watermarks (
+                name TEXT PRIMARY KEY,
+                last_id INTEGER NOT NULL DEFAULT 0
+            )
+            """
+        )
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS scheduled_broadcasts (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                label TEXT NOT NULL,
+                segment TEXT NOT NULL,
+                from_chat_id INTEGER NOT NULL,
+                message_ids TEXT NOT NULL,
+                run_at INTEGER NOT NULL,
+                interval_seconds INTEGER,
+                spread_seconds INTEGER NOT NULL DEFAULT 0,
+                status TEXT NOT NULL DEFAULT 'scheduled',
+                created_by INTEGER,
+                last_run_at INTEGER,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+            """
+        )
+        conn.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_scheduled_broadcasts_active
+            ON scheduled_broadcasts (id) WHERE status = 'scheduled'
+            """
+        )
         conn.execute(
             """
             CREATE TABLE IF NOT EXISTS bot_settings (
@@ -162,6 +459,62 @@ def init_db() -> None:
             """
         )
         _ensure_bot_settings_defaults(conn)
+        conn.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_consultation_requests_user
+            ON consultation_requests (user_id)
+            """
+        )
+        # Audience segments look viewers up by item
+        for table, column in VIEW_TABLES.values():
+            conn.execute(
+                f"""
+                CREATE INDEX IF NOT EXISTS idx_{table}_item
+                ON {table} ({column}, user_id)
+                """
+            )
+        _ensure_content_item_stats(conn)
+        _ensure_viewer_sketches(conn)
+        _ensure_media_assets(conn)
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS delivery_plans (
+                item_type TEXT NOT NULL,
+                item_id INTEGER NOT NULL,
+                plan TEXT NOT NULL,
+                built_at INTEGER NOT NULL,
+                PRIMARY KEY (item_type, item_id)
+            )
+            """
+        )
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS maintenance_runs (
+                task TEXT PRIMARY KEY,
+                ran_at INTEGER NOT NULL,
+                duration_ms REAL NOT NULL,
+                result TEXT NOT NULL
+            )
+            """
+        )
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS leases (
+                name TEXT PRIMARY KEY,
+                owner TEXT NOT NULL,
+                expires_at REAL NOT NULL,
+                heartbeat REAL NOT NULL
+            )
+            """
+        )
+        # Keyset pagination walks the catalogues in (created_at, id) order
+        for table in CATALOGUE_TABLES:
+            conn.execute(
+                f"""
+                CREATE INDEX IF NOT EXISTS idx_{table}_created_at
+                ON {table} (created_at, id)
+                """
+            )
 
 
 def _ensure_users_schema(conn: sqlite3.Connection) -> None:
@@ -210,6 +563,38 @@ def _ensure_users_schema(conn: sqlite3.Connection) -> None:
                 """
             )
 
+    # Unix time of the first contact; 0 for users recorded before it was tracked
+    if "created_at" not in columns:
+        conn.execute(
+            "ALTER TABLE users ADD COLUMN created_at INTEGER NOT NULL DEFAULT 0"
+        )
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_users_created_at ON users (created_at)"
+    )
+
+    # Whether messages can still reach the user (see DELIVERY_STATES)
+    if "delivery_state" not in columns:
+        conn.execute(
+            "ALTER TABLE users ADD COLUMN delivery_state TEXT NOT NULL DEFAULT 'active'"
+        )
+    if "delivery_state_at" not in columns:
+        conn.execute(
+            "ALTER TABLE users ADD COLUMN delivery_state_at INTEGER NOT NULL DEFAULT 0"
+        )
+    # Broadcasts walk the reachable users in id order; fan-outs look up the rest.
+    conn.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_users_reachable
+        ON users (telegram_id) WHERE delivery_state = 'active'
+        """
+    )
+    conn.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_users_unreachable
+        ON users (telegram_id) WHERE delivery_state <> 'active'
+        """
+    )
+
 
 def _ensure_webinars_schema(conn: sqlite3.Connection) -> None:
     columns = {
@@ -314,19 +699,19 @@ def _ensure_bot_settings_defaults(conn: sqlite3.Connection) -> None:
             )
 
 
-def _ensure_drop_learning_content_schema(conn: sqlite3.Connection) -> None:
-    """Ensure drop_learning_content table has caption column."""
-    columns = {
-        row[1]: {"type": row[2], "notnull": row[3], "default": row[4]}
-        for row in conn.execute("PRAGMA table_info(drop_learning_content)")
-    }
-    if "caption" not in columns:
-        conn.execute(
-            """
-            ALTER TABLE drop_learning_content
-            ADD COLUMN caption TEXT
-            """
-        )
+def _ensure_content_tables_schema(conn: sqlite3.Connection) -> None:
+    """Ensure every section's content table has a caption column."""
+    for section in CONTENT_SECTIONS.values():
+        columns = {
+            row[1] for row in conn.execute(f"PRAGMA table_info({section.content_table})")
+        }
+        if "caption" not in columns:
+            conn.execute(
+                f"""
+                ALTER TABLE {section.content_table}
+                ADD COLUMN caption TEXT
+                """
+            )
 
 
 def upsert_user(
@@ -336,11 +721,15 @@ def upsert_user(
     lname: str,
     username: str,
 ) -> None:
-    with sqlite3.connect(DB_PATH) as conn:
+    with _connect() as conn:
+        row = conn.execute(
+            "SELECT phone_number FROM users WHERE telegram_id = ?", (telegram_id,)
+        ).fetchone()
+        had_phone = bool(row and (row[0] or "").strip())
         conn.execute(
             """
-            INSERT INTO users (telegram_id, phone_number, fname, lname, username)
-            VALUES (?, ?, ?, ?, ?)
+            INSERT INTO users (telegram_id, phone_number, fname, lname, username, created_at)
+            VALUES (?, ?, ?, ?, ?, CAST(strftime('%s', 'now') AS INTEGER))
             ON CONFLICT(telegram_id) DO UPDATE
             SET
                 phone_number = excluded.phone_number,
@@ -350,6 +739,11 @@ def upsert_user(
             """,
             (telegram_id, phone_number, fname or "", lname or "", username or ""),
         )
+        has_phone = bool((phone_number or "").strip())
+        if has_phone != had_phone:
+            _adjust_viewed_item_stats(
+                conn, telegram_id, "phone_viewers", 1 if has_phone else -1
+            )
 
 
 def ensure_user_record(
@@ -358,22 +752,63 @@ def ensure_user_record(
     lname: str,
     username: str,
 ) -> None:
-    with sqlite3.connect(DB_PATH) as conn:
+    with _connect() as conn:
         conn.execute(
             """
-            INSERT INTO users (telegram_id, phone_number, fname, lname, username)
-            VALUES (?, '', ?, ?, ?)
+            INSERT INTO users (telegram_id, phone_number, fname, lname, username, created_at)
+            VALUES (?, '', ?, ?, ?, CAST(strftime('%s', 'now') AS INTEGER))
             ON CONFLICT(telegram_id) DO UPDATE SET
                 fname = excluded.fname,
                 lname = excluded.lname,
-                username = excluded.username
+                username = excluded.username,
+                delivery_state_at = CASE
+                    WHEN users.delivery_state <> 'active' THEN excluded.created_at
+                    ELSE users.delivery_state_at
+                END,
+                delivery_state = 'active'
             """,
             (telegram_id, fname or "", lname or "", username or ""),
         )
 
 
+def set_delivery_state(telegram_id: int, state: str) -> bool:
+    """Record whether messages can reach a user; return True if it changed."""
+    if state not in DELIVERY_STATES:
+        raise ValueError(f"Unknown delivery state: {state}")
+    with _connect() as conn:
+        cursor = conn.execute(
+            """
+            UPDATE users
+            SET delivery_state = ?, delivery_state_at = CAST(strftime('%s', 'now') AS INTEGER)
+            WHERE telegram_id = ? AND delivery_state <> ?
+            """,
+            (state, telegram_id, state),
+        )
+        return cursor.rowcount > 0
+
+
+def filter_reachable(telegram_ids: Iterable[int]) -> List[int]:
+    """Drop ids of users known to be blocked or deactivated, keeping order."""
+    telegram_ids = list(telegram_ids)
+    if not telegram_ids:
+        return []
+    with _connect() as conn:
+        unreachable = {
+            row[0]
+            for row in conn.execute(
+                f"""
+                SELECT telegram_id FROM users
+                WHERE delivery_state <> 'active'
+                  AND telegram_id IN ({', '.join('?' * len(telegram_ids))})
+                """,
+                telegram_ids,
+            )
+        }
+    return [telegram_id for telegram_id in telegram_ids if telegram_id not in unreachable]
+
+
 def get_user(telegram_id: int) -> Optional[Dict[str, str]]:
-    with sqlite3.connect(DB_PATH) as conn:
+    with _connect() as conn:
         cursor = conn.execute(
             """
             SELECT telegram_id, phone_number, fname, lname, username
@@ -395,7 +830,7 @@ def get_user(telegram_id: int) -> Optional[Dict[str, str]]:
 
 
 def get_user_by_phone(phone_number: str) -> Optional[Dict[str, str]]:
-    with sqlite3.connect(DB_PATH) as conn:
+    with _connect() as conn:
         cursor = conn.execute(
             """
             SELECT telegram_id, phone_number, fname, lname, username
@@ -417,7 +852,7 @@ def get_user_by_phone(phone_number: str) -> Optional[Dict[str, str]]:
 
 
 def user_has_phone(telegram_id: int) -> bool:
-    with sqlite3.connect(DB_PATH) as conn:
+    with _connect() as conn:
         cursor = conn.execute(
             """
             SELECT 1
@@ -432,8 +867,65 @@ def user_has_phone(telegram_id: int) -> bool:
         return cursor.fetchone() is not None
 
 
+ADMINS_VERSION_KEY = "admins_version"
+
+_admin_ids: Optional[frozenset] = None
+_admins_version: int = 0
+
+
+def _read_version(conn: sqlite3.Connection, key: str) -> int:
+    row = conn.execute(
+        "SELECT value FROM bot_settings WHERE key = ?", (key,)
+    ).fetchone()
+    return int(row[0] or 0) if row else 0
+
+
+def _bump_version(conn: sqlite3.Connection, key: str) -> int:
+    """Increment a version row in ``bot_settings`` and return the new value."""
+    conn.execute(
+        """
+        INSERT INTO bot_settings (key, value)
+        VALUES (?, '1')
+        ON CONFLICT(key) DO UPDATE SET value = CAST(value AS INTEGER) + 1
+        """,
+        (key,),
+    )
+    return _read_version(conn, key)
+
+
+def _read_admin_ids(conn: sqlite3.Connection) -> frozenset:
+    return frozenset(row[0] for row in conn.execute("SELECT telegram_id FROM admins"))
+
+
+def load_admins() -> frozenset:
+    """Load the admin set into memory together with its shared version."""
+    global _admin_ids, _admins_version
+    with _connect() as conn:
+        version = _read_version(conn, ADMINS_VERSION_KEY)
+        _admin_ids, _admins_version = _read_admin_ids(conn), version
+    return _admin_ids
+
+
+def refresh_admins() -> bool:
+    """Reload the admin set if another process bumped ``admins_version``."""
+    global _admin_ids, _admins_version
+    with _connect() as conn:
+        version = _read_version(conn, ADMINS_VERSION_KEY)
+        if _admin_ids is not None and version == _admins_version:
+            return False
+        _admin_ids, _admins_version = _read_admin_ids(conn), version
+    return True
+
+
+def _admins() -> frozenset:
+    if _admin_ids is None:
+        load_admins()
+    return _admin_ids
+
+
 def add_admin(telegram_id: int) -> bool:
-    with sqlite3.connect(DB_PATH) as conn:
+    global _admin_ids, _admins_version
+    with _connect() as conn:
         cursor = conn.execute(
             """
             INSERT INTO admins (telegram_id)
@@ -442,27 +934,38 @@ def add_admin(telegram_id: int) -> bool:
             """,
             (telegram_id,),
         )
-        return cursor.rowcount > 0
+        added = cursor.rowcount > 0
+        if added:
+            # Re-read the (tiny) set so edits by other processes are not lost
+            version = _bump_version(conn, ADMINS_VERSION_KEY)
+            _admin_ids, _admins_version = _read_admin_ids(conn), version
+    return added
 
 
 def remove_admin(telegram_id: int) -> bool:
-    with sqlite3.connect(DB_PATH) as conn:
+    global _admin_ids, _admins_version
+    with _connect() as conn:
         cursor = conn.execute(
             "DELETE FROM admins WHERE telegram_id = ?", (telegram_id,)
         )
-        return cursor.rowcount > 0
+        removed = cursor.rowcount > 0
+        if removed:
+            version = _bump_version(conn, ADMINS_VERSION_KEY)
+            _admin_ids, _admins_version = _read_admin_ids(conn), version
+    return removed
+
+
+def list_admin_ids() -> tuple:
+    """Return the telegram ids of all admins from the in-memory admin set."""
+    return tuple(sorted(_admins()))
 
 
 def is_admin(telegram_id: int) -> bool:
-    with sqlite3.connect(DB_PATH) as conn:
-        cursor = conn.execute(
-            "SELECT 1 FROM admins WHERE telegram_id = ? LIMIT 1", (telegram_id,)
-        )
-        return cursor.fetchone() is not None
+    return telegram_id in _admins()
 
 
 def list_admins() -> Iterable[Dict[str, str]]:
-    with sqlite3.connect(DB_PATH) as conn:
+    with _connect() as conn:
         cursor = conn.execute(
             """
             SELECT
@@ -486,8 +989,134 @@ def list_admins() -> Iterable[Dict[str, str]]:
             }
 
 
+def list_admins_page(
+    cursor: Optional[int] = None,
+    *,
+    limit: int,
+    backward: bool = False,
+    exclude_ids: Iterable[int] = (),
+) -> Dict[str, Any]:
+    """Return one page of admins ordered by telegram_id using keyset paging.
+
+    ``cursor`` is the telegram_id of the last item of the current page when
+    moving forward, or the first item when ``backward`` is set.
+    """
+    excluded = tuple(exclude_ids)
+    where = []
+    params: List[Any] = []
+    if excluded:
+        where.append(f"admins.telegram_id NOT IN ({', '.join('?' * len(excluded))})")
+        params.extend(excluded)
+    if cursor is not None:
+        where.append("admins.telegram_id < ?" if backward else "admins.telegram_id > ?")
+        params.append(cursor)
+    where_sql = f"WHERE {' AND '.join(where)}" if where else ""
+    order = "DESC" if backward else "ASC"
+    params.append(limit + 1)
+
+    with _connect() as conn:
+        rows = conn.execute(
+            f"""
+            SELECT
+                admins.telegram_id,
+                users.phone_number,
+                users.fname,
+                users.lname,
+                users.username
+            FROM admins
+            LEFT JOIN users ON users.telegram_id = admins.telegram_id
+            {where_sql}
+            ORDER BY admins.telegram_id {order}
+            LIMIT ?
+            """,
+            tuple(params),
+        ).fetchall()
+
+    items = [
+        {
+            "telegram_id": telegram_id,
+            "phone_number": phone_number or "",
+            "fname": fname or "",
+            "lname": lname or "",
+            "username": username or "",
+        }
+        for telegram_id, phone_number, fname, lname, username in rows
+    ]
+    return _build_page(items, limit, cursor, backward)
+
+
+def _build_page(
+    items: List[Dict[str, Any]],
+    limit: int,
+    cursor: Optional[int],
+    backward: bool,
+) -> Dict[str, Any]:
+    has_more = len(items) > limit
+    items = items[:limit]
+    if backward:
+        items.reverse()
+        return {"items": items, "has_prev": has_more, "has_next": True}
+    return {"items": items, "has_prev": cursor is not None, "has_next": has_more}
+
+
+def _catalogue_page(
+    table: str,
+    cursor: Optional[int],
+    limit: int,
+    backward: bool,
+) -> Dict[str, Any]:
+    """Fetch one page of a catalogue table in ``created_at DESC, id DESC`` order.
+
+    The cursor is an item id; its (created_at, id) position is resolved with a
+    subquery so callback data only has to carry the id.
+    """
+    if table not in CATALOGUE_TABLES:
+        raise ValueError(f"Unknown catalogue table: {table}")
+
+    if cursor is None:
+        where_sql = ""
+        params: tuple = (limit + 1,)
+    else:
+        comparison = ">" if backward else "<"
+        where_sql = f"""
+            WHERE (created_at, id) {comparison} (
+                SELECT created_at, id FROM {table} WHERE id = ?
+            )
+        """
+        params = (cursor, limit + 1)
+    order = "ASC" if backward else "DESC"
+
+    with _connect() as conn:
+        rows = conn.execute(
+            f"""
+            SELECT id, title, description, cover_photo_file_id, created_at
+            FROM {table}
+            {where_sql}
+            ORDER BY created_at {order}, id {order}
+            LIMIT ?
+            """,
+            params,
+        ).fetchall()
+
+    if not rows and cursor is not None:
+        # The cursor item was deleted meanwhile; restart from the first page.
+        return _catalogue_page(table, None, limit, False)
+
+    items = [
+        {
+            "id": item_id,
+            "title": title,
+            "description": description,
+            "cover_photo_file_id": cover_photo_file_id or "",
+            "created_at": created_at,
+        }
+        for item_id, title, description, cover_photo_file_id, created_at in rows
+    ]
+    return _build_page(items, limit, cursor, backward)
+
+
 def get_user_stats() -> Dict[str, int]:
-    with sqlite3.connect(DB_PATH) as conn:
+    with _connect() as conn:
         cursor = conn.execute(
             """
             SELECT
@@ -501,27 +1130,28 @@ def get_user_stats() -> Dict[str, int]:
         with_phone = with_phone or 0
         total = total or 0
         without_phone = total - with_phone
-
-        # Get unique viewers for each section
-        webinar_viewers = conn.execute(
-            "SELECT COUNT(DISTINCT user_id) FROM webinar_views"
-        ).fetchone()[0] or 0
-        
-        drop_learning_viewers = conn.execute(
-            "SELECT COUNT(DISTINCT user_id) FROM drop_learning_views"
-        ).fetchone()[0] or 0
-        
-        case_studies_viewers = conn.execute(
-            "SELECT COUNT(DISTINCT user_id) FROM case_studies_views"
-        ).fetchone()[0] or 0
+        unreachable = conn.execute(
+            "SELECT COUNT(*) FROM users WHERE delivery_state <> 'active'"
+        ).fetchone()[0]
+
+        # Unique viewers come from the HyperLogLog sketches, not the views tables
+        section_viewers = {
+            section: _estimate_unique_viewers(conn, (_section_scope(section),))
+            for section in VIEW_TABLES
+        }
+        any_section_viewers = _estimate_unique_viewers(
+            conn, tuple(_section_scope(section) for section in VIEW_TABLES)
+        )
 
         return {
             "total": total,
             "with_phone": with_phone,
             "without_phone": without_phone,
-            "webinar_viewers": webinar_viewers,
-            "drop_learning_viewers": drop_learning_viewers,
-            "case_studies_viewers": case_studies_viewers,
+            "unreachable": unreachable,
+            "webinar_viewers": section_viewers["webinar"],
+            "drop_learning_viewers": section_viewers["drop_learning"],
+            "case_studies_viewers": section_viewers["case_study"],
+            "any_section_viewers": any_section_viewers,
         }
 
 
@@ -543,7 +1173,7 @@ def iter_users(has_phone: Optional[bool] = None) -> Iterable[Dict[str, str]]:
 
     query += " ORDER BY telegram_id"
 
-    with sqlite3.connect(DB_PATH) as conn:
+    with _connect() as conn:
         cursor = conn.execute(query, params)
         for telegram_id, phone_number, fname, lname, username in cursor.fetchall():
             yield {
@@ -555,71 +1185,208 @@ def iter_users(has_phone: Optional[bool] = None) -> Iterable[Dict[str, str]]:
             }
 
 
-def list_webinars() -> Iterable[Dict[str, str]]:
-    with sqlite3.connect(DB_PATH) as conn:
-        cursor = conn.execute(
-            """
-            SELECT id, title, description, cover_photo_file_id, created_at
-            FROM webinars
-            ORDER BY created_at DESC, id DESC
-            """
-        )
-        for (
-            webinar_id,
-            title,
-            description,
-            cover_photo_file_id,
-            created_at,
-        ) in cursor.fetchall():
-            yield {
-                "id": webinar_id,
-                "title": title,
-                "description": description,
-                "cover_photo_file_id": cover_photo_file_id or "",
-                "created_at": created_at,
-            }
+def compile_segment(
+    segment: Iterable[tuple], include_unreachable: bool = False
+) -> tuple:
+    """Compile audience conditions into a ``(where_sql, params)`` pair over ``users``.
+
+    A segment is a sequence of conditions that must all hold:
+
+    - ``("has_phone", bool)``
+    - ``("joined_within_days", days)``
+    - ``("viewed", section, item_id_or_None)`` / ``("not_viewed", ...)``
+    - ``("has_consultation", bool)``
+
+    Each condition maps onto an index: ``users.created_at``, the
+    ``(item, user_id)`` indexes of the views tables, or
+    ``consultation_requests.user_id``. Blocked and deactivated users are
+    excluded unless ``include_unreachable`` is set.
+    """
+    clauses: List[str] = []
+    params: List[Any] = []
+    if not include_unreachable:
+        clauses.append("users.delivery_state = 'active'")
+    for condition in segment:
+        kind, *args = condition
+        if kind == "has_phone":
+            clauses.append(
+                "TRIM(COALESCE(users.phone_number, '')) <> ''"
+                if args[0]
+                else "TRIM(COALESCE(users.phone_number, '')) = ''"
+            )
+        elif kind == "joined_within_days":
+            clauses.append("users.created_at >= ?")
+            params.append(int(time.time()) - int(args[0]) * 86400)
+        elif kind in ("viewed", "not_viewed"):
+            section, item_id = args
+            table, column = VIEW_TABLES[section]
+            subquery = f"SELECT user_id FROM {table}"
+            if item_id is not None:
+                subquery += f" WHERE {column} = ?"
+                params.append(item_id)
+            operator = "IN" if kind == "viewed" else "NOT IN"
+            clauses.append(f"users.telegram_id {operator} ({subquery})")
+        elif kind == "has_consultation":
+            clauses.append(
+                ("" if args[0] else "NOT ")
+                + "EXISTS (SELECT 1 FROM consultation_requests"
+                " WHERE consultation_requests.user_id = users.telegram_id)"
+            )
+        else:
+            raise ValueError(f"Unknown segment condition: {kind}")
+    return " AND ".join(clauses) or "1", params
 
 
-def get_webinar(webinar_id: int) -> Optional[Dict[str, str]]:
-    with sqlite3.connect(DB_PATH) as conn:
+def count_segment(
+    segment: Iterable[tuple], include_unreachable: bool = False
+) -> int:
+    """Number of users matching a segment, for broadcast dry runs."""
+    where, params = compile_segment(segment, include_unreachable)
+    with _connect() as conn:
+        return conn.execute(
+            f"SELECT COUNT(*) FROM users WHERE {where}", params
+        ).fetchone()[0]
+
+
+def list_segment_user_ids(
+    segment: Iterable[tuple],
+    after_id: Optional[int] = None,
+    limit: int = 500,
+    include_unreachable: bool = False,
+) -> List[int]:
+    """Return the next ``limit`` matching user ids after ``after_id``.
+
+    Callers page through a segment with the last id of the previous page, so
+    no read transaction is held open while messages are being sent.
+    """
+    where, params = compile_segment(segment, include_unreachable)
+    if after_id is not None:
+        where += " AND users.telegram_id > ?"
+        params.append(after_id)
+    with _connect() as conn:
         cursor = conn.execute(
-            """
-            SELECT id, title, description, cover_photo_file_id, created_at
-            FROM webinars
-            WHERE id = ?
+            f"""
+            SELECT users.telegram_id FROM users
+            WHERE {where}
+            ORDER BY users.telegram_id
+            LIMIT ?
             """,
-            (webinar_id,),
+            (*params, limit),
         )
-        row = cursor.fetchone()
-    if row is None:
-        return None
+        return [row[0] for row in cursor.fetchall()]
+
+
+# Content sections: one implementation for webinars, drop learning and case studies
+_ITEM_COLUMNS = "id, title, description, cover_photo_file_id, created_at"
+
+
+def _section(section: str) -> ContentSection:
+    try:
+        return CONTENT_SECTIONS[section]
+    except KeyError:
+        raise ValueError(f"Unknown content section: {section}") from None
+
+
+@lru_cache(maxsize=None)
+def _section_sql(section: str) -> Dict[str, str]:
+    """SQL text per section, built once so every call reuses the same statements."""
+    items, content, _, column = _section(section)
+    file_id = f"COALESCE(media_assets.file_id, {content}.file_id)"
+    content_select = f"""
+        SELECT {content}.id, {content}.{column}, {file_id}, {content}.file_type,
+               {content}.content_order, {content}.caption
+        FROM {content}
+        LEFT JOIN media_assets ON media_assets.file_unique_id = {content}.file_unique_id
+    """
     return {
-        "id": row[0],
-        "title": row[1],
-        "description": row[2],
-        "cover_photo_file_id": row[3] or "",
-        "created_at": row[4],
+        "list_items": f"SELECT {_ITEM_COLUMNS} FROM {items} ORDER BY created_at DESC, id DESC",
+        "get_item": f"SELECT {_ITEM_COLUMNS} FROM {items} WHERE id = ?",
+        "create_item": f"INSERT INTO {items} (title, description, cover_photo_file_id) VALUES (?, ?, ?)",
+        "delete_item": f"DELETE FROM {items} WHERE id = ?",
+        "max_order": f"SELECT COALESCE(MAX(content_order), -1) FROM {content} WHERE {column} = ?",
+        "shift_order": f"UPDATE {content} SET content_order = content_order + 1 WHERE {column} = ? AND content_order >= ?",
+        "add_content": f"""
+            INSERT INTO {content} (
+                {column}, file_id, file_type, content_order, caption, file_unique_id
+            )
+            VALUES (?, ?, ?, ?, ?, ?)
+        """,
+        "list_content": f"""{content_select}
+            WHERE {content}.{column} = ?
+            ORDER BY {content}.content_order ASC, {content}.id ASC
+        """,
+        "get_content": f"{content_select} WHERE {content}.id = ?",
+        "update_content": f"""
+            UPDATE {content}
+            SET file_id = ?, file_type = ?, caption = ?, file_unique_id = ?
+            WHERE id = ?
+        """,
+        "delete_content": f"DELETE FROM {content} WHERE id = ?",
+        "clear_content": f"DELETE FROM {content} WHERE {column} = ?",
     }
 
 
-def create_webinar(
+def _section_item_from_row(row: tuple) -> Dict[str, Any]:
+    item_id, title, description, cover_photo_file_id, created_at = row
+    return {
+        "id": item_id,
+        "title": title,
+        "description": description,
+        "cover_photo_file_id": cover_photo_file_id or "",
+        "created_at": created_at,
+    }
+
+
+def _section_content_from_row(section: str, row: tuple) -> Dict[str, Any]:
+    content_id, item_id, file_id, file_type, content_order, caption = row
+    return {
+        "id": content_id,
+        CONTENT_SECTIONS[section].item_column: item_id,
+        "file_id": file_id,
+        "file_type": file_type,
+        "content_order": content_order,
+        "caption": caption or "",
+    }
+
+
+def list_section_items(section: str) -> Iterable[Dict[str, Any]]:
+    sql = _section_sql(section)
+    with _connect() as conn:
+        rows = conn.execute(sql["list_items"]).fetchall()
+    for row in rows:
+        yield _section_item_from_row(row)
+
+
+def list_section_page(
+    section: str, cursor: Optional[int] = None, *, limit: int, backward: bool = False
+) -> Dict[str, Any]:
+    return _catalogue_page(_section(section).items_table, cursor, limit, backward)
+
+
+def get_section_item(section: str, item_id: int) -> Optional[Dict[str, Any]]:
+    sql = _section_sql(section)
+    with _connect() as conn:
+        row = conn.execute(sql["get_item"], (item_id,)).fetchone()
+    return _section_item_from_row(row) if row else None
+
+
+def create_section_item(
+    section: str,
     title: str,
     description: str,
     cover_photo_file_id: Optional[str] = None,
 ) -> int:
-    with sqlite3.connect(DB_PATH) as conn:
+    sql = _section_sql(section)
+    with _connect() as conn:
         cursor = conn.execute(
-            """
-            INSERT INTO webinars (title, description, cover_photo_file_id)
-            VALUES (?, ?, ?)
-            """,
-            (title, description, cover_photo_file_id),
+            sql["create_item"], (title, description, cover_photo_file_id)
         )
         return cursor.lastrowid
 
 
-def update_webinar(
-    webinar_id: int,
+def update_section_item(
+    section: str,
+    item_id: int,
     *,
     title: Optional[str] = None,
     description: Optional[str] = None,
@@ -638,466 +1405,666 @@ def update_webinar(
         params.append(cover_photo_file_id)
     if not fields:
         return False
-    params.append(webinar_id)
+    params.append(item_id)
 
-    with sqlite3.connect(DB_PATH) as conn:
+    with _connect() as conn:
         cursor = conn.execute(
             f"""
-            UPDATE webinars
+            UPDATE {_section(section).items_table}
             SET {", ".join(fields)}
             WHERE id = ?
             """,
             tuple(params),
         )
+        _invalidate_delivery_plan(conn, section, item_id)
         return cursor.rowcount > 0
 
 
-def delete_webinar(webinar_id: int) -> bool:
-    with sqlite3.connect(DB_PATH) as conn:
-        cursor = conn.execute(
-            "DELETE FROM webinars WHERE id = ?",
-            (webinar_id,),
-        )
+def delete_section_item(section: str, item_id: int) -> bool:
+    sql = _section_sql(section)
+    with _connect() as conn:
+        cursor = conn.execute(sql["delete_item"], (item_id,))
+        _delete_content_item_stats(conn, section, item_id)
+        _invalidate_delivery_plan(conn, section, item_id)
         return cursor.rowcount > 0
 
 
-def add_webinar_content(webinar_id: int, file_id: str, file_type: str, content_order: int = 0) -> int:
-    """Add content (video, voice, etc.) to a webinar."""
-    with sqlite3.connect(DB_PATH) as conn:
+def add_section_content(
+    section: str,
+    item_id: int,
+    file_id: str,
+    file_type: str,
+    content_order: int = 0,
+    caption: Optional[str] = None,
+    file_unique_id: Optional[str] = None,
+) -> int:
+    """Add a file to an item; inserting before the end shifts later files down."""
+    sql = _section_sql(section)
+    with _connect() as conn:
+        _register_media_asset(conn, file_unique_id, file_id, file_type)
+        max_order = conn.execute(sql["max_order"], (item_id,)).fetchone()[0]
+        if content_order <= max_order:
+            conn.execute(sql["shift_order"], (item_id, content_order))
         cursor = conn.execute(
-            """
-            INSERT INTO webinar_content (webinar_id, file_id, file_type, content_order)
-            VALUES (?, ?, ?, ?)
-            """,
-            (webinar_id, file_id, file_type, content_order),
+            sql["add_content"],
+            (item_id, file_id, file_type, content_order, caption, file_unique_id),
         )
+        _invalidate_delivery_plan(conn, section, item_id)
         return cursor.lastrowid
 
 
-def get_webinar_content(webinar_id: int) -> Iterable[Dict[str, str]]:
-    """Get all content for a webinar, ordered by content_order."""
-    with sqlite3.connect(DB_PATH) as conn:
-        cursor = conn.execute(
-            """
-            SELECT id, file_id, file_type, content_order
-            FROM webinar_content
-            WHERE webinar_id = ?
-            ORDER BY content_order ASC, id ASC
-            """,
-            (webinar_id,),
-        )
-        for content_id, file_id, file_type, content_order in cursor.fetchall():
-            yield {
-                "id": content_id,
-                "file_id": file_id,
-                "file_type": file_type,
-                "content_order": content_order,
-            }
+def get_section_content(section: str, item_id: int) -> Iterable[Dict[str, Any]]:
+    """Files of an item in delivery order, preferring the registry's file_id."""
+    sql = _section_sql(section)
+    with _connect() as conn:
+        rows = conn.execute(sql["list_content"], (item_id,)).fetchall()
+    for row in rows:
+        yield _section_content_from_row(section, row)
 
 
-def delete_webinar_content(content_id: int) -> bool:
-    """Delete a specific content item from a webinar."""
-    with sqlite3.connect(DB_PATH) as conn:
+def get_section_content_item(section: str, content_id: int) -> Optional[Dict[str, Any]]:
+    sql = _section_sql(section)
+    with _connect() as conn:
+        row = conn.execute(sql["get_content"], (content_id,)).fetchone()
+    return _section_content_from_row(section, row) if row else None
+
+
+def update_section_content(
+    section: str,
+    content_id: int,
+    file_id: str,
+    file_type: str,
+    caption: Optional[str] = None,
+    file_unique_id: Optional[str] = None,
+) -> bool:
+    """Replace the file (and caption) of one content row."""
+    sql = _section_sql(section)
+    with _connect() as conn:
+        _register_media_asset(conn, file_unique_id, file_id, file_type)
+        _invalidate_content_owner_plan(conn, section, content_id)
         cursor = conn.execute(
-            "DELETE FROM webinar_content WHERE id = ?",
-            (content_id,),
+            sql["update_content"],
+            (file_id, file_type, caption, file_unique_id, content_id),
         )
         return cursor.rowcount > 0
 
 
+def delete_section_content(section: str, content_id: int) -> bool:
+    sql = _section_sql(section)
+    with _connect() as conn:
+        _invalidate_content_owner_plan(conn, section, content_id)
+        cursor = conn.execute(sql["delete_content"], (content_id,))
+        return cursor.rowcount > 0
+
+
+def clear_section_content(section: str, item_id: int) -> None:
+    sql = _section_sql(section)
+    with _connect() as conn:
+        _invalidate_delivery_plan(conn, section, item_id)
+        conn.execute(sql["clear_content"], (item_id,))
+
+
+# Per-section names kept for existing callers
+def list_webinars() -> Iterable[Dict[str, Any]]:
+    return list_section_items("webinar")
+
+
+def list_webinars_page(
+    cursor: Optional[int] = None, *, limit: int, backward: bool = False
+) -> Dict[str, Any]:
+    return list_section_page("webinar", cursor, limit=limit, backward=backward)
+
+
+def get_webinar(webinar_id: int) -> Optional[Dict[str, Any]]:
+    return get_section_item("webinar", webinar_id)
+
+
+def create_webinar(
+    title: str, description: str, cover_photo_file_id: Optional[str] = None
+) -> int:
+    return create_section_item("webinar", title, description, cover_photo_file_id)
+
+
+def update_webinar(webinar_id: int, **fields: Optional[str]) -> bool:
+    return update_section_item("webinar", webinar_id, **fields)
+
+
+def delete_webinar(webinar_id: int) -> bool:
+    return delete_section_item("webinar", webinar_id)
+
+
+def add_webinar_content(
+    webinar_id: int,
+    file_id: str,
+    file_type: str,
+    content_order: int = 0,
+    file_unique_id: Optional[str] = None,
+) -> int:
+    """Add content (video, voice, etc.) to a webinar."""
+    return add_section_content(
+        "webinar", webinar_id, file_id, file_type, content_order,
+        file_unique_id=file_unique_id,
+    )
+
+
+def get_webinar_content(webinar_id: int) -> Iterable[Dict[str, Any]]:
+    """Get all content for a webinar, ordered by content_order."""
+    return get_section_content("webinar", webinar_id)
+
+
+def delete_webinar_content(content_id: int) -> bool:
+    """Delete a specific content item from a webinar."""
+    return delete_section_content("webinar", content_id)
+
+
 def clear_webinar_content(webinar_id: int) -> None:
     """Delete all content for a webinar."""
-    with sqlite3.connect(DB_PATH) as conn:
-        conn.execute(
-            "DELETE FROM webinar_content WHERE webinar_id = ?",
-            (webinar_id,),
-        )
+    clear_section_content("webinar", webinar_id)
 
 
-# Drop Learning functions
-def list_drop_learning() -> Iterable[Dict[str, str]]:
-    with sqlite3.connect(DB_PATH) as conn:
-        cursor = conn.execute(
-            """
-            SELECT id, title, description, cover_photo_file_id, created_at
-            FROM drop_learning
-            ORDER BY created_at DESC, id DESC
-            """
-        )
-        for (
-            item_id,
-            title,
-            description,
-            cover_photo_file_id,
-            created_at,
-        ) in cursor.fetchall():
-            yield {
-                "id": item_id,
-                "title": title,
-                "description": description,
-                "cover_photo_file_id": cover_photo_file_id or "",
-                "created_at": created_at,
-            }
+def list_drop_learning() -> Iterable[Dict[str, Any]]:
+    return list_section_items("drop_learning")
 
 
-def get_drop_learning(item_id: int) -> Optional[Dict[str, str]]:
-    with sqlite3.connect(DB_PATH) as conn:
-        cursor = conn.execute(
-            """
-            SELECT id, title, description, cover_photo_file_id, created_at
-            FROM drop_learning
-            WHERE id = ?
-            """,
-            (item_id,),
-        )
-        row = cursor.fetchone()
-    if row is None:
-        return None
-    return {
-        "id": row[0],
-        "title": row[1],
-        "description": row[2],
-        "cover_photo_file_id": row[3] or "",
-        "created_at": row[4],
-    }
+def list_drop_learning_page(
+    cursor: Optional[int] = None, *, limit: int, backward: bool = False
+) -> Dict[str, Any]:
+    return list_section_page("drop_learning", cursor, limit=limit, backward=backward)
 
 
-def create_drop_learning(
-    title: str,
-    description: str,
-) -> int:
-    with sqlite3.connect(DB_PATH) as conn:
-        cursor = conn.execute(
-            """
-            INSERT INTO drop_learning (title, description, cover_photo_file_id)
-            VALUES (?, ?, ?)
-            """,
-            (title, description, None),
-        )
-        return cursor.lastrowid
+def get_drop_learning(item_id: int) -> Optional[Dict[str, Any]]:
+    return get_section_item("drop_learning", item_id)
 
 
-def update_drop_learning(
-    item_id: int,
-    *,
-    title: Optional[str] = None,
-    description: Optional[str] = None,
-    cover_photo_file_id: Optional[str] = None,
-) -> bool:
-    fields = []
-    params = []
-    if title is not None:
-        fields.append("title = ?")
-        params.append(title)
-    if description is not None:
-        fields.append("description = ?")
-        params.append(description)
-    if cover_photo_file_id is not None:
-        fields.append("cover_photo_file_id = ?")
-        params.append(cover_photo_file_id)
-    if not fields:
-        return False
-    params.append(item_id)
+def create_drop_learning(title: str, description: str) -> int:
+    return create_section_item("drop_learning", title, description)
 
-    with sqlite3.connect(DB_PATH) as conn:
-        cursor = conn.execute(
-            f"""
-            UPDATE drop_learning
-            SET {", ".join(fields)}
-            WHERE id = ?
-            """,
-            tuple(params),
-        )
-        return cursor.rowcount > 0
+
+def update_drop_learning(item_id: int, **fields: Optional[str]) -> bool:
+    return update_section_item("drop_learning", item_id, **fields)
 
 
 def delete_drop_learning(item_id: int) -> bool:
-    with sqlite3.connect(DB_PATH) as conn:
-        cursor = conn.execute(
-            "DELETE FROM drop_learning WHERE id = ?",
-            (item_id,),
-        )
-        return cursor.rowcount > 0
+    return delete_section_item("drop_learning", item_id)
 
 
-def add_drop_learning_content(item_id: int, file_id: str, file_type: str, content_order: int = 0, caption: Optional[str] = None) -> int:
+def add_drop_learning_content(
+    item_id: int,
+    file_id: str,
+    file_type: str,
+    content_order: int = 0,
+    caption: Optional[str] = None,
+    file_unique_id: Optional[str] = None,
+) -> int:
     """Add drop learning content. If inserting at specific position, shift existing items."""
-    with sqlite3.connect(DB_PATH) as conn:
-        # Check current max order
-        max_order_result = conn.execute(
-            "SELECT COALESCE(MAX(content_order), -1) FROM drop_learning_content WHERE drop_learning_id = ?",
-            (item_id,)
-        ).fetchone()
-        max_order = max_order_result[0] if max_order_result else -1
-        
-        # If inserting at a specific position that's not at the end, shift existing items
-        if content_order <= max_order:
-            # Shift all items at or after this position
-            conn.execute(
-                "UPDATE drop_learning_content SET content_order = content_order + 1 WHERE drop_learning_id = ? AND content_order >= ?",
-                (item_id, content_order)
-            )
-        
-        cursor = conn.execute(
-            """
-            INSERT INTO drop_learning_content (drop_learning_id, file_id, file_type, content_order, caption)
-            VALUES (?, ?, ?, ?, ?)
-            """,
-            (item_id, file_id, file_type, content_order, caption),
-        )
-        return cursor.lastrowid
+    return add_section_content(
+        "drop_learning", item_id, file_id, file_type, content_order, caption, file_unique_id
+    )
 
 
-def get_drop_learning_content(item_id: int) -> Iterable[Dict[str, str]]:
-    with sqlite3.connect(DB_PATH) as conn:
-        cursor = conn.execute(
-            """
-            SELECT id, file_id, file_type, content_order, caption
-            FROM drop_learning_content
-            WHERE drop_learning_id = ?
-            ORDER BY content_order ASC, id ASC
-            """,
-            (item_id,),
-        )
-        for content_id, file_id, file_type, content_order, caption in cursor.fetchall():
-            yield {
-                "id": content_id,
-                "file_id": file_id,
-                "file_type": file_type,
-                "content_order": content_order,
-                "caption": caption or "",
-            }
+def get_drop_learning_content(item_id: int) -> Iterable[Dict[str, Any]]:
+    return get_section_content("drop_learning", item_id)
 
 
-def get_drop_learning_content_item(content_id: int) -> Optional[Dict[str, str]]:
+def get_drop_learning_content_item(content_id: int) -> Optional[Dict[str, Any]]:
     """Get a single drop learning content item by its ID."""
-    with sqlite3.connect(DB_PATH) as conn:
-        cursor = conn.execute(
-            """
-            SELECT id, drop_learning_id, file_id, file_type, content_order, caption
-            FROM drop_learning_content
-            WHERE id = ?
-            """,
-            (content_id,),
-        )
-        row = cursor.fetchone()
-    if row is None:
-        return None
-    return {
-        "id": row[0],
-        "drop_learning_id": row[1],
-        "file_id": row[2],
-        "file_type": row[3],
-        "content_order": row[4],
-        "caption": row[5] or "" if len(row) > 5 else "",
-    }
+    return get_section_content_item("drop_learning", content_id)
 
 
 def update_drop_learning_content(
-    content_id: int, file_id: str, file_type: str, caption: Optional[str] = None
+    content_id: int,
+    file_id: str,
+    file_type: str,
+    caption: Optional[str] = None,
+    file_unique_id: Optional[str] = None,
 ) -> bool:
     """Update a drop learning content item (replace file and optionally caption)."""
-    with sqlite3.connect(DB_PATH) as conn:
-        cursor = conn.execute(
-            """
-            UPDATE drop_learning_content
-            SET file_id = ?, file_type = ?, caption = ?
-            WHERE id = ?
-            """,
-            (file_id, file_type, caption, content_id),
-        )
-        return cursor.rowcount > 0
+    return update_section_content(
+        "drop_learning", content_id, file_id, file_type, caption, file_unique_id
+    )
 
 
 def delete_drop_learning_content(content_id: int) -> bool:
     """Delete a drop learning content item."""
-    with sqlite3.connect(DB_PATH) as conn:
-        cursor = conn.execute(
-            "DELETE FROM drop_learning_content WHERE id = ?",
-            (content_id,),
-        )
-        return cursor.rowcount > 0
+    return delete_section_content("drop_learning", content_id)
 
 
-# Case Studies functions
-def list_case_studies() -> Iterable[Dict[str, str]]:
-    with sqlite3.connect(DB_PATH) as conn:
-        cursor = conn.execute(
-            """
-            SELECT id, title, description, cover_photo_file_id, created_at
-            FROM case_studies
-            ORDER BY created_at DESC, id DESC
-            """
-        )
-        for (
-            item_id,
-            title,
-            description,
-            cover_photo_file_id,
-            created_at,
-        ) in cursor.fetchall():
-            yield {
-                "id": item_id,
-                "title": title,
-                "description": description,
-                "cover_photo_file_id": cover_photo_file_id or "",
-                "created_at": created_at,
-            }
+def list_case_studies() -> Iterable[Dict[str, Any]]:
+    return list_section_items("case_study")
 
 
-def get_case_study(item_id: int) -> Optional[Dict[str, str]]:
-    with sqlite3.connect(DB_PATH) as conn:
-        cursor = conn.execute(
-            """
-            SELECT id, title, description, cover_photo_file_id, created_at
-            FROM case_studies
-            WHERE id = ?
-            """,
-            (item_id,),
-        )
-        row = cursor.fetchone()
-    if row is None:
-        return None
-    return {
-        "id": row[0],
-        "title": row[1],
-        "description": row[2],
-        "cover_photo_file_id": row[3] or "",
-        "created_at": row[4],
-    }
+def list_case_studies_page(
+    cursor: Optional[int] = None, *, limit: int, backward: bool = False
+) -> Dict[str, Any]:
+    return list_section_page("case_study", cursor, limit=limit, backward=backward)
+
+
+def get_case_study(item_id: int) -> Optional[Dict[str, Any]]:
+    return get_section_item("case_study", item_id)
 
 
 def create_case_study(
-    title: str,
-    description: str,
-    cover_photo_file_id: Optional[str] = None,
+    title: str, description: str, cover_photo_file_id: Optional[str] = None
 ) -> int:
-    with sqlite3.connect(DB_PATH) as conn:
-        cursor = conn.execute(
-            """
-            INSERT INTO case_studies (title, description, cover_photo_file_id)
-            VALUES (?, ?, ?)
-            """,
-            (title, description, cover_photo_file_id),
-        )
-        return cursor.lastrowid
+    return create_section_item("case_study", title, description, cover_photo_file_id)
+
+
+def update_case_study(item_id: int, **fields: Optional[str]) -> bool:
+    return update_section_item("case_study", item_id, **fields)
 
 
-def update_case_study(
+def delete_case_study(item_id: int) -> bool:
+    return delete_section_item("case_study", item_id)
+
+
+def add_case_study_content(
     item_id: int,
-    *,
-    title: Optional[str] = None,
-    description: Optional[str] = None,
-    cover_photo_file_id: Optional[str] = None,
-) -> bool:
-    fields = []
-    params = []
-    if title is not None:
-        fields.append("title = ?")
-        params.append(title)
-    if description is not None:
-        fields.append("description = ?")
-        params.append(description)
-    if cover_photo_file_id is not None:
-        fields.append("cover_photo_file_id = ?")
-        params.append(cover_photo_file_id)
-    if not fields:
-        return False
-    params.append(item_id)
+    file_id: str,
+    file_type: str,
+    content_order: int = 0,
+    file_unique_id: Optional[str] = None,
+) -> int:
+    return add_section_content(
+        "case_study", item_id, file_id, file_type, content_order,
+        file_unique_id=file_unique_id,
+    )
 
-    with sqlite3.connect(DB_PATH) as conn:
-        cursor = conn.execute(
+
+def get_case_study_content(item_id: int) -> Iterable[Dict[str, Any]]:
+    return get_section_content("case_study", item_id)
+
+
+def _ensure_content_item_stats(conn: sqlite3.Connection) -> None:
+    """Create the per-item engagement summary and backfill it once."""
+    exists = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'content_item_stats'"
+    ).fetchone()
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS content_item_stats (
+            item_type TEXT NOT NULL,
+            item_id INTEGER NOT NULL,
+            views INTEGER NOT NULL DEFAULT 0,
+            unique_viewers INTEGER NOT NULL DEFAULT 0,
+            phone_viewers INTEGER NOT NULL DEFAULT 0,
+            consultation_viewers INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (item_type, item_id)
+        )
+        """
+    )
+    conn.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_content_item_stats_views
+        ON content_item_stats (item_type, views DESC)
+        """
+    )
+    if exists:
+        return
+
+    for section, (table, column) in VIEW_TABLES.items():
+        conn.execute(
             f"""
-            UPDATE case_studies
-            SET {", ".join(fields)}
-            WHERE id = ?
+            INSERT INTO content_item_stats (
+                item_type, item_id, unique_viewers, phone_viewers, consultation_viewers
+            )
+            SELECT
+                ?,
+                {table}.{column},
+                COUNT(*),
+                SUM(COALESCE(TRIM(users.phone_number), '') <> ''),
+                SUM(EXISTS (
+                    SELECT 1 FROM consultation_requests
+                    WHERE consultation_requests.user_id = {table}.user_id
+                ))
+            FROM {table}
+            LEFT JOIN users ON users.telegram_id = {table}.user_id
+            GROUP BY {table}.{column}
             """,
-            tuple(params),
+            (section,),
         )
-        return cursor.rowcount > 0
+    # Before content_events existed only first views were kept.
+    conn.execute(
+        """
+        UPDATE content_item_stats SET views = MAX(unique_viewers, COALESCE((
+            SELECT SUM(events) FROM content_events_daily
+            WHERE content_events_daily.item_type = content_item_stats.item_type
+              AND content_events_daily.item_id = content_item_stats.item_id
+              AND content_events_daily.action = ?
+        ), 0) + (
+            SELECT COUNT(*) FROM content_events
+            WHERE content_events.item_type = content_item_stats.item_type
+              AND content_events.item_id = content_item_stats.item_id
+              AND content_events.action = ?
+              AND content_events.id > COALESCE(
+                  (SELECT last_id FROM rollup_watermarks WHERE name = ?), 0
+              )
+        ))
+        """,
+        (CONTENT_EVENT_VIEW, CONTENT_EVENT_VIEW, CONTENT_ROLLUP_WATERMARK),
+    )
 
 
-def delete_case_study(item_id: int) -> bool:
-    with sqlite3.connect(DB_PATH) as conn:
-        cursor = conn.execute(
-            "DELETE FROM case_studies WHERE id = ?",
-            (item_id,),
-        )
-        return cursor.rowcount > 0
+SKETCH_ALL_TIME = -1
 
 
-def record_webinar_view(user_id: int, webinar_id: int) -> None:
-    """Record that a user viewed a webinar."""
-    with sqlite3.connect(DB_PATH) as conn:
+def _section_scope(item_type: str) -> str:
+    return f"section:{item_type}"
+
+
+def _item_scope(item_type: str, item_id: int) -> str:
+    return f"item:{item_type}:{item_id}"
+
+
+def _update_viewer_sketches(conn: sqlite3.Connection, views: Iterable[tuple]) -> None:
+    """Add ``(user_id, item_type, item_id, created_at)`` views to the sketches.
+
+    Each view lands in the daily and all-time sketch of its section and in
+    the all-time sketch of its item; exact per-item viewers are kept in
+    ``content_item_stats`` already.
+    """
+    pending: Dict[tuple, set] = {}
+    for user_id, item_type, item_id, created_at in views:
+        section = _section_scope(item_type)
+        pending.setdefault((section, created_at // 86400), set()).add(user_id)
+        pending.setdefault((section, SKETCH_ALL_TIME), set()).add(user_id)
+        pending.setdefault((_item_scope(item_type, item_id), SKETCH_ALL_TIME), set()).add(user_id)
+
+    for (scope, day), user_ids in pending.items():
+        row = conn.execute(
+            "SELECT registers FROM viewer_sketches WHERE scope = ? AND day = ?",
+            (scope, day),
+        ).fetchone()
+        sketch = HyperLogLog.from_bytes(row[0]) if row else HyperLogLog()
+        sketch.update(user_ids)
+        registers = sketch.to_bytes()
+        # Repeat viewers rarely raise a register; skip the rewrite then
+        if row and registers == bytes(row[0]):
+            continue
         conn.execute(
             """
-            INSERT OR IGNORE INTO webinar_views (user_id, webinar_id)
-            VALUES (?, ?)
+            INSERT INTO viewer_sketches (scope, day, registers) VALUES (?, ?, ?)
+            ON CONFLICT(scope, day) DO UPDATE SET registers = excluded.registers
             """,
-            (user_id, webinar_id),
+            (scope, day, registers),
         )
 
 
-def record_drop_learning_view(user_id: int, drop_learning_id: int) -> None:
-    """Record that a user viewed a drop learning item."""
-    with sqlite3.connect(DB_PATH) as conn:
+def _ensure_viewer_sketches(conn: sqlite3.Connection) -> None:
+    """Create the sketch table and seed it from recorded views once."""
+    exists = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'viewer_sketches'"
+    ).fetchone()
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS viewer_sketches (
+            scope TEXT NOT NULL,
+            day INTEGER NOT NULL,
+            registers BLOB NOT NULL,
+            PRIMARY KEY (scope, day)
+        )
+        """
+    )
+    if exists:
+        return
+
+    sources = [
+        f"""
+        SELECT user_id, '{section}', {column},
+               COALESCE(CAST(strftime('%s', viewed_at) AS INTEGER), 0)
+        FROM {table}
+        """
+        for section, (table, column) in VIEW_TABLES.items()
+    ]
+    sources.append(
+        f"""
+        SELECT user_id, item_type, item_id, created_at FROM content_events
+        WHERE action = '{CONTENT_EVENT_VIEW}'
+        """
+    )
+    for query in sources:
+        cursor = conn.execute(query)
+        while True:
+            rows = cursor.fetchmany(50000)
+            if not rows:
+                break
+            _update_viewer_sketches(conn, rows)
+
+
+def _estimate_unique_viewers(
+    conn: sqlite3.Connection,
+    scopes: Iterable[str],
+    start_day: Optional[int] = None,
+    end_day: Optional[int] = None,
+) -> int:
+    scopes = tuple(scopes)
+    placeholders = ", ".join("?" * len(scopes))
+    if start_day is None and end_day is None:
+        where, params = "day = ?", (SKETCH_ALL_TIME,)
+    else:
+        where = "day BETWEEN ? AND ?"
+        params = (max(start_day or 0, 0), end_day if end_day is not None else 2**62)
+    cursor = conn.execute(
+        f"SELECT registers FROM viewer_sketches WHERE scope IN ({placeholders}) AND {where}",
+        scopes + params,
+    )
+    merged = merge_blobs(row[0] for row in cursor)
+    return merged.count() if merged else 0
+
+
+def estimate_unique_viewers(
+    item_type: Optional[str] = None,
+    item_id: Optional[int] = None,
+    start_day: Optional[int] = None,
+    end_day: Optional[int] = None,
+) -> int:
+    """Approximate distinct viewers from the HyperLogLog sketches.
+
+    Without ``item_type`` all sections are merged; ``item_id`` narrows to one
+    item. ``start_day``/``end_day`` are inclusive day numbers
+    (``unix_time // 86400``); without them the all-time sketches are used.
+    Items only have an all-time sketch.
+    """
+    if item_id is not None and (start_day is not None or end_day is not None):
+        raise ValueError("Per-item viewer sketches are all-time only")
+    if item_type is None:
+        scopes = [_section_scope(section) for section in VIEW_TABLES]
+    elif item_id is None:
+        scopes = [_section_scope(item_type)]
+    else:
+        scopes = [_item_scope(item_type, item_id)]
+    with _connect() as conn:
+        return _estimate_unique_viewers(conn, scopes, start_day, end_day)
+
+
+def _adjust_viewed_item_stats(
+    conn: sqlite3.Connection, user_id: int, column: str, delta: int
+) -> None:
+    """Apply ``delta`` to ``column`` for every item the user has viewed."""
+    for section, (table, item_column) in VIEW_TABLES.items():
         conn.execute(
-            """
-            INSERT OR IGNORE INTO drop_learning_views (user_id, drop_learning_id)
-            VALUES (?, ?)
+            f"""
+            UPDATE content_item_stats SET {column} = {column} + ?
+            WHERE item_type = ?
+              AND item_id IN (SELECT {item_column} FROM {table} WHERE user_id = ?)
             """,
-            (user_id, drop_learning_id),
+            (delta, section, user_id),
         )
 
 
-def record_case_study_view(user_id: int, case_study_id: int) -> None:
-    """Record that a user viewed a case study."""
-    with sqlite3.connect(DB_PATH) as conn:
-        conn.execute(
+def record_views_batch(
+    views: Iterable[tuple], events: Iterable[tuple] = ()
+) -> None:
+    """Record ``(section, user_id, item_id)`` first views and raw events together.
+
+    ``events`` are ``(user_id, item_type, item_id, action, created_at)`` rows
+    appended to ``content_events`` in the same transaction. The per-item
+    summary in ``content_item_stats`` and the unique-viewer sketches are
+    updated alongside.
+    """
+    events = list(events)
+    view_counts: Dict[tuple, int] = {}
+    for _, item_type, item_id, action, _ in events:
+        if action == CONTENT_EVENT_VIEW:
+            view_counts[(item_type, item_id)] = view_counts.get((item_type, item_id), 0) + 1
+    grouped: Dict[str, List[tuple]] = {}
+    for section, user_id, item_id in views:
+        grouped.setdefault(section, []).append((user_id, item_id))
+
+    with _connect() as conn:
+        if grouped:
+            # The batch is staged once so first views are found set-based
+            conn.execute(
+                """
+                CREATE TEMP TABLE IF NOT EXISTS batch_views (
+                    user_id INTEGER NOT NULL,
+                    item_id INTEGER NOT NULL,
+                    PRIMARY KEY (user_id, item_id)
+                ) WITHOUT ROWID
+                """
+            )
+        for section, rows in grouped.items():
+            table, column = VIEW_TABLES[section]
+            conn.execute("DELETE FROM temp.batch_views")
+            conn.executemany(
+                "INSERT OR IGNORE INTO temp.batch_views (user_id, item_id) VALUES (?, ?)",
+                rows,
+            )
+            conn.execute(
+                f"""
+                DELETE FROM temp.batch_views
+                WHERE EXISTS (
+                    SELECT 1 FROM {table} AS seen
+                    WHERE seen.user_id = batch_views.user_id
+                      AND seen.{column} = batch_views.item_id
+                )
+                """
+            )
+            conn.execute(
+                f"""
+                INSERT OR IGNORE INTO {table} (user_id, {column})
+                SELECT user_id, item_id FROM temp.batch_views
+                """
+            )
+            conn.execute(
+                """
+                INSERT INTO content_item_stats (
+                    item_type, item_id, unique_viewers, phone_viewers, consultation_viewers
+                )
+                SELECT
+                    ?, new.item_id, COUNT(*),
+                    SUM(EXISTS (
+                        SELECT 1 FROM users
+                        WHERE telegram_id = new.user_id AND TRIM(phone_number) <> ''
+                    )),
+                    SUM(EXISTS (
+                        SELECT 1 FROM consultation_requests WHERE user_id = new.user_id
+                    ))
+                FROM temp.batch_views AS new
+                GROUP BY new.item_id
+                ON CONFLICT(item_type, item_id) DO UPDATE SET
+                    unique_viewers = unique_viewers + excluded.unique_viewers,
+                    phone_viewers = phone_viewers + excluded.phone_viewers,
+                    consultation_viewers = consultation_viewers + excluded.consultation_viewers
+                """,
+                (section,),
+            )
+        conn.executemany(
             """
-            INSERT OR IGNORE INTO case_studies_views (user_id, case_study_id)
-            VALUES (?, ?)
+            INSERT INTO content_events (user_id, item_type, item_id, action, created_at)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            events,
+        )
+        _update_viewer_sketches(
+            conn,
+            (
+                (user_id, item_type, item_id, created_at)
+                for user_id, item_type, item_id, action, created_at in events
+                if action == CONTENT_EVENT_VIEW
+            ),
+        )
+        conn.executemany(
+            """
+            INSERT INTO content_item_stats (item_type, item_id, views)
+            VALUES (?, ?, ?)
+            ON CONFLICT(item_type, item_id) DO UPDATE SET views = views + excluded.views
             """,
-            (user_id, case_study_id),
+            [(item_type, item_id, count) for (item_type, item_id), count in view_counts.items()],
         )
 
 
-def add_case_study_content(item_id: int, file_id: str, file_type: str, content_order: int = 0) -> int:
-    with sqlite3.connect(DB_PATH) as conn:
+def list_content_item_stats(item_type: str, limit: int = 20) -> List[Dict[str, Any]]:
+    """Return the most viewed items of a section with their engagement funnel."""
+    table = CONTENT_ITEM_TABLES[item_type]
+    with _connect() as conn:
         cursor = conn.execute(
-            """
-            INSERT INTO case_studies_content (case_study_id, file_id, file_type, content_order)
-            VALUES (?, ?, ?, ?)
+            f"""
+            SELECT
+                stats.item_id,
+                {table}.title,
+                stats.views,
+                stats.unique_viewers,
+                stats.phone_viewers,
+                stats.consultation_viewers
+            FROM content_item_stats AS stats
+            JOIN {table} ON {table}.id = stats.item_id
+            WHERE stats.item_type = ?
+            ORDER BY stats.views DESC
+            LIMIT ?
             """,
-            (item_id, file_id, file_type, content_order),
+            (item_type, limit),
         )
-        return cursor.lastrowid
+        return [
+            {
+                "id": item_id,
+                "title": title or "",
+                "views": views,
+                "unique_viewers": unique_viewers,
+                "phone_viewers": phone_viewers,
+                "consultation_viewers": consultation_viewers,
+            }
+            for item_id, title, views, unique_viewers, phone_viewers, consultation_viewers in cursor.fetchall()
+        ]
+
+
+def _delete_content_item_stats(conn: sqlite3.Connection, item_type: str, item_id: int) -> None:
+    conn.execute(
+        "DELETE FROM content_item_stats WHERE item_type = ? AND item_id = ?",
+        (item_type, item_id),
+    )
+
+
+def record_webinar_view(user_id: int, webinar_id: int) -> None:
+    """Record that a user viewed a webinar."""
+    record_views_batch(
+        [("webinar", user_id, webinar_id)],
+        [(user_id, "webinar", webinar_id, CONTENT_EVENT_VIEW, int(time.time()))],
+    )
+
 
+def record_drop_learning_view(user_id: int, drop_learning_id: int) -> None:
+    """Record that a user viewed a drop learning item."""
+    record_views_batch(
+        [("drop_learning", user_id, drop_learning_id)],
+        [(user_id, "drop_learning", drop_learning_id, CONTENT_EVENT_VIEW, int(time.time()))],
+    )
 
-def get_case_study_content(item_id: int) -> Iterable[Dict[str, str]]:
-    with sqlite3.connect(DB_PATH) as conn:
-        cursor = conn.execute(
-            """
-            SELECT id, file_id, file_type, content_order
-            FROM case_studies_content
-            WHERE case_study_id = ?
-            ORDER BY content_order ASC, id ASC
-            """,
-            (item_id,),
-        )
-        for content_id, file_id, file_type, content_order in cursor.fetchall():
-            yield {
-                "id": content_id,
-                "file_id": file_id,
-                "file_type": file_type,
-                "content_order": content_order,
-            }
+
+def record_case_study_view(user_id: int, case_study_id: int) -> None:
+    """Record that a user viewed a case study."""
+    record_views_batch(
+        [("case_study", user_id, case_study_id)],
+        [(user_id, "case_study", case_study_id, CONTENT_EVENT_VIEW, int(time.time()))],
+    )
 
 
 # Consultation request functions
 def create_consultation_request(user_id: int, receipt_photo_file_id: str) -> int:
     """Create a new consultation request with receipt."""
-    with sqlite3.connect(DB_PATH) as conn:
+    with _connect() as conn:
+        first_request = conn.execute(
+            "SELECT 1 FROM consultation_requests WHERE user_id = ? LIMIT 1", (user_id,)
+        ).fetchone() is None
         cursor = conn.execute(
             """
             INSERT INTO consultation_requests (user_id, receipt_photo_file_id, status)
@@ -1105,12 +2072,14 @@ def create_consultation_request(user_id: int, receipt_photo_file_id: str) -> int
             """,
             (user_id, receipt_photo_file_id),
         )
+        if first_request:
+            _adjust_viewed_item_stats(conn, user_id, "consultation_viewers", 1)
         return cursor.lastrowid
 
 
 def get_consultation_request(request_id: int) -> Optional[Dict[str, str]]:
     """Get a consultation request by ID."""
-    with sqlite3.connect(DB_PATH) as conn:
+    with _connect() as conn:
         cursor = conn.execute(
             """
             SELECT id, user_id, receipt_photo_file_id, status, rejection_reason, created_at
@@ -1136,7 +2105,7 @@ def update_consultation_request_status(
     request_id: int, status: str, rejection_reason: Optional[str] = None
 ) -> bool:
     """Update consultation request status (approved/rejected)."""
-    with sqlite3.connect(DB_PATH) as conn:
+    with _connect() as conn:
         if rejection_reason:
             cursor = conn.execute(
                 """
@@ -1160,7 +2129,7 @@ def update_consultation_request_status(
 
 def list_pending_consultation_requests() -> Iterable[Dict[str, str]]:
     """List all pending consultation requests."""
-    with sqlite3.connect(DB_PATH) as conn:
+    with _connect() as conn:
         cursor = conn.execute(
             """
             SELECT id, user_id, receipt_photo_file_id, status, rejection_reason, created_at
@@ -1180,20 +2149,148 @@ def list_pending_consultation_requests() -> Iterable[Dict[str, str]]:
             }
 
 
+def record_admin_notifications(
+    request_id: int, results: Iterable[tuple], skipped: Iterable[int] = ()
+) -> None:
+    """Store per-admin delivery results as ``(admin_id, error_or_None)`` pairs.
+
+    Admins in ``skipped`` were not sent to because they are unreachable; they
+    get the final ``skipped`` status so the retry job stops selecting them.
+    """
+    rows = [
+        (request_id, admin_id, "failed" if error else "sent", error)
+        for admin_id, error in results
+    ]
+    rows.extend((request_id, admin_id, "skipped", "unreachable") for admin_id in skipped)
+    if not rows:
+        return
+    with _connect() as conn:
+        conn.executemany(
+            """
+            INSERT INTO admin_notifications (request_id, admin_id, status, attempts, last_error)
+            VALUES (?, ?, ?, 1, ?)
+            ON CONFLICT(request_id, admin_id) DO UPDATE SET
+                status = excluded.status,
+                attempts = admin_notifications.attempts + 1,
+                last_error = excluded.last_error,
+                updated_at = CURRENT_TIMESTAMP
+            """,
+            rows,
+        )
+
+
+def list_failed_admin_notifications(max_attempts: int) -> Iterable[Dict[str, Any]]:
+    """List failed admin notifications for consultation requests still pending."""
+    with _connect() as conn:
+        cursor = conn.execute(
+            """
+            SELECT
+                admin_notifications.request_id,
+                admin_notifications.admin_id,
+                admin_notifications.attempts
+            FROM admin_notifications
+            JOIN consultation_requests
+                ON consultation_requests.id = admin_notifications.request_id
+            WHERE admin_notifications.status = 'failed'
+              AND admin_notifications.attempts < ?
+              AND consultation_requests.status = 'pending'
+            ORDER BY admin_notifications.request_id
+            """,
+            (max_attempts,),
+        )
+        for request_id, admin_id, attempts in cursor.fetchall():
+            yield {
+                "request_id": request_id,
+                "admin_id": admin_id,
+                "attempts": attempts,
+            }
+
+
 # Bot settings functions
+SETTINGS_VERSION_KEY = "version"
+
+_settings_cache: Optional[Dict[str, str]] = None
+_settings_version: int = 0
+_settings_listeners: List[Callable[[Dict[str, str]], None]] = []
+
+
+def _read_settings(conn: sqlite3.Connection) -> tuple:
+    values: Dict[str, str] = {}
+    version = 0
+    for key, value in conn.execute("SELECT key, value FROM bot_settings"):
+        if key == SETTINGS_VERSION_KEY:
+            version = int(value or 0)
+        elif key not in (ADMINS_VERSION_KEY, PLANS_VERSION_KEY):
+            values[key] = value
+    return values, version
+
+
+def load_settings() -> Dict[str, str]:
+    """Load every bot setting into the in-process registry."""
+    global _settings_cache, _settings_version
+    with _connect() as conn:
+        _settings_cache, _settings_version = _read_settings(conn)
+    return dict(_settings_cache)
+
+
+def add_settings_listener(callback: Callable[[Dict[str, str]], None]) -> None:
+    """Register a callback invoked with the changed keys whenever settings change."""
+    _settings_listeners.append(callback)
+
+
+def _notify_settings_listeners(changed: Dict[str, str]) -> None:
+    for callback in list(_settings_listeners):
+        try:
+            callback(changed)
+        except Exception:
+            logging.exception("Settings listener %r failed", callback)
+
+
+def refresh_settings() -> bool:
+    """Reload settings if another process bumped the version row.
+
+    Only the version row is read unless it changed, so this is cheap enough
+    to run periodically from every worker.
+    """
+    global _settings_cache, _settings_version
+    with _connect() as conn:
+        version = _read_version(conn, SETTINGS_VERSION_KEY)
+        if _settings_cache is not None and version == _settings_version:
+            return False
+        values, version = _read_settings(conn)
+
+    previous = _settings_cache or {}
+    changed = {
+        key: value for key, value in values.items() if previous.get(key) != value
+    }
+    _settings_cache, _settings_version = values, version
+    if changed:
+        _notify_settings_listeners(changed)
+    return True
+
+
+def _settings() -> Dict[str, str]:
+    if _settings_cache is None:
+        load_settings()
+    return _settings_cache
+
+
 def get_bot_setting(key: str, default: str = "") -> str:
     """Get a bot setting value."""
-    with sqlite3.connect(DB_PATH) as conn:
-        result = conn.execute(
-            "SELECT value FROM bot_settings WHERE key = ?",
-            (key,)
-        ).fetchone()
-        return result[0] if result else default
+    return _settings().get(key, default)
+
+
+def get_settings(keys: Iterable[str]) -> Dict[str, str]:
+    """Get several bot settings at once; missing keys map to an empty string."""
+    settings = _settings()
+    return {key: settings.get(key, "") for key in keys}
 
 
 def set_bot_setting(key: str, value: str) -> None:
-    """Set a bot setting value."""
-    with sqlite3.connect(DB_PATH) as conn:
+    """Set a bot setting value and bump the shared settings version."""
+    global _settings_cache, _settings_version
+    previous = _settings()
+    with _connect() as conn:
         conn.execute(
             """
             INSERT INTO bot_settings (key, value)
@@ -1202,15 +2299,841 @@ def set_bot_setting(key: str, value: str) -> None:
             """,
             (key, value)
         )
+        version = _bump_version(conn, SETTINGS_VERSION_KEY)
+        # Another process changed settings since our last load: take them all
+        reloaded = _read_settings(conn) if version != _settings_version + 1 else None
+    if reloaded is None:
+        previous[key] = value
+        _settings_version = version
+        _notify_settings_listeners({key: value})
+        return
+    _settings_cache, _settings_version = reloaded
+    changed = {
+        name: current
+        for name, current in _settings_cache.items()
+        if previous.get(name) != current or name == key
+    }
+    _notify_settings_listeners(changed)
+
+
+CONSULTATION_SETTING_KEYS = (
+    "consultation_message",
+    "payment_amount",
+    "payment_card_number",
+    "approval_message",
+    "rejection_message_template",
+)
 
 
 def get_consultation_settings() -> Dict[str, str]:
     """Get all consultation-related settings."""
+    return get_settings(CONSULTATION_SETTING_KEYS)
+
+
+def rollup_content_events(batch_size: int = 10000) -> int:
+    """Fold new ``content_events`` rows into the hourly and daily rollups.
+
+    Progress is tracked by the last rolled-up event id, so every event is
+    counted exactly once even if the job runs concurrently or is interrupted.
+    Returns the number of events processed.
+    """
+    processed = 0
+    while True:
+        with _connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                "SELECT last_id FROM rollup_watermarks WHERE name = ?",
+                (CONTENT_ROLLUP_WATERMARK,),
+            ).fetchone()
+            start = row[0] if row else 0
+            end, count = conn.execute(
+                """
+                SELECT MAX(id), COUNT(*) FROM (
+                    SELECT id FROM content_events WHERE id > ? ORDER BY id LIMIT ?
+                )
+                """,
+                (start, batch_size),
+            ).fetchone()
+            if end is None:
+                return processed
+            for width, table in CONTENT_ROLLUP_TABLES.items():
+                conn.execute(
+                    f"""
+                    INSERT INTO {table} (bucket, item_type, item_id, action, events)
+                    SELECT created_at / {width} * {width}, item_type, item_id, action, COUNT(*)
+                    FROM content_events
+                    WHERE id > ? AND id <= ?
+                    GROUP BY 1, item_type, item_id, action
+                    ON CONFLICT(bucket, item_type, item_id, action)
+                    DO UPDATE SET events = events + excluded.events
+                    """,
+                    (start, end),
+                )
+            conn.execute(
+                """
+                INSERT INTO rollup_watermarks (name, last_id) VALUES (?, ?)
+                ON CONFLICT(name) DO UPDATE SET last_id = excluded.last_id
+                """,
+                (CONTENT_ROLLUP_WATERMARK, end),
+            )
+            processed += count
+
+
+def prune_content_events(retention_days: int, now: Optional[int] = None) -> int:
+    """Delete raw events older than the retention window that were rolled up."""
+    now = int(time.time()) if now is None else now
+    with _connect() as conn:
+        cursor = conn.execute(
+            """
+            DELETE FROM content_events
+            WHERE created_at < ?
+              AND id <= COALESCE(
+                  (SELECT last_id FROM rollup_watermarks WHERE name = ?), 0
+              )
+            """,
+            (now - retention_days * 86400, CONTENT_ROLLUP_WATERMARK),
+        )
+        return cursor.rowcount
+
+
+def prune_viewer_sketches(retention_days: int, now: Optional[int] = None) -> int:
+    """Delete daily viewer sketches older than the retention window.
+
+    Also drops per-item daily sketches, which are no longer written.
+    """
+    now = int(time.time()) if now is None else now
+    with _connect() as conn:
+        cursor = conn.execute(
+            """
+            DELETE FROM viewer_sketches
+            WHERE day <> ? AND (day < ? OR scope LIKE 'item:%')
+            """,
+            (SKETCH_ALL_TIME, (now - retention_days * 86400) // 86400),
+        )
+        return cursor.rowcount
+
+
+def get_content_event_stats(
+    action: str = CONTENT_EVENT_VIEW, now: Optional[int] = None
+) -> Dict[str, Dict[str, int]]:
+    """Per-section event counts for the last 24 hours, 7 days and all time.
+
+    Served from the rollup tables only; events not yet rolled up are not
+    included.
+    """
+    now = int(time.time()) if now is None else now
+    stats = {section: {"day": 0, "week": 0, "total": 0} for section in VIEW_TABLES}
+    with _connect() as conn:
+        for item_type, events in conn.execute(
+            """
+            SELECT item_type, SUM(events) FROM content_events_hourly
+            WHERE action = ? AND bucket >= ?
+            GROUP BY item_type
+            """,
+            (action, now - 86400),
+        ):
+            stats.setdefault(item_type, {"day": 0, "week": 0, "total": 0})["day"] = events
+        for item_type, week, total in conn.execute(
+            """
+            SELECT
+                item_type,
+                SUM(CASE WHEN bucket >= ? THEN events ELSE 0 END),
+                SUM(events)
+            FROM content_events_daily
+            WHERE action = ?
+            GROUP BY item_type
+            """,
+            (now - 7 * 86400, action),
+        ):
+            entry = stats.setdefault(item_type, {"day": 0, "week": 0, "total": 0})
+            entry["week"], entry["total"] = week, total
+    return stats
+
+
+SCHEDULE_ACTIVE = "scheduled"
+SCHEDULE_DONE = "done"
+SCHEDULE_CANCELLED = "cancelled"
+
+_SCHEDULED_BROADCAST_COLUMNS = """
+    id, label, segment, from_chat_id, message_ids, run_at,
+    interval_seconds, spread_seconds, status, created_by, last_run_at
+"""
+
+
+def _scheduled_broadcast_from_row(row: tuple) -> Dict[str, Any]:
+    (
+        broadcast_id,
+        label,
+        segment,
+        from_chat_id,
+        message_ids,
+        run_at,
+        interval_seconds,
+        spread_seconds,
+        status,
+        created_by,
+        last_run_at,
+    ) = row
+    return {
+        "id": broadcast_id,
+        "label": label,
+        "segment": tuple(tuple(condition) for condition in json.loads(segment)),
+        "from_chat_id": from_chat_id,
+        "message_ids": json.loads(message_ids),
+        "run_at": run_at,
+        "interval_seconds": interval_seconds,
+        "spread_seconds": spread_seconds,
+        "status": status,
+        "created_by": created_by,
+        "last_run_at": last_run_at,
+    }
+
+
+def create_scheduled_broadcast(
+    *,
+    label: str,
+    segment: Iterable[tuple],
+    from_chat_id: int,
+    message_ids: Iterable[int],
+    run_at: int,
+    interval_seconds: Optional[int] = None,
+    spread_seconds: int = 0,
+    created_by: Optional[int] = None,
+) -> int:
+    with _connect() as conn:
+        cursor = conn.execute(
+            """
+            INSERT INTO scheduled_broadcasts (
+                label, segment, from_chat_id, message_ids, run_at,
+                interval_seconds, spread_seconds, created_by
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                label,
+                json.dumps([list(condition) for condition in segment]),
+                from_chat_id,
+                json.dumps(list(message_ids)),
+                run_at,
+                interval_seconds,
+                spread_seconds,
+                created_by,
+            ),
+        )
+        return cursor.lastrowid
+
+
+def get_scheduled_broadcast(broadcast_id: int) -> Optional[Dict[str, Any]]:
+    with _connect() as conn:
+        row = conn.execute(
+            f"SELECT {_SCHEDULED_BROADCAST_COLUMNS} FROM scheduled_broadcasts WHERE id = ?",
+            (broadcast_id,),
+        ).fetchone()
+    return _scheduled_broadcast_from_row(row) if row else None
+
+
+def list_active_scheduled_broadcasts() -> List[Dict[str, Any]]:
+    with _connect() as conn:
+        rows = conn.execute(
+            f"""
+            SELECT {_SCHEDULED_BROADCAST_COLUMNS} FROM scheduled_broadcasts
+            WHERE status = ?
+            ORDER BY id
+            """,
+            (SCHEDULE_ACTIVE,),
+        ).fetchall()
+    return [_scheduled_broadcast_from_row(row) for row in rows]
+
+
+def list_scheduled_broadcasts_page(
+    cursor: Optional[int] = None, *, limit: int, backward: bool = False
+) -> Dict[str, Any]:
+    """Page through active scheduled broadcasts by id (keyset pagination)."""
+    where = "status = ?"
+    params: List[Any] = [SCHEDULE_ACTIVE]
+    if cursor is not None:
+        where += " AND id < ?" if backward else " AND id > ?"
+        params.append(cursor)
+    order = "DESC" if backward else "ASC"
+    with _connect() as conn:
+        rows = conn.execute(
+            f"""
+            SELECT {_SCHEDULED_BROADCAST_COLUMNS} FROM scheduled_broadcasts
+            WHERE {where}
+            ORDER BY id {order}
+            LIMIT ?
+            """,
+            (*params, limit + 1),
+        ).fetchall()
+    items = [_scheduled_broadcast_from_row(row) for row in rows]
+    return _build_page(items, limit, cursor, backward)
+
+
+def mark_scheduled_broadcast_run(
+    broadcast_id: int,
+    last_run_at: int,
+    next_run_at: Optional[int],
+    claimed_run_at: Optional[int] = None,
+) -> bool:
+    """Record a run; move recurring broadcasts to ``next_run_at``, finish the rest.
+
+    With ``claimed_run_at`` the update only applies while the broadcast is
+    still due at that time, so of two processes firing the same run only
+    one gets True.
+    """
+    claim = "" if claimed_run_at is None else " AND run_at = ?"
+    claim_args = () if claimed_run_at is None else (claimed_run_at,)
+    with _connect() as conn:
+        if next_run_at is None:
+            cursor = conn.execute(
+                f"""
+                UPDATE scheduled_broadcasts
+                SET status = ?, last_run_at = ?
+                WHERE id = ? AND status = ?{claim}
+                """,
+                (SCHEDULE_DONE, last_run_at, broadcast_id, SCHEDULE_ACTIVE, *claim_args),
+            )
+        else:
+            cursor = conn.execute(
+                f"""
+                UPDATE scheduled_broadcasts
+                SET run_at = ?, last_run_at = ?
+                WHERE id = ? AND status = ?{claim}
+                """,
+                (next_run_at, last_run_at, broadcast_id, SCHEDULE_ACTIVE, *claim_args),
+            )
+        return cursor.rowcount > 0
+
+
+def cancel_scheduled_broadcast(broadcast_id: int) -> bool:
+    with _connect() as conn:
+        cursor = conn.execute(
+            "UPDATE scheduled_broadcasts SET status = ? WHERE id = ? AND status = ?",
+            (SCHEDULE_CANCELLED, broadcast_id, SCHEDULE_ACTIVE),
+        )
+        return cursor.rowcount > 0
+
+
+
+MEDIA_OK = "ok"
+MEDIA_BROKEN = "broken"
+# Key for files that failed before Telegram told us their file_unique_id
+LEGACY_MEDIA_PREFIX = "legacy:"
+
+
+def _ensure_media_assets(conn: sqlite3.Connection) -> None:
+    """Create the file registry and link content rows to it by file_unique_id."""
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS media_assets (
+            file_unique_id TEXT PRIMARY KEY,
+            file_id TEXT NOT NULL,
+            file_type TEXT NOT NULL,
+            file_size INTEGER,
+            status TEXT NOT NULL DEFAULT 'ok',
+            last_error TEXT,
+            last_checked_at INTEGER NOT NULL DEFAULT 0,
+            created_at INTEGER NOT NULL DEFAULT 0
+        )
+        """
+    )
+    conn.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_media_assets_checked
+        ON media_assets (last_checked_at)
+        """
+    )
+    for table, _ in CONTENT_TABLES.values():
+        columns = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+        if "file_unique_id" not in columns:
+            conn.execute(f"ALTER TABLE {table} ADD COLUMN file_unique_id TEXT")
+        conn.execute(
+            f"""
+            CREATE INDEX IF NOT EXISTS idx_{table}_file_unique_id
+            ON {table} (file_unique_id)
+            """
+        )
+        # Rows saved before the registry are backfilled by the validator
+        conn.execute(
+            f"""
+            CREATE INDEX IF NOT EXISTS idx_{table}_unregistered
+            ON {table} (file_id) WHERE file_unique_id IS NULL
+            """
+        )
+
+
+def _register_media_asset(
+    conn: sqlite3.Connection,
+    file_unique_id: Optional[str],
+    file_id: str,
+    file_type: str,
+    file_size: Optional[int] = None,
+) -> None:
+    """Upsert an asset; a fresh upload of the same file heals a broken entry."""
+    if not file_unique_id:
+        return
+    now = int(time.time())
+    conn.execute(
+        """
+        INSERT INTO media_assets (
+            file_unique_id, file_id, file_type, file_size, status, last_checked_at, created_at
+        )
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(file_unique_id) DO UPDATE SET
+            file_id = excluded.file_id,
+            file_type = excluded.file_type,
+            file_size = COALESCE(excluded.file_size, media_assets.file_size),
+            status = excluded.status,
+            last_error = NULL,
+            last_checked_at = excluded.last_checked_at
+        """,
+        (file_unique_id, file_id, file_type, file_size, MEDIA_OK, now, now),
+    )
+    _invalidate_asset_plans(conn, file_unique_id)
+
+
+def list_unregistered_media(limit: int) -> List[Dict[str, str]]:
+    """Distinct legacy files that have no registry entry yet."""
+    selects = " UNION ".join(
+        f"SELECT file_id, file_type FROM {table} WHERE file_unique_id IS NULL"
+        for table, _ in CONTENT_TABLES.values()
+    )
+    with _connect() as conn:
+        rows = conn.execute(f"{selects} LIMIT ?", (limit,)).fetchall()
+    return [{"file_id": file_id, "file_type": file_type} for file_id, file_type in rows]
+
+
+def link_media_asset(
+    file_id: str,
+    file_unique_id: str,
+    file_type: str,
+    file_size: Optional[int] = None,
+    *,
+    previous_key: Optional[str] = None,
+) -> int:
+    """Register a probed file and point matching content rows at it.
+
+    Rows are matched by ``file_id`` when they have no registry key yet, or by
+    ``previous_key`` when a legacy placeholder is being replaced.
+    """
+    linked = 0
+    with _connect() as conn:
+        _register_media_asset(conn, file_unique_id, file_id, file_type, file_size)
+        for table, _ in CONTENT_TABLES.values():
+            cursor = conn.execute(
+                f"""
+                UPDATE {table} SET file_unique_id = ?
+                WHERE (file_unique_id IS NULL AND file_id = ?)
+                   OR (? IS NOT NULL AND file_unique_id = ?)
+                """,
+                (file_unique_id, file_id, previous_key, previous_key),
+            )
+            linked += cursor.rowcount
+        if previous_key and previous_key != file_unique_id:
+            conn.execute(
+                "DELETE FROM media_assets WHERE file_unique_id = ?", (previous_key,)
+            )
+    return linked
+
+
+def register_broken_legacy_media(file_id: str, file_type: str, error: str) -> str:
+    """Park an unprobeable legacy file under a placeholder key so it is not retried every tick."""
+    key = f"{LEGACY_MEDIA_PREFIX}{file_id}"
+    now = int(time.time())
+    with _connect() as conn:
+        conn.execute(
+            """
+            INSERT OR IGNORE INTO media_assets (
+                file_unique_id, file_id, file_type, status, last_error, last_checked_at, created_at
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            (key, file_id, file_type, MEDIA_BROKEN, error, now, now),
+        )
+        for table, _ in CONTENT_TABLES.values():
+            conn.execute(
+                f"UPDATE {table} SET file_unique_id = ? WHERE file_unique_id IS NULL AND file_id = ?",
+                (key, file_id),
+            )
+    return key
+
+
+def list_media_assets_due(checked_before: int, limit: int) -> List[Dict[str, Any]]:
+    """Assets whose last probe is older than ``checked_before``, stalest first."""
+    with _connect() as conn:
+        rows = conn.execute(
+            """
+            SELECT file_unique_id, file_id, file_type, status
+            FROM media_assets
+            WHERE last_checked_at < ?
+            ORDER BY last_checked_at ASC
+            LIMIT ?
+            """,
+            (checked_before, limit),
+        ).fetchall()
+    return [
+        {"file_unique_id": key, "file_id": file_id, "file_type": file_type, "status": status}
+        for key, file_id, file_type, status in rows
+    ]
+
+
+def mark_media_asset_checked(file_unique_id: str, error: Optional[str] = None) -> bool:
+    """Store a probe result; return True when a healthy asset just became broken."""
+    status = MEDIA_BROKEN if error else MEDIA_OK
+    with _connect() as conn:
+        row = conn.execute(
+            "SELECT status FROM media_assets WHERE file_unique_id = ?",
+            (file_unique_id,),
+        ).fetchone()
+        if row is None:
+            return False
+        conn.execute(
+            """
+            UPDATE media_assets
+            SET status = ?, last_error = ?, last_checked_at = ?
+            WHERE file_unique_id = ?
+            """,
+            (status, error, int(time.time()), file_unique_id),
+        )
+    return row[0] == MEDIA_OK and status == MEDIA_BROKEN
+
+
+def list_media_references(file_unique_id: str) -> List[Dict[str, Any]]:
+    """Content items that use an asset, for broken-file alerts."""
+    references: List[Dict[str, Any]] = []
+    with _connect() as conn:
+        for section, (table, column) in CONTENT_TABLES.items():
+            item_table = CONTENT_ITEM_TABLES[section]
+            rows = conn.execute(
+                f"""
+                SELECT DISTINCT {item_table}.id, {item_table}.title
+                FROM {table}
+                JOIN {item_table} ON {item_table}.id = {table}.{column}
+                WHERE {table}.file_unique_id = ?
+                """,
+                (file_unique_id,),
+            ).fetchall()
+            references.extend(
+                {"item_type": section, "item_id": item_id, "title": title}
+                for item_id, title in rows
+            )
+    return references
+
+
+def count_media_assets() -> Dict[str, int]:
+    with _connect() as conn:
+        rows = conn.execute(
+            "SELECT status, COUNT(*) FROM media_assets GROUP BY status"
+        ).fetchall()
+    counts = {MEDIA_OK: 0, MEDIA_BROKEN: 0}
+    counts.update(dict(rows))
+    return counts
+
+
+# Delivery plans: pre-resolved send calls per catalogue item, see bot/plans.py
+PLANS_VERSION_KEY = "plans_version"
+_plan_cache: Dict[tuple, Dict[str, Any]] = {}
+_plans_version: int = 0
+
+
+def _invalidate_delivery_plan(conn: sqlite3.Connection, item_type: str, item_id: int) -> None:
+    conn.execute(
+        "DELETE FROM delivery_plans WHERE item_type = ? AND item_id = ?",
+        (item_type, item_id),
+    )
+    _bump_version(conn, PLANS_VERSION_KEY)
+    _plan_cache.pop((item_type, item_id), None)
+
+
+def _invalidate_content_owner_plan(
+    conn: sqlite3.Connection, item_type: str, content_id: int
+) -> None:
+    table, column = CONTENT_TABLES[item_type]
+    row = conn.execute(
+        f"SELECT {column} FROM {table} WHERE id = ?", (content_id,)
+    ).fetchone()
+    if row:
+        _invalidate_delivery_plan(conn, item_type, row[0])
+
+
+def _invalidate_asset_plans(conn: sqlite3.Connection, file_unique_id: str) -> None:
+    for section, (table, column) in CONTENT_TABLES.items():
+        rows = conn.execute(
+            f"SELECT DISTINCT {column} FROM {table} WHERE file_unique_id = ?",
+            (file_unique_id,),
+        ).fetchall()
+        for (item_id,) in rows:
+            _invalidate_delivery_plan(conn, section, item_id)
+
+
+def get_delivery_plan(item_type: str, item_id: int) -> Optional[Dict[str, Any]]:
+    """Return the stored plan for an item from memory, falling back to SQLite."""
+    key = (item_type, item_id)
+    plan = _plan_cache.get(key)
+    if plan is not None:
+        return plan
+    with _connect() as conn:
+        row = conn.execute(
+            "SELECT plan FROM delivery_plans WHERE item_type = ? AND item_id = ?",
+            key,
+        ).fetchone()
+    if row is None:
+        return None
+    plan = json.loads(row[0])
+    _plan_cache[key] = plan
+    return plan
+
+
+def read_plans_version() -> int:
+    with _connect() as conn:
+        return _read_version(conn, PLANS_VERSION_KEY)
+
+
+def save_delivery_plan(
+    item_type: str, item_id: int, plan: Dict[str, Any], built_version: int
+) -> bool:
+    """Persist a plan unless catalogue content changed since ``built_version``."""
+    with _connect() as conn:
+        cursor = conn.execute(
+            """
+            INSERT INTO delivery_plans (item_type, item_id, plan, built_at)
+            SELECT ?, ?, ?, ?
+            WHERE COALESCE(
+                (SELECT CAST(value AS INTEGER) FROM bot_settings WHERE key = ?), 0
+            ) = ?
+            ON CONFLICT(item_type, item_id) DO UPDATE SET
+                plan = excluded.plan,
+                built_at = excluded.built_at
+            """,
+            (
+                item_type,
+                item_id,
+                json.dumps(plan, ensure_ascii=False),
+                int(time.time()),
+                PLANS_VERSION_KEY,
+                built_version,
+            ),
+        )
+        saved = cursor.rowcount > 0
+    if saved:
+        _plan_cache[(item_type, item_id)] = plan
+    return saved
+
+
+def refresh_delivery_plans() -> bool:
+    """Drop cached plans if another process bumped ``plans_version``."""
+    global _plans_version
+    with _connect() as conn:
+        version = _read_version(conn, PLANS_VERSION_KEY)
+    if version == _plans_version:
+        return False
+    _plan_cache.clear()
+    _plans_version = version
+    return True
+
+
+def acquire_lease(name: str, owner: str, ttl: float, now: Optional[float] = None) -> bool:
+    """Take or renew lease ``name`` for ``ttl`` seconds.
+
+    Succeeds when ``owner`` already holds the lease or the current holder
+    let it expire; the check and the write are one statement, so two
+    processes can never both win.
+    """
+    now = time.time() if now is None else now
+    with _connect() as conn:
+        cursor = conn.execute(
+            """
+            INSERT INTO leases (name, owner, expires_at, heartbeat)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT(name) DO UPDATE SET
+                owner = excluded.owner,
+                expires_at = excluded.expires_at,
+                heartbeat = excluded.heartbeat
+            WHERE leases.owner = excluded.owner
+               OR leases.expires_at <= excluded.heartbeat
+            """,
+            (name, owner, now + ttl, now),
+        )
+        return cursor.rowcount > 0
+
+
+def release_lease(name: str, owner: str) -> bool:
+    """Give up lease ``name`` if ``owner`` still holds it."""
+    with _connect() as conn:
+        cursor = conn.execute(
+            "DELETE FROM leases WHERE name = ? AND owner = ?", (name, owner)
+        )
+        return cursor.rowcount > 0
+
+
+def get_lease(name: str) -> Optional[Dict[str, Any]]:
+    with _connect() as conn:
+        row = conn.execute(
+            "SELECT owner, expires_at, heartbeat FROM leases WHERE name = ?", (name,)
+        ).fetchone()
+    if not row:
+        return None
+    return {"name": name, "owner": row[0], "expires_at": row[1], "heartbeat": row[2]}
+
+
+AUTO_VACUUM_INCREMENTAL = 2
+CHECKPOINT_MODES = ("PASSIVE", "FULL", "RESTART", "TRUNCATE")
+
+
+def ping_database() -> None:
+    """Cheapest statement that still reads the database file."""
+    with _connect() as conn:
+        conn.execute("SELECT 1 FROM bot_settings LIMIT 1").fetchone()
+
+
+def get_database_size_metrics() -> Dict[str, int]:
+    """File sizes and page counts of the database and its WAL."""
+    path = Path(DB_PATH)
+    wal_path = path.with_name(path.name + "-wal")
+    with _connect() as conn:
+        page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+        page_count = conn.execute("PRAGMA page_count").fetchone()[0]
+        freelist = conn.execute("PRAGMA freelist_count").fetchone()[0]
+        auto_vacuum = conn.execute("PRAGMA auto_vacuum").fetchone()[0]
     return {
-        "consultation_message": get_bot_setting("consultation_message"),
-        "payment_amount": get_bot_setting("payment_amount"),
-        "payment_card_number": get_bot_setting("payment_card_number"),
-        "approval_message": get_bot_setting("approval_message"),
-        "rejection_message_template": get_bot_setting("rejection_message_template"),
+        "db_bytes": path.stat().st_size if path.exists() else 0,
+        "wal_bytes": wal_path.stat().st_size if wal_path.exists() else 0,
+        "page_size": page_size,
+        "page_count": page_count,
+        "freelist_pages": freelist,
+        "auto_vacuum": auto_vacuum,
     }
 
+
+def checkpoint_wal(mode: str = "PASSIVE") -> Dict[str, int]:
+    """Run a WAL checkpoint; ``busy`` is 1 when readers kept it from finishing."""
+    mode = mode.upper()
+    if mode not in CHECKPOINT_MODES:
+        raise ValueError(f"Unknown checkpoint mode: {mode}")
+    with _connect() as conn:
+        busy, wal_pages, checkpointed = conn.execute(
+            f"PRAGMA wal_checkpoint({mode})"
+        ).fetchone()
+    return {"busy": busy, "wal_pages": wal_pages, "checkpointed_pages": checkpointed}
+
+
+def optimize_database(analyze: bool = False, analysis_limit: int = 1000) -> Dict[str, int]:
+    """Refresh planner statistics.
+
+    ``PRAGMA optimize`` only re-analyzes tables whose statistics look stale;
+    ``analyze`` runs a full ``ANALYZE`` bounded by ``analysis_limit`` rows
+    per index.
+    """
+    with _connect() as conn:
+        conn.execute(f"PRAGMA analysis_limit = {int(analysis_limit)}")
+        if analyze:
+            conn.execute("ANALYZE")
+        conn.execute("PRAGMA optimize")
+        has_stats = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'"
+        ).fetchone()
+        analyzed = 0
+        if has_stats:
+            analyzed = conn.execute(
+                "SELECT COUNT(DISTINCT tbl) FROM sqlite_stat1"
+            ).fetchone()[0]
+    return {"analyzed_tables": analyzed}
+
+
+def enable_incremental_vacuum() -> bool:
+    """Switch an older file to incremental auto-vacuum; True if it was converted.
+
+    The conversion rewrites the whole file with ``VACUUM`` and blocks writers
+    while it runs, so it is only called inside the maintenance window.
+    """
+    with _connect(isolation_level=None) as conn:
+        if conn.execute("PRAGMA auto_vacuum").fetchone()[0] == AUTO_VACUUM_INCREMENTAL:
+            return False
+        conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        conn.execute("VACUUM")
+    return True
+
+
+def incremental_vacuum(pages: int) -> int:
+    """Return up to ``pages`` free pages to the filesystem; returns pages freed."""
+    with _connect(isolation_level=None) as conn:
+        before = conn.execute("PRAGMA freelist_count").fetchone()[0]
+        if before:
+            # execute() stops after the first page; a script runs the pragma to completion
+            conn.executescript(f"PRAGMA incremental_vacuum({int(pages)});")
+        after = conn.execute("PRAGMA freelist_count").fetchone()[0]
+    return before - after
+
+
+def record_maintenance_run(task: str, duration_ms: float, result: Dict[str, Any]) -> None:
+    with _connect() as conn:
+        conn.execute(
+            """
+            INSERT INTO maintenance_runs (task, ran_at, duration_ms, result)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT(task) DO UPDATE SET
+                ran_at = excluded.ran_at,
+                duration_ms = excluded.duration_ms,
+                result = excluded.result
+            """,
+            (task, int(time.time()), duration_ms, json.dumps(result)),
+        )
+
+
+def list_maintenance_runs() -> List[Dict[str, Any]]:
+    """Latest run of every maintenance task, most recent first."""
+    with _connect() as conn:
+        rows = conn.execute(
+            """
+            SELECT task, ran_at, duration_ms, result
+            FROM maintenance_runs
+            ORDER BY ran_at DESC
+            """
+        ).fetchall()
+    return [
+        {"task": task, "ran_at": ran_at, "duration_ms": duration_ms, "result": json.loads(result)}
+        for task, ran_at, duration_ms, result in rows
+    ]
+
+
+class _BackupRestarting(Exception):
+    pass
+
+
+def backup_database(
+    target: Path, pages: int, pause: float, max_restarts: int = 3
+) -> Dict[str, int]:
+    """Copy the live database into ``target`` with the online backup API.
+
+    Pages are copied ``pages`` at a time with ``pause`` seconds between
+    steps, so writers only wait for one short step. A write from another
+    connection restarts the copy; after ``max_restarts`` restarts the
+    remainder is taken in a single step (a WAL read snapshot, which does not
+    block writers either).
+    """
+    state = {"steps": 0, "restarts": 0, "remaining": -1, "total": 0}
+
+    def progress(status: int, remaining: int, total: int) -> None:
+        state["steps"] += 1
+        if 0 <= state["remaining"] < remaining:
+            state["restarts"] += 1
+            if state["restarts"] > max_restarts:
+                raise _BackupRestarting()
+        state["remaining"] = remaining
+        state["total"] = total
+        time.sleep(pause)
+
+    with _connect() as source:
+        target_conn = sqlite3.connect(target)
+        try:
+            try:
+                source.backup(target_conn, pages=pages, progress=progress)
+            except _BackupRestarting:
+                logging.info("Backup kept restarting under writes; copying in one step")
+                source.backup(target_conn, pages=-1)
+                state["steps"] += 1
+            page_count = target_conn.execute("PRAGMA page_count").fetchone()[0]
+        finally:
+            target_conn.close()
+    return {"pages": page_count, "steps": state["steps"], "restarts": state["restarts"]}
+